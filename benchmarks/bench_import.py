@@ -0,0 +1,78 @@
+"""
+Import-time benchmark for EDA Suite.
+
+Measures the cost of importing the package in a fresh interpreter and fails
+if lightweight entry points pull in heavy optional dependencies.
+
+Usage:
+    python benchmarks/bench_import.py
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+FORBIDDEN_MODULES = ["matplotlib", "seaborn", "sklearn", "statsmodels"]
+
+SCENARIOS = {
+    "import eda_suite": "import eda_suite",
+    "shapiro_test": "from eda_suite.statistical_tests import shapiro_test",
+}
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+loaded = sorted({{m.split('.')[0] for m in sys.modules}})
+print(json.dumps({{"seconds": elapsed, "modules": loaded}}))
+"""
+
+
+def measure(statement: str) -> Dict:
+    """
+    Run an import statement in a fresh interpreter.
+
+    Args:
+        statement: Python import statement to time
+
+    Returns:
+        Dictionary with elapsed seconds and top-level modules loaded
+    """
+    completed = subprocess.run(
+        [sys.executable, "-c", PROBE.format(statement=statement)],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return json.loads(completed.stdout)
+
+
+def main() -> int:
+    """
+    Run all import scenarios and report forbidden dependencies.
+
+    Returns:
+        Process exit code (non-zero on failure)
+    """
+    failed = False
+
+    for name, statement in SCENARIOS.items():
+        result = measure(statement)
+        leaked = [m for m in FORBIDDEN_MODULES if m in result["modules"]]
+        status = "FAIL" if leaked else "ok"
+        failed = failed or bool(leaked)
+
+        print(f"{status:4} {name:20} {result['seconds'] * 1000:8.1f} ms"
+              + (f"  pulled in: {', '.join(leaked)}" if leaked else ""))
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,698 @@
+"""
+Benchmark cases for EDA Suite.
+
+Every public function is registered here together with the kind of
+synthetic input it needs. ``run.py`` builds that input at each requested
+scale and times the call in a fresh process.
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional
+import numpy as np
+import pandas as pd
+
+from eda_suite import (
+    bivariate,
+    discriminant,
+    factorial,
+    hypothesis_testing,
+    imputation,
+    missing_data,
+    multivariate,
+    statistical_tests,
+    timeseries,
+    univariate,
+    utils,
+    visualization
+)
+
+
+@dataclass
+class Case:
+    """One benchmarked call."""
+
+    name: str
+    call: Callable[[Dict], object]
+    kind: str
+    max_rows: Optional[int] = None
+    max_cols: Optional[int] = None
+    uses_missing: bool = False
+
+
+CASES: Dict[str, Case] = {}
+
+COLUMN_KINDS = {"frame", "matrix", "labeled", "categories"}
+
+
+def case(kind: str, **limits) -> Callable:
+    """
+    Register a benchmark case.
+
+    Args:
+        kind: Input kind (see ``make_inputs``)
+        **limits: max_rows, max_cols or uses_missing
+
+    Returns:
+        Decorator adding the function to ``CASES``
+    """
+    def register(func: Callable) -> Callable:
+        CASES[func.__name__] = Case(func.__name__, func, kind, **limits)
+        return func
+
+    return register
+
+
+def make_inputs(
+    kind: str,
+    shape: tuple,
+    missing: float,
+    seed: int = 0
+) -> Dict:
+    """
+    Build synthetic inputs of one kind.
+
+    Args:
+        kind: vector, pair, groups, frame, matrix, labeled, series,
+            categorical, categories, table or legacy
+        shape: (rows, columns)
+        missing: Fraction of entries set to NaN (frame and categories
+            kinds only)
+        seed: Random seed
+
+    Returns:
+        Dictionary of named inputs
+    """
+    rows, cols = shape
+    rng = np.random.default_rng(seed)
+    x = rng.normal(10, 2, rows)
+
+    if kind == "vector":
+        return {"x": x}
+    if kind == "legacy":
+        return {"sorted_list": sorted(x.tolist())}
+    if kind == "pair":
+        return {"x": x, "y": 0.5 * x + rng.normal(0, 1, rows)}
+    if kind == "groups":
+        return {"groups": [x[i::3] + i * 0.1 for i in range(3)]}
+    if kind == "series":
+        index = pd.date_range("2000-01-01", periods=rows, freq="h")
+        return {"series": pd.Series(np.sin(np.arange(rows) / 24) + x, index=index)}
+    if kind == "categorical":
+        codes = rng.integers(0, 10, (rows, 2))
+        return {"a": pd.Series(codes[:, 0]), "b": pd.Series(codes[:, 1])}
+    if kind == "table":
+        return {"table": np.array([[12, 5], [7, 15]])}
+    if kind == "categories":
+        labels = np.array([f"level{k}" for k in range(10)], dtype=object)
+        values = labels[rng.integers(0, 10, (rows, cols))]
+        values[rng.random(values.shape) < missing] = None
+        columns = [f"c{j}" for j in range(cols)]
+        return {"frame": pd.DataFrame(values, columns=columns)}
+
+    matrix = rng.normal(size=(rows, cols))
+    if kind == "labeled":
+        return {"X": matrix, "y": rng.integers(0, 3, rows)}
+    if kind == "matrix":
+        return {"X": matrix}
+
+    matrix[rng.random(matrix.shape) < missing] = np.nan
+    columns = [f"c{j}" for j in range(cols)]
+    return {"frame": pd.DataFrame(matrix, columns=columns)}
+
+
+# statistical_tests ---------------------------------------------------------
+
+@case("vector", max_rows=5000)
+def shapiro_test(d):
+    return statistical_tests.shapiro_test(d["x"])
+
+
+@case("vector")
+def anderson_test(d):
+    return statistical_tests.anderson_test(d["x"])
+
+
+@case("vector")
+def jarque_bera_test(d):
+    return statistical_tests.jarque_bera_test(d["x"])
+
+
+@case("vector")
+def kolmogorov_smirnov_test(d):
+    return statistical_tests.kolmogorov_smirnov_test(d["x"])
+
+
+@case("groups")
+def levene_test(d):
+    return statistical_tests.levene_test(d["groups"])
+
+
+@case("groups")
+def bartlett_test(d):
+    return statistical_tests.bartlett_test(d["groups"])
+
+
+@case("groups")
+def fligner_test(d):
+    return statistical_tests.fligner_test(d["groups"])
+
+
+@case("pair")
+def pearson_test(d):
+    return statistical_tests.pearson_test(d["x"], d["y"])
+
+
+@case("pair")
+def spearman_test(d):
+    return statistical_tests.spearman_test(d["x"], d["y"])
+
+
+@case("pair", max_rows=1_000_000)
+def kendall_test(d):
+    return statistical_tests.kendall_test(d["x"], d["y"])
+
+
+@case("matrix")
+def pearson_test_batched(d):
+    return statistical_tests.pearson_test(d["X"][:, 0], d["X"])
+
+
+@case("pair")
+def pearson_test_approx(d):
+    return statistical_tests.approximate_pearson_test(
+        (d["x"], d["y"]), utils.ApproxConfig(seed=0)
+    )
+
+
+@case("matrix")
+def spearman_test_batched(d):
+    return statistical_tests.spearman_test(d["X"][:, 0], d["X"])
+
+
+@case("matrix", max_rows=1_000_000)
+def kendall_test_batched(d):
+    return statistical_tests.kendall_test(d["X"][:, 0], d["X"])
+
+
+@case("frame", uses_missing=True)
+def spearman_matrix(d):
+    return statistical_tests.spearman_matrix(d["frame"])
+
+
+@case("matrix", max_rows=100_000, max_cols=200)
+def kendall_matrix(d):
+    return statistical_tests.kendall_matrix(d["X"])
+
+
+# hypothesis_testing --------------------------------------------------------
+
+@case("vector")
+def one_sample_ttest(d):
+    return hypothesis_testing.one_sample_ttest(d["x"], 10.0)
+
+
+@case("pair")
+def two_sample_ttest(d):
+    return hypothesis_testing.two_sample_ttest(d["x"], d["y"])
+
+
+@case("pair")
+def paired_ttest(d):
+    return hypothesis_testing.paired_ttest(d["x"], d["y"])
+
+
+@case("groups")
+def one_way_anova(d):
+    return hypothesis_testing.one_way_anova(d["groups"])
+
+
+@case("categorical", max_rows=1_000_000)
+def two_way_anova(d):
+    frame = pd.DataFrame({"y": d["a"] * 0.3 + d["b"], "A": d["a"], "B": d["b"]})
+    return hypothesis_testing.two_way_anova(frame, "y ~ C(A) + C(B)")
+
+
+@case("pair")
+def mann_whitney_test(d):
+    return hypothesis_testing.mann_whitney_test(d["x"], d["y"])
+
+
+@case("pair")
+def wilcoxon_test(d):
+    return hypothesis_testing.wilcoxon_test(d["x"], d["y"])
+
+
+@case("groups")
+def kruskal_wallis_test(d):
+    return hypothesis_testing.kruskal_wallis_test(d["groups"])
+
+
+@case("groups")
+def friedman_test(d):
+    size = min(len(g) for g in d["groups"])
+    return hypothesis_testing.friedman_test([g[:size] for g in d["groups"]])
+
+
+@case("categorical")
+def chi_square_test(d):
+    table = bivariate.compute_contingency(d["a"], d["b"])
+    return hypothesis_testing.chi_square_test(table.to_numpy())
+
+
+@case("table", max_rows=1000)
+def fisher_exact_test(d):
+    return hypothesis_testing.fisher_exact_test(d["table"])
+
+
+@case("table", max_rows=1000)
+def mcnemar_test(d):
+    return hypothesis_testing.mcnemar_test(d["table"])
+
+
+# missing_data --------------------------------------------------------------
+
+@case("frame", uses_missing=True)
+def missing_summary(d):
+    return missing_data.missing_summary(d["frame"])
+
+
+@case("frame", uses_missing=True)
+def missing_heatmap_data(d):
+    return missing_data.missing_heatmap_data(d["frame"])
+
+
+@case("frame", uses_missing=True)
+def missing_patterns(d):
+    return missing_data.missing_patterns(d["frame"])
+
+
+@case("frame", uses_missing=True)
+def test_mcar(d):
+    return missing_data.test_mcar(d["frame"])
+
+
+@case("frame", uses_missing=True)
+def analyze_mechanism(d):
+    return missing_data.analyze_mechanism(d["frame"])
+
+
+# imputation ----------------------------------------------------------------
+
+@case("frame", uses_missing=True)
+def mean_imputation(d):
+    return imputation.mean_imputation(d["frame"])
+
+
+@case("frame", uses_missing=True)
+def median_imputation(d):
+    return imputation.median_imputation(d["frame"])
+
+
+@case("frame", uses_missing=True, max_rows=100_000)
+def mode_imputation(d):
+    return imputation.mode_imputation(d["frame"])
+
+
+@case("frame", uses_missing=True, max_rows=10_000, max_cols=200)
+def knn_imputation(d):
+    return imputation.knn_imputation(d["frame"])
+
+
+@case("frame", uses_missing=True, max_rows=100_000, max_cols=20)
+def iterative_imputation(d):
+    return imputation.iterative_imputation(d["frame"])
+
+
+@case("frame", uses_missing=True, max_rows=100_000, max_cols=20)
+def mice_imputation(d):
+    return imputation.mice_imputation(d["frame"])
+
+
+# discriminant / factorial --------------------------------------------------
+
+@case("labeled", max_cols=200)
+def linear_discriminant_analysis(d):
+    return discriminant.LinearDiscriminantAnalysis().fit(d["X"], d["y"])
+
+
+@case("labeled", max_cols=200)
+def quadratic_discriminant_analysis(d):
+    return discriminant.QuadraticDiscriminantAnalysis().fit(d["X"], d["y"])
+
+
+@case("matrix", max_cols=20)
+def factor_analysis(d):
+    return factorial.FactorAnalysis(2).fit(d["X"]).get_results(d["X"])
+
+
+@case("matrix")
+def principal_component_analysis(d):
+    return factorial.PrincipalComponentAnalysis(2).fit(d["X"])
+
+
+# timeseries ----------------------------------------------------------------
+
+@case("series")
+def seasonal_decomposition(d):
+    return timeseries.seasonal_decomposition(d["series"], period=24)
+
+
+@case("series")
+def trend_analysis(d):
+    return timeseries.trend_analysis(d["series"])
+
+
+@case("series", max_rows=1_000_000)
+def adf_test(d):
+    return timeseries.adf_test(d["series"])
+
+
+@case("series")
+def kpss_test(d):
+    return timeseries.kpss_test(d["series"])
+
+
+@case("series", max_rows=1_000_000)
+def test_stationarity(d):
+    return timeseries.test_stationarity(d["series"])
+
+
+@case("series")
+def compute_acf(d):
+    return timeseries.compute_acf(d["series"])
+
+
+@case("series", max_rows=1_000_000)
+def compute_pacf(d):
+    return timeseries.compute_pacf(d["series"])
+
+
+# univariate ----------------------------------------------------------------
+
+@case("vector")
+def compute_statistics(d):
+    return univariate.compute_statistics(d["x"])
+
+
+@case("vector")
+def compute_moments(d):
+    return univariate.compute_moments(d["x"])
+
+
+@case("vector")
+def compute_quantiles(d):
+    return univariate.compute_quantiles(d["x"])
+
+
+@case("vector")
+def compute_quantiles_sketch(d):
+    return univariate.compute_quantiles(d["x"], method="sketch")
+
+
+@case("vector")
+def describe_array(d):
+    return univariate.describe_array(d["x"])
+
+
+@case("frame", uses_missing=True)
+def compute_statistics_frame(d):
+    return univariate.compute_statistics_frame(d["frame"])
+
+
+@case("frame", uses_missing=True)
+def compute_moments_frame(d):
+    return univariate.compute_moments_frame(d["frame"])
+
+
+@case("frame", uses_missing=True)
+def compute_quantiles_frame(d):
+    return univariate.compute_quantiles_frame(d["frame"])
+
+
+@case("vector")
+def streaming_moments(d):
+    return univariate.StreamingMoments().update(d["x"]).moment_stats()
+
+
+@case("vector")
+def quantile_sketch(d):
+    return univariate.build_quantile_sketch(d["x"]).quantiles([0.5])
+
+
+@case("vector")
+def fit_distribution(d):
+    return univariate.fit_distribution(d["x"], "norm")
+
+
+@case("vector", max_rows=1_000_000)
+def test_distribution_fit(d):
+    return univariate.test_distribution_fit(d["x"])
+
+
+@case("frame", uses_missing=True, max_rows=100_000, max_cols=20)
+def test_distribution_fit_frame(d):
+    return univariate.test_distribution_fit_frame(d["frame"])
+
+
+# bivariate -----------------------------------------------------------------
+
+@case("frame", uses_missing=True)
+def compute_correlation_matrix(d):
+    return bivariate.compute_correlation_matrix(d["frame"])
+
+
+@case("frame", uses_missing=True)
+def compute_correlation_matrix_listwise(d):
+    config = utils.CorrelationConfig(missing="listwise")
+    return bivariate.compute_correlation_matrix(d["frame"], config)
+
+
+@case("frame", uses_missing=True)
+def compute_correlation_matrix_approx(d):
+    config = utils.CorrelationConfig(approx=utils.ApproxConfig(seed=0))
+    return bivariate.compute_correlation_matrix(d["frame"], config)
+
+
+@case("matrix")
+def compute_correlation_blocks(d):
+    return bivariate.compute_correlation_blocks(d["X"])
+
+
+@case("pair")
+def compute_covariance(d):
+    return bivariate.compute_covariance(d["x"], d["y"])
+
+
+@case("matrix")
+def streaming_comoments(d):
+    accumulator = bivariate.StreamingCoMoments()
+    for start in range(0, d["X"].shape[0], 100_000):
+        accumulator.update(d["X"][start:start + 100_000])
+    return accumulator.covariance()
+
+
+@case("categorical")
+def compute_contingency(d):
+    return bivariate.compute_contingency(d["a"], d["b"])
+
+
+@case("categorical")
+def contingency_table_sparse(d):
+    return bivariate.contingency_table(d["a"], d["b"], as_sparse=True)
+
+
+@case("categories", uses_missing=True)
+def compute_association_matrix(d):
+    return bivariate.compute_association_matrix(d["frame"])
+
+
+@case("categories", uses_missing=True)
+def compute_association_matrix_parallel(d):
+    return bivariate.compute_association_matrix(
+        d["frame"], utils.AssociationConfig(n_jobs=os.cpu_count()))
+
+
+@case("categorical")
+def streaming_contingency(d):
+    accumulator = bivariate.StreamingContingency()
+    for start in range(0, len(d["a"]), 1_000_000):
+        accumulator.update(d["a"][start:start + 1_000_000],
+                           d["b"][start:start + 1_000_000])
+    return hypothesis_testing.chi_square_test(accumulator.table())
+
+
+@case("pair")
+def simple_linear_regression(d):
+    return bivariate.simple_linear_regression(d["x"], d["y"])
+
+
+@case("matrix")
+def simple_linear_regression_batched(d):
+    return bivariate.simple_linear_regression(d["X"], d["X"][:, 0])
+
+
+@case("pair")
+def simple_linear_regression_approx(d):
+    config = utils.ApproxConfig(seed=0, interval="bootstrap", target_error=0.05)
+    return bivariate.approximate_regression((d["x"], d["y"]), config)
+
+
+@case("matrix")
+def regression_from_sums(d):
+    sums = bivariate.regression_sums(d["X"], d["X"][:, 0])
+    return bivariate.regression_from_sums(sums)
+
+
+@case("pair")
+def compute_r_squared(d):
+    return bivariate.compute_r_squared(d["x"], d["y"])
+
+
+# multivariate --------------------------------------------------------------
+
+@case("matrix", max_cols=20)
+def kmeans_analysis(d):
+    return multivariate.kmeans_analysis(d["X"], 3)
+
+
+@case("matrix", max_cols=20)
+def kmeans_analysis_streaming(d):
+    return multivariate.kmeans_analysis(d["X"], 3,
+                                        streaming=utils.MiniBatchConfig())
+
+
+@case("matrix", max_cols=20)
+def kmeans_sweep(d):
+    config = utils.SweepConfig(k_values=range(2, 6))
+    return multivariate.kmeans_sweep(d["X"], config)
+
+
+@case("matrix", max_rows=10_000, max_cols=200)
+def hierarchical_clustering(d):
+    return multivariate.hierarchical_clustering(d["X"], 3)
+
+
+@case("matrix")
+def mahalanobis_distance(d):
+    return multivariate.mahalanobis_distance(d["X"])
+
+
+@case("matrix")
+def mahalanobis_distance_float32(d):
+    return multivariate.mahalanobis_distance(d["X"].astype(np.float32))
+
+
+@case("matrix")
+def detect_multivariate_outliers(d):
+    return multivariate.detect_multivariate_outliers(d["X"])
+
+
+@case("matrix", max_cols=20)
+def detect_multivariate_outliers_robust(d):
+    config = utils.OutlierConfig(robust=True)
+    return multivariate.detect_multivariate_outliers(d["X"], config)
+
+
+@case("matrix")
+def detect_projection_outliers(d):
+    return multivariate.detect_projection_outliers(d["X"])
+
+
+# visualization -------------------------------------------------------------
+
+def _closing(figure):
+    """Close a matplotlib figure so figures do not accumulate."""
+    import matplotlib.pyplot as plt
+
+    plt.close(figure)
+    return figure
+
+
+@case("vector", max_rows=1_000_000)
+def plot_histogram(d):
+    return _closing(visualization.plot_histogram(d["x"]))
+
+
+@case("vector", max_rows=1_000_000)
+def plot_qq(d):
+    return _closing(visualization.plot_qq(d["x"]))
+
+
+@case("frame", max_rows=1_000_000, max_cols=20)
+def plot_boxplot(d):
+    return _closing(visualization.plot_boxplot(d["frame"]))
+
+
+@case("pair", max_rows=1_000_000)
+def plot_scatter(d):
+    return _closing(visualization.plot_scatter(d["x"], d["y"]))
+
+
+@case("frame", max_cols=20)
+def plot_correlation_heatmap(d):
+    return _closing(visualization.plot_correlation_heatmap(d["frame"]))
+
+
+@case("series", max_rows=1_000_000)
+def plot_timeseries(d):
+    return _closing(visualization.plot_timeseries(d["series"]))
+
+
+@case("series", max_rows=1000)
+def plot_acf_pacf(d):
+    values = d["series"].to_numpy()[:41]
+    return _closing(visualization.plot_acf_pacf(values, values))
+
+
+# utils ---------------------------------------------------------------------
+
+@case("vector")
+def validate_array(d):
+    return utils.validate_array(d["x"])
+
+
+@case("frame", uses_missing=True)
+def validate_dataframe(d):
+    return utils.validate_dataframe(d["frame"])
+
+
+@case("matrix")
+def result_table(d):
+    result = statistical_tests.pearson_test(d["X"][:, 0], d["X"])
+    return utils.ResultTable.from_result(result).to_pandas()
+
+
+@case("matrix")
+def result_table_approx(d):
+    result = statistical_tests.approximate_pearson_test(
+        (d["X"][:, 0], d["X"]), utils.ApproxConfig(seed=0)
+    )
+    return utils.ResultTable.from_result(result).to_pandas()
+
+
+@case("matrix")
+def standardize(d):
+    return utils.standardize(d["X"])
+
+
+@case("matrix")
+def normalize(d):
+    return utils.normalize(d["X"])
+
+
+# legacy scripts (before vectorization) -------------------------------------
+
+@case("legacy", max_rows=1_000_000)
+def legacy_stats(d):
+    import estadisticos_desc
+
+    return estadisticos_desc.stats(d["sorted_list"])
+
+
+@case("legacy", max_rows=1_000_000)
+def legacy_tabla_frecuencia(d):
+    import orden_y_sinth
+
+    return orden_y_sinth.tabla_frecuencia(d["sorted_list"], 10)
+
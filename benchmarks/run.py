@@ -0,0 +1,252 @@
+"""
+Benchmark harness for EDA Suite.
+
+Times every case registered in ``cases.py`` over a grid of row counts,
+column counts and missingness levels. Each measurement runs in a fresh
+interpreter so peak memory is attributable to a single call, and results
+are appended to ``benchmarks/results/history.jsonl`` tagged with the
+current commit so that later runs can be compared against it.
+
+Usage:
+    python benchmarks/run.py --filter "compute_|standardize" --rows 1000 100000
+    python benchmarks/run.py --compare HEAD~1
+"""
+
+import argparse
+import json
+import os
+import platform
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+HISTORY = REPO_ROOT / "benchmarks" / "results" / "history.jsonl"
+
+DEFAULT_ROWS = [1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+DEFAULT_COLS = [2, 20, 200, 2000]
+DEFAULT_MISSING = [0.0, 0.1, 0.5]
+
+WORKER = """
+import json, resource, sys, time
+sys.path[:0] = [{root!r}, {bench!r}]
+from cases import CASES, make_inputs
+
+case = CASES[{name!r}]
+case.call(make_inputs(case.kind, (min({rows}, 100), {cols}), {missing}))
+inputs = make_inputs(case.kind, ({rows}, {cols}), {missing})
+best = float("inf")
+for _ in range({repeat}):
+    start = time.perf_counter()
+    case.call(inputs)
+    best = min(best, time.perf_counter() - start)
+
+peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+scale = 1 if sys.platform == "darwin" else 1024
+print(json.dumps({{"seconds": best, "peak_rss_mb": peak * scale / 2 ** 20}}))
+"""
+
+
+def git_commit() -> str:
+    """Return the current commit hash (suffixed when the tree is dirty)."""
+    def git(*args):
+        return subprocess.run(
+            ["git", *args], cwd=REPO_ROOT, capture_output=True, text=True
+        ).stdout.strip()
+
+    commit = git("rev-parse", "HEAD") or "unknown"
+    dirty = git("status", "--porcelain", "--untracked-files=no", "eda_suite")
+    return commit + ("-dirty" if dirty else "")
+
+
+def machine_info() -> Dict:
+    """Describe the machine a run was recorded on."""
+    return {
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+    }
+
+
+def grid(
+    cases: Dict,
+    args: argparse.Namespace
+) -> Iterator[Tuple[str, int, int, float]]:
+    """
+    Enumerate (case, rows, cols, missing) points within each case's limits.
+
+    Column counts only vary for column-aware cases and missingness only for
+    cases that accept missing values; other cases run once per row count.
+    """
+    from cases import COLUMN_KINDS
+
+    for name, case in cases.items():
+        cols = args.cols if case.kind in COLUMN_KINDS else [1]
+        missing = args.missing if case.uses_missing else [0.0]
+
+        for n_rows in args.rows:
+            if case.max_rows is not None and n_rows > case.max_rows:
+                continue
+            for n_cols in cols:
+                if case.max_cols is not None and n_cols > case.max_cols:
+                    continue
+                if n_rows * n_cols > args.max_cells:
+                    continue
+                for level in missing:
+                    yield name, n_rows, n_cols, level
+
+
+def measure(
+    point: Tuple[str, int, int, float],
+    repeat: int,
+    timeout: float
+) -> Dict:
+    """
+    Time one grid point in a fresh interpreter.
+
+    The case is first called on a small input so that lazy imports are not
+    charged to the timed calls.
+
+    Returns:
+        Dictionary with best wall time and peak RSS, or an error status
+    """
+    name, n_rows, n_cols, missing = point
+    code = WORKER.format(
+        root=str(REPO_ROOT), bench=str(REPO_ROOT / "benchmarks"), name=name,
+        rows=n_rows, cols=n_cols, missing=missing, repeat=repeat
+    )
+    env = dict(os.environ, MPLBACKEND="Agg")
+
+    try:
+        completed = subprocess.run(
+            [sys.executable, "-c", code], cwd=REPO_ROOT, env=env,
+            capture_output=True, text=True, timeout=timeout
+        )
+    except subprocess.TimeoutExpired:
+        return {"status": "timeout"}
+
+    if completed.returncode != 0:
+        error = completed.stderr.strip().splitlines()
+        return {"status": "error", "error": error[-1] if error else ""}
+
+    return {"status": "ok", **json.loads(completed.stdout)}
+
+
+def load_history(commit: str) -> Dict[Tuple, Dict]:
+    """
+    Latest recorded result per grid point for a commit.
+
+    Args:
+        commit: Commit hash or any prefix of it
+
+    Returns:
+        Mapping of (case, rows, cols, missing) to record
+    """
+    records = {}
+    if not HISTORY.exists():
+        return records
+
+    for line in HISTORY.read_text().splitlines():
+        record = json.loads(line)
+        if record["commit"].startswith(commit) and record["status"] == "ok":
+            key = (record["case"], record["rows"], record["cols"],
+                   record["missing"])
+            records[key] = record
+
+    return records
+
+
+def resolve(revision: str) -> str:
+    """Turn a git revision (e.g. ``HEAD~1``) into a commit hash."""
+    completed = subprocess.run(
+        ["git", "rev-parse", revision], cwd=REPO_ROOT,
+        capture_output=True, text=True
+    )
+    return completed.stdout.strip() or revision
+
+
+def report(record: Dict, baseline: Optional[Dict]) -> str:
+    """Format one result line, with the speed-up over a baseline if any."""
+    point = (f"{record['case']:34} rows={record['rows']:<9} "
+             f"cols={record['cols']:<5} missing={record['missing']:<4}")
+
+    if record["status"] != "ok":
+        return f"{point} {record['status']} {record.get('error', '')}"
+
+    line = (f"{point} {record['seconds'] * 1000:10.2f} ms "
+            f"{record['peak_rss_mb']:8.1f} MB")
+    if baseline is not None:
+        line += (f"  x{baseline['seconds'] / record['seconds']:.2f} time"
+                 f"  x{baseline['peak_rss_mb'] / record['peak_rss_mb']:.2f} mem")
+
+    return line
+
+
+def parse_args(argv: Optional[List[str]]) -> argparse.Namespace:
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--filter", default="",
+                        help="regular expression selecting case names")
+    parser.add_argument("--rows", type=int, nargs="+", default=DEFAULT_ROWS)
+    parser.add_argument("--cols", type=int, nargs="+", default=DEFAULT_COLS)
+    parser.add_argument("--missing", type=float, nargs="+",
+                        default=DEFAULT_MISSING)
+    parser.add_argument("--max-cells", type=float, default=5e7,
+                        help="skip grid points with more rows * cols")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="repetitions per point (best time is kept)")
+    parser.add_argument("--timeout", type=float, default=600,
+                        help="seconds before a point is abandoned")
+    parser.add_argument("--compare", metavar="REVISION",
+                        help="compare against results recorded for a commit")
+    parser.add_argument("--no-save", action="store_true",
+                        help="do not append results to the history file")
+    parser.add_argument("--list", action="store_true",
+                        help="list matching cases and exit")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the selected benchmark grid.
+
+    Returns:
+        Process exit code (non-zero if any point failed)
+    """
+    args = parse_args(argv)
+    sys.path[:0] = [str(REPO_ROOT), str(REPO_ROOT / "benchmarks")]
+    from cases import CASES
+
+    pattern = re.compile(args.filter)
+    cases = {name: case for name, case in CASES.items() if pattern.search(name)}
+    if args.list:
+        print("\n".join(cases))
+        return 0
+
+    baseline = load_history(resolve(args.compare)) if args.compare else {}
+    header = {"commit": git_commit(), "machine": machine_info(),
+              "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z")}
+    if not args.no_save:
+        HISTORY.parent.mkdir(parents=True, exist_ok=True)
+
+    failed = False
+    for point in grid(cases, args):
+        record = dict(zip(("case", "rows", "cols", "missing"), point))
+        record.update(measure(point, args.repeat, args.timeout))
+        failed = failed or record["status"] != "ok"
+
+        print(report(record, baseline.get(point)), flush=True)
+
+        if not args.no_save:
+            with HISTORY.open("a") as history:
+                history.write(json.dumps({**header, **record}) + "\n")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
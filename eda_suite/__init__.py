@@ -23,20 +23,7 @@ Modules:
 __version__ = "1.0.0"
 __author__ = "EDA Suite Contributors"
 
-from eda_suite import (
-    statistical_tests,
-    hypothesis_testing,
-    missing_data,
-    imputation,
-    discriminant,
-    factorial,
-    timeseries,
-    univariate,
-    bivariate,
-    multivariate,
-    visualization,
-    utils
-)
+import importlib
 
 __all__ = [
     "statistical_tests",
@@ -52,3 +39,16 @@ __all__ = [
     "visualization",
     "utils"
 ]
+
+
+def __getattr__(name: str):
+    """Import a subpackage on first attribute access."""
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """List subpackages alongside loaded module attributes."""
+    return sorted(set(__all__) | set(globals()))
@@ -0,0 +1,49 @@
+"""
+Lazy attribute loading for EDA Suite packages.
+
+Defers submodule imports until an exported name is first accessed, so that
+importing a package does not pay for dependencies it never uses.
+"""
+
+import importlib
+import sys
+from typing import Callable, Dict, List, Tuple
+
+
+def attach(
+    package: str,
+    exports: Dict[str, List[str]]
+) -> Tuple[Callable, Callable, List[str]]:
+    """
+    Build module-level ``__getattr__``, ``__dir__`` and ``__all__``.
+
+    Args:
+        package: Fully qualified package name (``__name__``)
+        exports: Mapping of submodule name to the names it exports
+
+    Returns:
+        Tuple of (__getattr__, __dir__, __all__) for the package
+    """
+    owners = {
+        name: submodule
+        for submodule, names in exports.items()
+        for name in names
+    }
+    names = list(owners)
+
+    def __getattr__(name: str):
+        if name not in owners:
+            raise AttributeError(
+                f"module {package!r} has no attribute {name!r}"
+            )
+
+        module = importlib.import_module(f"{package}.{owners[name]}")
+        value = getattr(module, name)
+        setattr(sys.modules[package], name, value)
+
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(names) | set(vars(sys.modules[package])))
+
+    return __getattr__, __dir__, names
@@ -4,20 +4,31 @@ Bivariate analysis module for EDA Suite.
 Provides tools for analyzing relationships between two variables.
 """
 
-from eda_suite.bivariate.association import (
-    compute_correlation_matrix,
-    compute_covariance,
-    compute_contingency
-)
-from eda_suite.bivariate.regression import (
-    simple_linear_regression,
-    compute_r_squared
-)
+from eda_suite._lazy import attach
 
-__all__ = [
-    "compute_correlation_matrix",
-    "compute_covariance",
-    "compute_contingency",
-    "simple_linear_regression",
-    "compute_r_squared"
-]
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "association": [
+        "compute_correlation_matrix",
+        "compute_covariance",
+        "compute_contingency"
+    ],
+    "contingency": [
+        "compute_association_matrix",
+        "contingency_table",
+        "FactorizedFrame",
+        "StreamingContingency"
+    ],
+    "blocked": [
+        "compute_correlation_blocks"
+    ],
+    "regression": [
+        "simple_linear_regression",
+        "approximate_regression",
+        "compute_r_squared",
+        "regression_sums",
+        "regression_from_sums"
+    ],
+    "streaming": [
+        "StreamingCoMoments"
+    ]
+})
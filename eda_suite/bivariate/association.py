@@ -7,51 +7,264 @@ Computes correlation, covariance, and contingency measures.
 import numpy as np
 import pandas as pd
 from scipy import stats
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from typing import Iterator, Optional, Tuple, Union
+from eda_suite.bivariate.contingency import contingency_table
+from eda_suite.univariate.columnar import _as_matrix
+from eda_suite.utils.config import ApproxConfig, CorrelationConfig
+from eda_suite.utils.sampling import (
+    bootstrap_interval,
+    draw_sample,
+    fisher_interval,
+    row_chunks
+)
 
 
 @dataclass
 class CorrelationMatrix:
-    """Correlation matrix with p-values."""
+    """
+    Correlation matrix with p-values.
+
+    ``ci_low`` and ``ci_high`` bound each correlation when it was estimated
+    from a sample (``CorrelationConfig.approx``).
+    """
 
     correlation: np.ndarray
     p_values: np.ndarray
     variables: list
+    n_obs: Optional[np.ndarray] = None
+    ci_low: Optional[np.ndarray] = None
+    ci_high: Optional[np.ndarray] = None
+
+
+def _unit_columns(matrix: np.ndarray) -> np.ndarray:
+    """
+    Center columns and scale them to unit Euclidean norm.
+
+    Args:
+        matrix: (n, p) floating matrix without NaNs
+
+    Returns:
+        (n, p) matrix whose column dot products are Pearson correlations
+        (NaN columns for constant inputs)
+    """
+    centered = matrix - matrix.mean(axis=0)
+    norms = np.sqrt(np.einsum("ij,ij->j", centered, centered))
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return centered / norms
+
+
+def _pearson_complete(
+    matrix: np.ndarray,
+    other: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Pearson correlations between the columns of NaN-free matrices.
+
+    Columns are centered and scaled to unit norm once; the correlation
+    matrix is then a single matrix product.
+
+    Args:
+        matrix: (n, p) floating matrix without NaNs
+        other: Optional (n, q) matrix; defaults to ``matrix`` itself
+
+    Returns:
+        (p, q) correlation matrix (NaN rows/columns for constant columns)
+    """
+    unit = _unit_columns(matrix)
+    corr = unit.T @ (unit if other is None else _unit_columns(other))
+
+    return np.clip(corr, -1.0, 1.0, out=corr)
+
+
+def _pairwise_tile(
+    block_a: Tuple[np.ndarray, np.ndarray],
+    block_b: Tuple[np.ndarray, np.ndarray]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pairwise-complete correlations between the columns of two blocks.
+
+    Sums over pairwise-complete rows are masked matrix products: with ``M``
+    the presence mask and ``X0`` the data zeroed where missing,
+    ``X0_a.T @ M_b`` holds the sums of column i over rows where column j is
+    present, ``X0_a.T @ X0_b`` the cross products and ``M_a.T @ M_b`` the
+    counts.
+
+    Args:
+        block_a: Tuple of (centered values zeroed where missing, mask)
+        block_b: Same for the second block
+
+    Returns:
+        Tuple of (correlations, pairwise observation counts)
+    """
+    values_a, mask_a = block_a
+    values_b, mask_b = block_b
+
+    counts = mask_a.T @ mask_b
+    sums_a = values_a.T @ mask_b
+    sums_b = mask_a.T @ values_b
+    squares_a = (values_a * values_a).T @ mask_b
+    squares_b = mask_a.T @ (values_b * values_b)
+    cross = values_a.T @ values_b
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cov = cross - sums_a * sums_b / counts
+        var_a = squares_a - sums_a ** 2 / counts
+        var_b = squares_b - sums_b ** 2 / counts
+        corr = cov / np.sqrt(var_a * var_b)
+
+    return np.clip(corr, -1.0, 1.0, out=corr), counts
+
+
+def _masked_values(matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Center columns on their NaN-mean and zero missing entries.
+
+    Args:
+        matrix: (n, p) floating matrix, NaN marking missing values
 
+    Returns:
+        Tuple of (centered values zeroed where missing, float presence mask)
+    """
+    present = ~np.isnan(matrix)
+    with np.errstate(invalid="ignore"):
+        shifted = matrix - np.nanmean(matrix, axis=0)
+
+    return np.where(present, shifted, 0.0), present.astype(np.float64)
+
+
+def _pearson_pairwise(matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pearson correlations using, for each pair, the rows where both are present.
+
+    Args:
+        matrix: (n, p) floating matrix, NaN marking missing values
+
+    Returns:
+        Tuple of ((p, p) correlations, (p, p) pairwise observation counts)
+    """
+    block = _masked_values(matrix)
+    return _pairwise_tile(block, block)
+
+
+def _correlation_p_values(corr: np.ndarray, n_obs: np.ndarray) -> np.ndarray:
+    """
+    Two-sided p-values for Pearson correlations (t-test with n - 2 dof).
+
+    Args:
+        corr: Correlation coefficients
+        n_obs: Observations behind each coefficient
 
-def compute_correlation_matrix(data: pd.DataFrame) -> CorrelationMatrix:
+    Returns:
+        Array of p-values (NaN where fewer than 3 observations)
+    """
+    dof = np.asarray(n_obs, dtype=np.float64) - 2
+    with np.errstate(invalid="ignore", divide="ignore"):
+        t_stat = np.abs(corr) * np.sqrt(dof / (1 - corr ** 2))
+        p_values = 2 * stats.t.sf(t_stat, dof)
+
+    return np.where(dof > 0, p_values, np.nan)
+
+
+def _correlation_counts(
+    matrix: np.ndarray,
+    missing: str
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Correlations and per-pair observation counts under a NaN policy."""
+    incomplete = np.isnan(matrix).any(axis=1)
+
+    if missing == "pairwise" and incomplete.any():
+        return _pearson_pairwise(matrix)
+
+    matrix = matrix[~incomplete] if incomplete.any() else matrix
+    corr_matrix = _pearson_complete(matrix)
+    return corr_matrix, np.full(corr_matrix.shape, matrix.shape[0],
+                                dtype=np.float64)
+
+
+def _sample_chunks(
+    data: Union[pd.DataFrame, np.ndarray],
+    approx: ApproxConfig
+) -> Iterator:
+    """Row chunks as matrices, paired with their labels when stratified."""
+    column = approx.strata_column
+    if column is not None and not isinstance(data, pd.DataFrame):
+        raise ValueError("strata_column needs DataFrame input")
+
+    for part in row_chunks(data, approx.chunk_size):
+        if column is None:
+            yield _as_matrix(part)[0]
+        else:
+            yield (_as_matrix(part.drop(columns=column))[0],
+                   part[column].to_numpy())
+
+
+def _approximate_correlation_matrix(
+    data: Union[pd.DataFrame, np.ndarray],
+    config: CorrelationConfig
+) -> CorrelationMatrix:
+    """Correlation matrix of a reservoir sample, with confidence bounds."""
+    approx, exact = config.approx, replace(config, approx=None)
+    head = next(row_chunks(data, 1))
+    if approx.strata_column is not None:
+        head = head.drop(columns=approx.strata_column)
+    sample = draw_sample(_sample_chunks(data, approx), approx)
+
+    result = compute_correlation_matrix(sample, exact)
+    result.variables = _as_matrix(head)[1]
+
+    if approx.interval == "bootstrap":
+        low, high = bootstrap_interval(
+            lambda rows: compute_correlation_matrix(rows, exact).correlation,
+            [sample], approx
+        )
+    else:
+        low, high = fisher_interval(result.correlation, result.n_obs,
+                                    approx.confidence)
+
+    np.fill_diagonal(low, 1.0)
+    np.fill_diagonal(high, 1.0)
+    result.ci_low, result.ci_high = low, high
+
+    return result
+
+
+def compute_correlation_matrix(
+    data: Union[pd.DataFrame, np.ndarray],
+    config: Optional[CorrelationConfig] = None
+) -> CorrelationMatrix:
     """
     Compute correlation matrix with significance.
 
+    All coefficients come from one matrix product and all p-values from one
+    vectorized t-distribution call. With ``config.approx`` they come from a
+    reservoir sample instead, with confidence bounds.
+
     Args:
-        data: DataFrame with numeric variables
+        data: DataFrame with numeric variables (or 2-D array)
+        config: ``missing`` ("pairwise" or "listwise" NaN handling) and
+            ``approx`` settings
 
     Returns:
-        CorrelationMatrix with correlations and p-values
-    """
-    numeric_data = data.select_dtypes(include=[np.number])
-    n_vars = len(numeric_data.columns)
-
-    corr_matrix = np.zeros((n_vars, n_vars))
-    p_matrix = np.zeros((n_vars, n_vars))
-
-    for i, col1 in enumerate(numeric_data.columns):
-        for j, col2 in enumerate(numeric_data.columns):
-            if i == j:
-                corr_matrix[i, j] = 1.0
-                p_matrix[i, j] = 0.0
-            else:
-                r, p = stats.pearsonr(
-                    numeric_data[col1].dropna(),
-                    numeric_data[col2].dropna()
-                )
-                corr_matrix[i, j] = r
-                p_matrix[i, j] = p
+        CorrelationMatrix with correlations, p-values and per-pair counts
+    """
+    config = config or CorrelationConfig()
+    if config.approx is not None:
+        return _approximate_correlation_matrix(data, config)
+
+    matrix, variables = _as_matrix(data)
+    corr_matrix, n_obs = _correlation_counts(matrix, config.missing)
+
+    p_matrix = _correlation_p_values(corr_matrix, n_obs)
+    np.fill_diagonal(corr_matrix, 1.0)
+    np.fill_diagonal(p_matrix, 0.0)
 
     return CorrelationMatrix(
         correlation=corr_matrix,
         p_values=p_matrix,
-        variables=list(numeric_data.columns)
+        variables=variables,
+        n_obs=n_obs.astype(np.int64)
     )
 
 
@@ -79,6 +292,9 @@ def compute_contingency(
     """
     Compute contingency table for categorical variables.
 
+    Both variables are factorized into integer codes and counted with a
+    single ``np.bincount``; see ``contingency_table`` for sparse tables.
+
     Args:
         x: First categorical variable
         y: Second categorical variable
@@ -86,4 +302,4 @@ def compute_contingency(
     Returns:
         Contingency table DataFrame
     """
-    return pd.crosstab(x, y)
+    return contingency_table(x, y, as_sparse=False).to_frame()
@@ -0,0 +1,248 @@
+"""
+Blocked correlation for very wide data.
+
+Computes the correlation matrix tile by tile so that the full p x p matrix
+never has to exist in memory. Tiles can be written to a (memory-mapped)
+output, streamed to a callback, and reduced to the most correlated pairs.
+"""
+
+import heapq
+import numpy as np
+import pandas as pd
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Iterator, List, Optional, Tuple, Union
+from eda_suite.bivariate.association import (
+    _correlation_p_values,
+    _masked_values,
+    _pairwise_tile,
+    _unit_columns
+)
+from eda_suite.univariate.columnar import _as_matrix
+from eda_suite.utils.config import CorrelationConfig
+
+
+@dataclass
+class CorrelationPairs:
+    """Variable pairs selected from a blocked correlation run."""
+
+    variables: List
+    first: np.ndarray
+    second: np.ndarray
+    correlation: np.ndarray
+    p_values: np.ndarray
+    n_obs: np.ndarray
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Convert to a DataFrame with one row per pair.
+
+        Returns:
+            DataFrame with both variable labels, correlation, p-value and n
+        """
+        labels = np.asarray(self.variables, dtype=object)
+        return pd.DataFrame({
+            "first": labels[self.first],
+            "second": labels[self.second],
+            "correlation": self.correlation,
+            "p_value": self.p_values,
+            "n_obs": self.n_obs
+        })
+
+
+class _PairCollector:
+    """Keep pairs above a threshold, bounded to the top k by |r|."""
+
+    def __init__(self, top_k: Optional[int], threshold: Optional[float]):
+        self.top_k = top_k
+        self.threshold = threshold
+        self.heap = []
+
+    def floor(self) -> float:
+        """Smallest |r| that can still enter the collection."""
+        floor = -1.0 if self.threshold is None else self.threshold
+        if self.top_k is not None and len(self.heap) == self.top_k:
+            floor = max(floor, self.heap[0][0])
+        return floor
+
+    def add(
+        self,
+        offsets: Tuple[int, int],
+        tile: Tuple[np.ndarray, np.ndarray]
+    ) -> None:
+        """
+        Offer the strict upper-triangle entries of one tile.
+
+        Args:
+            offsets: Global (row, column) index of the tile's first entry
+            tile: Tuple of (correlations, observation counts)
+        """
+        corr, counts = tile
+        keep = np.abs(corr) >= self.floor()
+        if offsets[0] == offsets[1]:
+            keep = np.triu(keep, 1)
+
+        rows, cols = np.nonzero(keep)
+        values, counts = corr[rows, cols], counts[rows, cols]
+        strength = np.abs(values)
+        rows, cols = rows + offsets[0], cols + offsets[1]
+
+        if self.top_k is not None and strength.size > self.top_k:
+            best = np.argpartition(strength, -self.top_k)[-self.top_k:]
+            rows, cols, strength = rows[best], cols[best], strength[best]
+            values, counts = values[best], counts[best]
+
+        for entry in zip(strength.tolist(), rows.tolist(), cols.tolist(),
+                         values.tolist(), counts.tolist()):
+            if self.top_k is None or len(self.heap) < self.top_k:
+                heapq.heappush(self.heap, entry)
+            elif entry[0] > self.heap[0][0]:
+                heapq.heapreplace(self.heap, entry)
+
+    def result(self, variables: List) -> CorrelationPairs:
+        """Pairs sorted by decreasing |r|."""
+        columns = list(zip(*sorted(self.heap, reverse=True))) or [()] * 5
+        _, first, second, corr, counts = (
+            np.array(column, dtype=np.float64) for column in columns
+        )
+
+        return CorrelationPairs(
+            variables=variables,
+            first=first.astype(np.int64),
+            second=second.astype(np.int64),
+            correlation=corr,
+            p_values=_correlation_p_values(corr, counts),
+            n_obs=counts.astype(np.int64)
+        )
+
+
+def _prepare_blocks(
+    matrix: np.ndarray,
+    missing: str
+) -> Tuple[Callable, int]:
+    """
+    Precompute per-column state and return the tile function.
+
+    Args:
+        matrix: (n, p) floating matrix
+        missing: "pairwise" or "listwise"
+
+    Returns:
+        Tuple of (tile(cols_a, cols_b) -> (corr, counts), number of columns)
+    """
+    incomplete = np.isnan(matrix).any(axis=1)
+
+    if missing == "pairwise" and incomplete.any():
+        values, mask = _masked_values(matrix)
+
+        def tile(cols_a, cols_b):
+            return _pairwise_tile((values[:, cols_a], mask[:, cols_a]),
+                                  (values[:, cols_b], mask[:, cols_b]))
+
+        return tile, matrix.shape[1]
+
+    complete = matrix[~incomplete] if incomplete.any() else matrix
+    unit = _unit_columns(complete)
+    n_rows = float(complete.shape[0])
+
+    def tile(cols_a, cols_b):
+        corr = unit[:, cols_a].T @ unit[:, cols_b]
+        np.clip(corr, -1.0, 1.0, out=corr)
+        return corr, np.broadcast_to(n_rows, corr.shape)
+
+    return tile, matrix.shape[1]
+
+
+def _tiles(n_cols: int, block_size: int) -> Iterator[Tuple[slice, slice]]:
+    """Yield the upper-triangle (including diagonal) tiles of a p x p matrix."""
+    starts = range(0, n_cols, block_size)
+    for i in starts:
+        for j in starts:
+            if j >= i:
+                yield slice(i, min(i + block_size, n_cols)), \
+                    slice(j, min(j + block_size, n_cols))
+
+
+def _computed_tiles(
+    tile: Callable,
+    positions: Iterator[Tuple[slice, slice]],
+    n_jobs: Optional[int]
+) -> Iterator[Tuple[Tuple[slice, slice], Tuple[np.ndarray, np.ndarray]]]:
+    """
+    Compute tiles in order, at most ``2 * n_jobs`` in flight at once.
+
+    Matrix products release the GIL, so worker threads share the prepared
+    data without copying it.
+    """
+    if n_jobs is None or n_jobs == 1:
+        for position in positions:
+            yield position, tile(*position)
+        return
+
+    with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+        pending = deque()
+        for position in positions:
+            pending.append((position, executor.submit(tile, *position)))
+            if len(pending) >= 2 * n_jobs:
+                done, future = pending.popleft()
+                yield done, future.result()
+
+        while pending:
+            done, future = pending.popleft()
+            yield done, future.result()
+
+
+def _emit_tile(
+    config: CorrelationConfig,
+    tile: Tuple[slice, slice, np.ndarray]
+) -> None:
+    """Write one upper-triangle tile to ``config.out`` and ``config.callback``."""
+    rows, cols, corr = tile
+    if config.out is not None:
+        config.out[rows, cols] = corr
+        config.out[cols, rows] = corr.T
+    if config.callback is not None:
+        config.callback(rows, cols, corr)
+
+
+def compute_correlation_blocks(
+    data: Union[pd.DataFrame, np.ndarray],
+    config: CorrelationConfig = CorrelationConfig()
+) -> CorrelationPairs:
+    """
+    Compute Pearson correlations tile by tile.
+
+    Only upper-triangle tiles are computed. Memory use is bounded by the
+    input, ``config.n_jobs`` tiles of ``block_size`` x ``block_size`` and
+    the pair collection.
+
+    Args:
+        data: DataFrame with numeric variables (or 2-D array)
+        config: Tile size, worker threads, pair selection, NaN handling
+            and the optional ``out`` array and tile ``callback``
+
+    Returns:
+        CorrelationPairs with the ``config.top_k`` strongest pairs with
+        ``|r| >= config.threshold`` (all such pairs if top_k is None)
+    """
+    matrix, variables = _as_matrix(data)
+    tile, n_cols = _prepare_blocks(matrix, config.missing)
+
+    if config.out is not None and config.out.shape != (n_cols, n_cols):
+        raise ValueError("out must have shape (n_columns, n_columns)")
+
+    collector = _PairCollector(config.top_k, config.threshold)
+    positions = _tiles(n_cols, config.block_size)
+
+    for (rows, cols), (corr, counts) in _computed_tiles(tile, positions,
+                                                        config.n_jobs):
+        if rows == cols:
+            np.fill_diagonal(corr, 1.0)
+        collector.add((rows.start, cols.start), (corr, counts))
+        _emit_tile(config, (rows, cols, corr))
+
+    if hasattr(config.out, "flush"):
+        config.out.flush()
+
+    return collector.result(variables)
@@ -0,0 +1,660 @@
+"""
+Factorized contingency tables.
+
+Categorical columns are factorized once into integer codes; tables are
+then counted with ``np.bincount`` on combined codes, or stored sparse when
+the product of the cardinalities is large. Tables can also be accumulated
+chunk by chunk and merged across workers, and every pair of columns can
+be screened for association from the same codes.
+"""
+
+import numpy as np
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from scipy import sparse, stats
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from eda_suite.utils.config import AssociationConfig
+from eda_suite.utils.validators import validate_dataframe
+
+SPARSE_CELLS = 1 << 22
+BLOCK_ELEMENTS = 1 << 22
+
+
+@dataclass
+class ContingencyTable:
+    """Observed counts with their row and column categories."""
+
+    counts: Union[np.ndarray, sparse.csr_matrix]
+    rows: pd.Index
+    columns: pd.Index
+
+    @property
+    def is_sparse(self) -> bool:
+        """Whether counts are stored as a sparse matrix."""
+        return sparse.issparse(self.counts)
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Convert to a dense DataFrame laid out like ``pd.crosstab``.
+
+        Returns:
+            DataFrame of counts indexed by row and column categories
+        """
+        counts = self.counts.toarray() if self.is_sparse else self.counts
+        return pd.DataFrame(counts, index=self.rows, columns=self.columns)
+
+
+def factorize(values: Union[pd.Series, np.ndarray]) -> Tuple[np.ndarray, pd.Index]:
+    """
+    Encode values as integer codes over their sorted categories.
+
+    Args:
+        values: Categorical values (missing values get code -1)
+
+    Returns:
+        Tuple of (int64 codes, categories)
+    """
+    try:
+        codes, categories = pd.factorize(values, sort=True)
+    except TypeError:
+        codes, categories = pd.factorize(values)
+
+    return codes.astype(np.int64, copy=False), pd.Index(categories)
+
+
+def _table_from_codes(
+    codes: Tuple[np.ndarray, np.ndarray],
+    categories: Tuple[pd.Index, pd.Index],
+    as_sparse: Optional[bool] = None
+) -> ContingencyTable:
+    """
+    Count co-occurrences of two code arrays.
+
+    Rows where either code is missing are ignored, and categories that
+    never co-occur with a non-missing value are dropped (as in crosstab).
+
+    Args:
+        codes: Tuple of (row codes, column codes), -1 marking missing
+        categories: Tuple of (row categories, column categories)
+        as_sparse: Force (True) or forbid (False) sparse storage; None
+            chooses sparse above ``SPARSE_CELLS`` cells
+
+    Returns:
+        ContingencyTable with int64 counts
+    """
+    x_codes, y_codes = codes
+    valid = (x_codes >= 0) & (y_codes >= 0)
+    combined = x_codes[valid] * len(categories[1]) + y_codes[valid]
+
+    return _table_from_keys((combined, None), categories, as_sparse)
+
+
+def _table_from_keys(
+    cells: Tuple[np.ndarray, Optional[np.ndarray]],
+    categories: Tuple[pd.Index, pd.Index],
+    as_sparse: Optional[bool] = None
+) -> ContingencyTable:
+    """
+    Build a table from flat cell keys (row * n_columns + column) and
+    their counts (None: one observation per key), dropping categories
+    that never occur.
+    """
+    keys, counts = cells
+    n_rows, n_cols = len(categories[0]), len(categories[1])
+
+    if as_sparse is None:
+        as_sparse = n_rows * n_cols > SPARSE_CELLS
+
+    if as_sparse:
+        if counts is None:
+            keys, counts = np.unique(keys, return_counts=True)
+        table = sparse.csr_matrix(
+            (counts.astype(np.int64), (keys // n_cols, keys % n_cols)),
+            shape=(n_rows, n_cols)
+        )
+    else:
+        table = np.bincount(keys, weights=counts, minlength=n_rows * n_cols)
+        table = table.astype(np.int64, copy=False).reshape(n_rows, n_cols)
+
+    keep_rows = np.asarray(table.sum(axis=1)).ravel() > 0
+    keep_cols = np.asarray(table.sum(axis=0)).ravel() > 0
+
+    return ContingencyTable(
+        counts=table[keep_rows][:, keep_cols],
+        rows=categories[0][keep_rows],
+        columns=categories[1][keep_cols]
+    )
+
+
+def contingency_table(
+    x: Union[pd.Series, np.ndarray],
+    y: Union[pd.Series, np.ndarray],
+    as_sparse: Optional[bool] = None
+) -> ContingencyTable:
+    """
+    Build a contingency table from two categorical variables.
+
+    Args:
+        x: First categorical variable (rows)
+        y: Second categorical variable (columns)
+        as_sparse: Force or forbid sparse storage (None decides by size)
+
+    Returns:
+        ContingencyTable with counts and categories
+    """
+    if len(x) != len(y):
+        raise ValueError("x and y must have the same length")
+
+    (x_codes, x_cats), (y_codes, y_cats) = factorize(x), factorize(y)
+    table = _table_from_codes((x_codes, y_codes), (x_cats, y_cats), as_sparse)
+    table.rows.name = getattr(x, "name", None)
+    table.columns.name = getattr(y, "name", None)
+
+    return table
+
+
+@dataclass
+class AssociationMatrix:
+    """
+    Pairwise association between categorical variables.
+
+    ``theils_u[i, j]`` is the uncertainty coefficient U(i | j): the share
+    of the entropy of variable i explained by variable j.
+    """
+
+    cramers_v: np.ndarray
+    theils_u: np.ndarray
+    p_values: np.ndarray
+    variables: list
+    n_obs: np.ndarray
+
+
+class FactorizedFrame:
+    """Categorical columns of a DataFrame, each factorized at most once."""
+
+    def __init__(self, data: pd.DataFrame):
+        """
+        Args:
+            data: DataFrame (or Arrow table) with categorical columns
+        """
+        self.data = validate_dataframe(data)
+        self._codes: Dict = {}
+
+    def codes(self, column) -> Tuple[np.ndarray, pd.Index]:
+        """
+        Integer codes and categories of one column (cached).
+
+        Args:
+            column: Column label
+
+        Returns:
+            Tuple of (int64 codes, categories)
+        """
+        if column not in self._codes:
+            self._codes[column] = factorize(self.data[column])
+        return self._codes[column]
+
+    def contingency(
+        self,
+        x,
+        y,
+        as_sparse: Optional[bool] = None
+    ) -> ContingencyTable:
+        """
+        Contingency table of two columns from their cached codes.
+
+        Args:
+            x: Row variable column label
+            y: Column variable column label
+            as_sparse: Force or forbid sparse storage (None decides by size)
+
+        Returns:
+            ContingencyTable with counts and categories
+        """
+        (x_codes, x_cats), (y_codes, y_cats) = self.codes(x), self.codes(y)
+        table = _table_from_codes((x_codes, y_codes), (x_cats, y_cats), as_sparse)
+        table.rows.name, table.columns.name = x, y
+
+        return table
+
+
+class StreamingContingency:
+    """Mergeable contingency table accumulated over chunks."""
+
+    def __init__(self):
+        """Initialize an empty accumulator."""
+        self.rows = pd.Index([])
+        self.columns = pd.Index([])
+        self._keys = np.empty(0, dtype=np.int64)
+        self._counts = np.empty(0, dtype=np.int64)
+
+    @staticmethod
+    def _encode(values, known: pd.Index) -> Tuple[np.ndarray, pd.Index]:
+        """Map values to codes over ``known`` categories, extending them."""
+        codes, uniques = pd.factorize(values)
+        positions = known.get_indexer(uniques)
+        new = positions < 0
+        positions[new] = np.arange(len(known), len(known) + new.sum())
+
+        if new.any():
+            known = known.append(pd.Index(uniques[new]))
+
+        codes = np.where(codes >= 0, positions[codes], -1)
+        return codes.astype(np.int64), known
+
+    def _add(self, keys: np.ndarray, counts: np.ndarray) -> None:
+        """Fold (row << 32 | column) keys with counts into the totals."""
+        keys = np.concatenate([self._keys, keys])
+        counts = np.concatenate([self._counts, counts])
+        self._keys, inverse = np.unique(keys, return_inverse=True)
+        self._counts = np.bincount(inverse, weights=counts).astype(np.int64)
+
+    def update(
+        self,
+        x: Union[pd.Series, np.ndarray],
+        y: Union[pd.Series, np.ndarray]
+    ) -> 'StreamingContingency':
+        """
+        Add a chunk of paired observations (pairs with a missing value are
+        skipped).
+
+        Args:
+            x: Row variable values
+            y: Column variable values
+
+        Returns:
+            Self for method chaining
+        """
+        x_codes, self.rows = self._encode(x, self.rows)
+        y_codes, self.columns = self._encode(y, self.columns)
+
+        valid = (x_codes >= 0) & (y_codes >= 0)
+        keys = (x_codes[valid] << 32) | y_codes[valid]
+        self._add(*np.unique(keys, return_counts=True))
+
+        return self
+
+    def merge(self, other: 'StreamingContingency') -> 'StreamingContingency':
+        """
+        Fold another accumulator into this one.
+
+        Args:
+            other: Accumulator built from a disjoint part of the data
+
+        Returns:
+            Self for method chaining
+        """
+        row_map, self.rows = self._encode(other.rows, self.rows)
+        col_map, self.columns = self._encode(other.columns, self.columns)
+
+        keys = (row_map[other._keys >> 32] << 32) | col_map[other._keys & 0xFFFFFFFF]
+        self._add(keys, other._counts)
+
+        return self
+
+    def table(self, as_sparse: Optional[bool] = None) -> ContingencyTable:
+        """
+        Contingency table of everything seen so far, categories sorted.
+
+        Built from the distinct cells and their counts, so memory depends
+        on the number of nonzero cells, not on the rows seen.
+
+        Args:
+            as_sparse: Force or forbid sparse storage (None decides by size)
+
+        Returns:
+            ContingencyTable with counts and categories
+        """
+        def sorted_codes(categories):
+            try:
+                order = categories.argsort()
+            except TypeError:
+                order = np.arange(len(categories))
+            ranks = np.empty(len(order), dtype=np.int64)
+            ranks[order] = np.arange(len(order))
+            return ranks, categories[order]
+
+        row_ranks, rows = sorted_codes(self.rows)
+        col_ranks, columns = sorted_codes(self.columns)
+        keys = (row_ranks[self._keys >> 32] * len(columns)
+                + col_ranks[self._keys & 0xFFFFFFFF])
+
+        return _table_from_keys((keys, self._counts), (rows, columns), as_sparse)
+
+
+def _pair_blocks(n_rows: int, cells: np.ndarray) -> Iterator[slice]:
+    """
+    Yield slices of later columns whose tables are counted together.
+
+    A block holds at most ``BLOCK_ELEMENTS`` combined codes and, unless a
+    single table is larger on its own, at most ``SPARSE_CELLS`` cells.
+    """
+    max_cols = max(1, BLOCK_ELEMENTS // max(n_rows, 1))
+    start = 0
+    while start < len(cells):
+        filled = np.cumsum(cells[start:start + max_cols])
+        stop = start + max(1, int(np.searchsorted(filled, SPARSE_CELLS, side="right")))
+        yield slice(start, stop)
+        start = stop
+
+
+def _count_keys(keys: np.ndarray, n_cells: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Distinct keys below ``n_cells`` and their counts, in key order."""
+    if n_cells > SPARSE_CELLS:
+        return np.unique(keys, return_counts=True)
+
+    counts = np.bincount(keys, minlength=n_cells)
+    present = np.flatnonzero(counts)
+    return present, counts[present]
+
+
+def _nonzero_cells(
+    x: Tuple[np.ndarray, int],
+    y: Tuple[np.ndarray, np.ndarray]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Nonzero cells of the tables of one code array against several others.
+
+    The tables are laid end to end and counted with one ``np.bincount``
+    on offset combined codes (``np.unique`` above ``SPARSE_CELLS`` cells).
+    Missing values (code = cardinality) fall in a discarded extra row or
+    column, so no mask is needed.
+
+    Args:
+        x: Tuple of (row codes (n,), number of row categories)
+        y: Tuple of (column codes (m, n), numbers of column categories (m,))
+
+    Returns:
+        Tuple of (table index, row indices, column indices, counts) of
+        nonzero cells, ordered by table
+    """
+    (x_codes, n_x), (y_codes, n_y) = x, y
+    widths = n_y + 1
+    cells = (n_x + 1) * widths
+    offsets = np.concatenate([[0], np.cumsum(cells)[:-1]])
+
+    combined = np.multiply.outer(widths, x_codes)
+    combined += offsets[:, None]
+    combined += y_codes
+
+    keys, counts = _count_keys(combined.ravel(), int(cells.sum()))
+    tables = np.searchsorted(offsets, keys, side="right") - 1
+    keys = keys - offsets[tables]
+    rows, cols = keys // widths[tables], keys % widths[tables]
+    observed = (rows < n_x) & (cols < n_y[tables])
+
+    return tables[observed], rows[observed], cols[observed], counts[observed]
+
+
+def _per_table(labels: np.ndarray, values: np.ndarray, n_tables: int) -> np.ndarray:
+    """Sum ``values`` by table index."""
+    return np.bincount(labels, weights=values, minlength=n_tables)
+
+
+def _margin_statistics(
+    totals: np.ndarray,
+    labels: np.ndarray,
+    table_totals: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Per-table summaries of one margin.
+
+    Args:
+        totals: Row (or column) totals of all tables laid end to end
+        labels: Table index of each total
+        table_totals: Number of observations in each table
+
+    Returns:
+        Tuple of (nonempty categories, entropy, sum of inverse totals),
+        one entry per table
+    """
+    present = totals > 0
+    totals, labels = totals[present], labels[present]
+    shares = totals / table_totals[labels]
+    n_tables = len(table_totals)
+
+    return (np.bincount(labels, minlength=n_tables),
+            -_per_table(labels, shares * np.log(shares), n_tables),
+            _per_table(labels, 1 / totals, n_tables))
+
+
+def _cell_ratios(
+    cells: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+    n_x: int,
+    n_y: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, Tuple[Tuple, Tuple]]:
+    """
+    Observed-to-expected ratio of every nonzero cell.
+
+    Returns:
+        Tuple of (ratios, observations per table, (row margin, column
+        margin) summaries from ``_margin_statistics``)
+    """
+    tables, rows, cols, counts = cells
+    n_tables = len(n_y)
+    total = _per_table(tables, counts, n_tables)
+
+    row_keys = tables * n_x + rows
+    col_keys = np.concatenate([[0], np.cumsum(n_y)[:-1]])[tables] + cols
+    row_totals = np.bincount(row_keys, weights=counts, minlength=n_tables * n_x)
+    col_totals = np.bincount(col_keys, weights=counts, minlength=n_y.sum())
+
+    ratio = counts * total[tables] / (row_totals[row_keys] * col_totals[col_keys])
+    return ratio, total, (
+        _margin_statistics(row_totals, np.repeat(np.arange(n_tables), n_x), total),
+        _margin_statistics(col_totals, np.repeat(np.arange(n_tables), n_y), total)
+    )
+
+
+def _yates_statistic(
+    count: np.ndarray,
+    ratio: np.ndarray,
+    inverse_expected: np.ndarray
+) -> np.ndarray:
+    """
+    Yates-corrected chi-square of 2x2 tables from one cell of each
+    (|O - E| is the same in every cell of a 2x2 table).
+    """
+    deviation = np.abs(count - count / ratio)
+    deviation -= np.minimum(0.5, deviation)
+    return deviation ** 2 * inverse_expected
+
+
+def _chi_square(
+    cells: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+    fit: Tuple[np.ndarray, np.ndarray, Tuple[Tuple, Tuple]]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Chi-square of every table, with and without continuity correction.
+
+    Args:
+        cells: Nonzero cells with float counts (see ``_nonzero_cells``)
+        fit: Output of ``_cell_ratios`` for the same cells
+
+    Returns:
+        Tuple of (uncorrected chi-square, test statistic with Yates'
+        correction for one degree of freedom as in
+        ``scipy.stats.chi2_contingency``, degrees of freedom)
+    """
+    tables, counts = cells[0], cells[3]
+    ratio, total, ((n_rows, _, inverse_rows), (n_cols, _, inverse_cols)) = fit
+    chi2 = np.maximum(_per_table(tables, counts * ratio, len(total)) - total, 0.0)
+
+    dof = np.where(total > 0, (n_rows - 1) * (n_cols - 1), 0)
+    statistic = np.where(total > 0, chi2, np.nan)
+    yates = np.flatnonzero(dof == 1)
+    first = np.searchsorted(tables, yates)
+    statistic[yates] = _yates_statistic(
+        counts[first], ratio[first],
+        total[yates] * inverse_rows[yates] * inverse_cols[yates]
+    )
+
+    return chi2, statistic, dof
+
+
+def _pair_statistics(
+    cells: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+    n_x: int,
+    n_y: np.ndarray
+) -> np.ndarray:
+    """
+    Association statistics of several tables from their nonzero cells,
+    reduced per table with ``np.bincount``.
+
+    Args:
+        cells: Tuple of (table index, row index, column index, count) of
+            the nonzero cells, ordered by table (see ``_nonzero_cells``)
+        n_x: Number of row categories
+        n_y: Number of column categories of each table
+
+    Returns:
+        (m, 6) array of Cramer's V, U(row | column), U(column | row),
+        chi-square statistic, degrees of freedom and number of
+        observations
+    """
+    cells = cells[:3] + (cells[3].astype(np.float64),)
+    fit = _cell_ratios(cells, n_x, n_y)
+    ratio, total, ((n_rows, h_rows, _), (n_cols, h_cols, _)) = fit
+    chi2, statistic, dof = _chi_square(cells, fit)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        information = _per_table(cells[0], cells[3] * np.log(ratio), len(total)) / total
+        information = np.maximum(information, 0.0)
+        u_rows = np.where(h_rows > 0, np.minimum(information / h_rows, 1.0), np.nan)
+        u_cols = np.where(h_cols > 0, np.minimum(information / h_cols, 1.0), np.nan)
+        smaller = np.minimum(n_rows, n_cols) - 1
+        cramers_v = np.where(smaller > 0, np.sqrt(chi2 / total / smaller), np.nan)
+
+    return np.column_stack([cramers_v, u_rows, u_cols, statistic, dof, total])
+
+
+def _association_row(task: Tuple) -> np.ndarray:
+    """Statistics and p-values of one column against every later column."""
+    index, codes, sizes = task
+    reference = (codes[index], sizes[index])
+    later_codes, later_sizes = codes[index + 1:], sizes[index + 1:]
+    row = np.empty((len(later_sizes), 6))
+
+    cells = (sizes[index] + 1) * (later_sizes + 1)
+    for block in _pair_blocks(codes.shape[1], cells):
+        row[block] = _pair_statistics(
+            _nonzero_cells(reference, (later_codes[block], later_sizes[block])),
+            sizes[index], later_sizes[block]
+        )
+
+    statistic, dof = row[:, 3], row[:, 4]
+    with np.errstate(invalid="ignore"):
+        row[:, 3] = np.where(dof > 0, stats.chi2.sf(statistic, np.maximum(dof, 1)),
+                             np.where(np.isnan(statistic), np.nan, 1.0))
+
+    return row
+
+
+def _stacked_codes(
+    frame: FactorizedFrame,
+    columns: Optional[List]
+) -> Tuple[List, np.ndarray, np.ndarray]:
+    """
+    Codes of every variable as rows of one matrix, missing values coded as
+    the number of categories.
+
+    Args:
+        frame: Factorized data
+        columns: Columns to stack (None: all non-numeric columns)
+
+    Returns:
+        Tuple of (variables, int64 codes (p, n), numbers of categories (p,))
+    """
+    if columns is None:
+        columns = frame.data.select_dtypes(exclude=[np.number]).columns
+    variables = list(columns)
+
+    codes = np.empty((len(variables), len(frame.data)), dtype=np.int64)
+    sizes = np.empty(len(variables), dtype=np.int64)
+    for index, column in enumerate(variables):
+        column_codes, categories = frame.codes(column)
+        sizes[index] = len(categories)
+        codes[index] = np.where(column_codes < 0, sizes[index], column_codes)
+
+    return variables, codes, sizes
+
+
+def _association_rows(tasks: List[Tuple], n_jobs: Optional[int]) -> Iterable:
+    """Run ``_association_row`` over the tasks on ``n_jobs`` threads."""
+    if n_jobs is None or n_jobs == 1:
+        return map(_association_row, tasks)
+
+    with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+        return list(executor.map(_association_row, tasks))
+
+
+def _fill_matrices(
+    rows: Iterable[np.ndarray],
+    n_obs: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Symmetric (p, p) matrices from the rows of ``_association_row``.
+
+    Args:
+        rows: Statistics of each column against every later column
+        n_obs: Non-missing observations of each variable (the diagonal)
+
+    Returns:
+        Tuple of (Cramer's V, Theil's U, p-values, observations)
+    """
+    n_vars = len(n_obs)
+    cramers_v, theils_u = np.eye(n_vars), np.eye(n_vars)
+    p_values = np.zeros((n_vars, n_vars))
+    n_obs = np.diag(n_obs).astype(np.int64)
+
+    for index, row in enumerate(rows):
+        later = slice(index + 1, None)
+        cramers_v[index, later] = cramers_v[later, index] = row[:, 0]
+        theils_u[index, later], theils_u[later, index] = row[:, 1], row[:, 2]
+        p_values[index, later] = p_values[later, index] = row[:, 3]
+        n_obs[index, later] = n_obs[later, index] = row[:, 5]
+
+    return cramers_v, theils_u, p_values, n_obs
+
+
+def compute_association_matrix(
+    data: pd.DataFrame,
+    config: AssociationConfig = AssociationConfig()
+) -> AssociationMatrix:
+    """
+    Cramer's V, Theil's U and chi-square p-values for every pair of
+    categorical columns.
+
+    Every column is factorized once. For each column, the tables against
+    blocks of later columns are counted together with one ``np.bincount``
+    on the shared codes (``np.unique`` for very large cardinality
+    products) and their statistics computed in a batch, so the work stays
+    in NumPy calls that release the GIL and rows of the matrix scale over
+    ``config.n_jobs`` worker threads. Missing values are dropped pair by
+    pair, and p-values match ``chi_square_test`` (Yates' correction for
+    2x2 tables).
+
+    Args:
+        data: DataFrame (or FactorizedFrame) with categorical variables
+        config: Columns to compare (default: all non-numeric columns) and
+            worker threads
+
+    Returns:
+        AssociationMatrix with one (p, p) array per measure
+    """
+    frame = data if isinstance(data, FactorizedFrame) else FactorizedFrame(data)
+    variables, codes, sizes = _stacked_codes(frame, config.columns)
+    tasks = [(index, codes, sizes) for index in range(len(variables) - 1)]
+
+    rows = _association_rows(tasks, config.n_jobs)
+    cramers_v, theils_u, p_values, n_obs = _fill_matrices(
+        rows, (codes < sizes[:, None]).sum(axis=1))
+
+    return AssociationMatrix(
+        cramers_v=cramers_v,
+        theils_u=theils_u,
+        p_values=p_values,
+        variables=variables,
+        n_obs=n_obs
+    )
@@ -7,18 +7,135 @@ Linear regression for bivariate relationships.
 import numpy as np
 from scipy import stats
 from dataclasses import dataclass
-from eda_suite.utils.validators import validate_array
+from typing import Optional, Tuple, Union
+from eda_suite.bivariate.association import _correlation_p_values
+from eda_suite.statistical_tests.correlation import _column_pairs
+from eda_suite.utils.config import ApproxConfig
+from eda_suite.utils.sampling import bootstrap_interval, draw_paired_sample
+from eda_suite.utils.validators import validate_paired
 
 
 @dataclass
 class RegressionResult:
-    """Result of simple linear regression."""
+    """
+    Result of simple linear regression.
+
+    Fields are scalars for a single regression and arrays for batched ones.
+    ``ci_low`` and ``ci_high`` bound the slope when it was estimated from a
+    sample (``approximate_regression``).
+    """
+
+    slope: Union[float, np.ndarray]
+    intercept: Union[float, np.ndarray]
+    r_squared: Union[float, np.ndarray]
+    p_value: Union[float, np.ndarray]
+    std_error: Union[float, np.ndarray]
+    ci_low: Union[None, float, np.ndarray] = None
+    ci_high: Union[None, float, np.ndarray] = None
+
+
+def _as_columns(
+    x: np.ndarray,
+    y: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, Tuple[int, ...]]:
+    """
+    Validate inputs as (n, k) and (n, m) column matrices.
+
+    Returns:
+        Tuple of (x columns, y columns, result shape without 1-D axes)
+    """
+    batched = _column_pairs(x, y)
+    if batched is not None:
+        return batched
+
+    x_arr, y_arr = validate_paired(x, y)
+    if x_arr.shape != y_arr.shape:
+        raise ValueError("x and y must have the same length")
+
+    return (x_arr.astype(np.float64).reshape(-1, 1),
+            y_arr.astype(np.float64).reshape(-1, 1), ())
+
+
+def _cross_moments(
+    x_cols: np.ndarray,
+    y_cols: np.ndarray
+) -> Tuple[int, Tuple[np.ndarray, np.ndarray], Tuple[np.ndarray, ...]]:
+    """
+    Means and centered sums of squares/cross products for all column pairs.
+
+    Args:
+        x_cols: (n, k) matrix
+        y_cols: (n, m) matrix
+
+    Returns:
+        Tuple of (n, (mean x (k, 1), mean y (1, m)),
+        (Sxx (k, 1), Syy (1, m), Sxy (k, m)))
+    """
+    mean_x = x_cols.mean(axis=0)
+    mean_y = y_cols.mean(axis=0)
+    x_centered = x_cols - mean_x
+    y_centered = y_cols - mean_y
+
+    sxx = np.einsum("ij,ij->j", x_centered, x_centered)
+    syy = np.einsum("ij,ij->j", y_centered, y_centered)
+
+    return (
+        x_cols.shape[0],
+        (mean_x[:, None], mean_y[None, :]),
+        (sxx[:, None], syy[None, :], x_centered.T @ y_centered)
+    )
+
+
+def _regression_result(
+    fields: Tuple[np.ndarray, ...],
+    shape: Tuple[int, ...]
+) -> RegressionResult:
+    """Wrap (slope, intercept, r_squared, p_value, std_error) arrays."""
+    if shape == () or np.ndim(fields[0]) == 0:
+        values = [float(np.asarray(value).reshape(-1)[0]) for value in fields]
+    else:
+        values = [np.broadcast_to(value, fields[0].shape).reshape(shape)
+                  for value in fields]
+
+    return RegressionResult(*values)
+
 
-    slope: float
-    intercept: float
-    r_squared: float
-    p_value: float
-    std_error: float
+def _regression_from_moments(
+    n: np.ndarray,
+    means: Tuple[np.ndarray, np.ndarray],
+    comoments: Tuple[np.ndarray, np.ndarray, np.ndarray]
+) -> Tuple[np.ndarray, ...]:
+    """
+    Least-squares fit of y on x from centered sufficient statistics.
+
+    Works elementwise on arrays, so many regressions can be solved at once.
+
+    Args:
+        n: Number of observations
+        means: Tuple of (mean of x, mean of y)
+        comoments: Tuple of (Sxx, Syy, Sxy), the centered sums of squares
+            and cross products
+
+    Returns:
+        Tuple of (slope, intercept, r_squared, p_value, std_error) as in
+        ``scipy.stats.linregress``
+    """
+    mean_x, mean_y = means
+    sxx, syy, sxy = comoments
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        slope = sxy / sxx
+        r_value = np.clip(sxy / np.sqrt(sxx * syy), -1.0, 1.0)
+        residual = np.maximum(syy - slope * sxy, 0.0)
+        std_error = np.sqrt(residual / (n - 2) / sxx)
+
+    return (
+        slope,
+        mean_y - slope * mean_x,
+        r_value ** 2,
+        _correlation_p_values(r_value, n),
+        std_error
+    )
 
 
 def simple_linear_regression(
@@ -28,15 +145,27 @@ def simple_linear_regression(
     """
     Perform simple linear regression.
 
+    Either input may be 2-D: each column of ``y`` is regressed on each
+    column of ``x`` (one y on many x's, many y's on one x, or all pairs)
+    in one vectorized computation, and the result holds arrays of shape
+    (k, m) (or (m,) / (k,) when one input is 1-D).
+
     Args:
-        x: Independent variable
-        y: Dependent variable
+        x: Independent variable, shape (n,) or (n, k)
+        y: Dependent variable, shape (n,) or (n, m)
 
     Returns:
         RegressionResult with regression statistics
     """
-    x_arr = validate_array(x)
-    y_arr = validate_array(y)
+    batched = _column_pairs(x, y)
+    if batched is not None:
+        x_cols, y_cols, shape = batched
+        n, means, comoments = _cross_moments(x_cols, y_cols)
+        return _regression_result(
+            _regression_from_moments(n, means, comoments), shape
+        )
+
+    x_arr, y_arr = validate_paired(x, y)
 
     slope, intercept, r_value, p_value, std_err = stats.linregress(x_arr, y_arr)
 
@@ -49,19 +178,122 @@ def simple_linear_regression(
     )
 
 
+def approximate_regression(
+    arrays: Tuple[np.ndarray, ...],
+    approx: ApproxConfig
+) -> RegressionResult:
+    """
+    Simple linear regression on a reservoir sample drawn in one pass.
+
+    Statistics refer to the sample; ``ci_low`` and ``ci_high`` bound the
+    slope of the full data.
+
+    Args:
+        arrays: Tuple of (x, y) as for ``simple_linear_regression``, or
+            (x, y, strata) to sample proportionally per stratum
+        approx: Sample size (or target error), interval type and seed
+
+    Returns:
+        RegressionResult with regression statistics and slope bounds
+    """
+    x_sample, y_sample = draw_paired_sample(arrays, approx)
+    result = simple_linear_regression(x_sample, y_sample)
+
+    if approx.interval == "bootstrap":
+        low, high = bootstrap_interval(
+            lambda xs, ys: simple_linear_regression(xs, ys).slope,
+            [x_sample, y_sample], approx
+        )
+    else:
+        t = stats.t.ppf(0.5 + approx.confidence / 2, len(x_sample) - 2)
+        low = np.subtract(result.slope, t * np.asarray(result.std_error))
+        high = np.add(result.slope, t * np.asarray(result.std_error))
+
+    scalar = np.ndim(result.slope) == 0
+    result.ci_low = float(low) if scalar else low
+    result.ci_high = float(high) if scalar else high
+
+    return result
+
+
+def regression_sums(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """
+    Sufficient statistics for simple linear regression.
+
+    Sums from disjoint chunks add up, so regressions over streamed data
+    only need the running total of this array.
+
+    Args:
+        x: Independent variable, shape (n,) or (n, k)
+        y: Dependent variable, shape (n,) or (n, m)
+
+    Returns:
+        Array of shape (6,) + result shape holding
+        (n, sum x, sum y, sum x^2, sum xy, sum y^2)
+    """
+    x_cols, y_cols, shape = _as_columns(x, y)
+    k, m = x_cols.shape[1], y_cols.shape[1]
+
+    sums = np.empty((6, k, m))
+    sums[0] = x_cols.shape[0]
+    sums[1] = x_cols.sum(axis=0)[:, None]
+    sums[2] = y_cols.sum(axis=0)[None, :]
+    sums[3] = np.einsum("ij,ij->j", x_cols, x_cols)[:, None]
+    sums[4] = x_cols.T @ y_cols
+    sums[5] = np.einsum("ij,ij->j", y_cols, y_cols)[None, :]
+
+    return sums.reshape((6,) + shape)
+
+
+def regression_from_sums(sums: np.ndarray) -> RegressionResult:
+    """
+    Simple linear regression from accumulated sufficient statistics.
+
+    Raw sums lose precision when the means are large relative to the
+    spread; center the data (or use ``StreamingCoMoments``) in that case.
+
+    Args:
+        sums: Array whose first axis holds (n, sum x, sum y, sum x^2,
+            sum xy, sum y^2), e.g. a total of ``regression_sums`` results
+
+    Returns:
+        RegressionResult with scalar or array fields matching ``sums[0]``
+    """
+    n, sum_x, sum_y, sum_xx, sum_xy, sum_yy = np.asarray(sums, dtype=np.float64)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = (sum_x / n, sum_y / n)
+        comoments = (
+            sum_xx - sum_x * sum_x / n,
+            sum_yy - sum_y * sum_y / n,
+            sum_xy - sum_x * sum_y / n
+        )
+
+    return _regression_result(_regression_from_moments(n, means, comoments),
+                              np.shape(n))
+
+
 def compute_r_squared(
     x: np.ndarray,
     y: np.ndarray
-) -> float:
+) -> Union[float, np.ndarray]:
     """
     Compute R-squared (coefficient of determination).
 
+    Only the centered cross moments are computed, not the full regression.
+    Batched like ``simple_linear_regression``.
+
     Args:
-        x: Independent variable
-        y: Dependent variable
+        x: Independent variable, shape (n,) or (n, k)
+        y: Dependent variable, shape (n,) or (n, m)
 
     Returns:
-        R-squared value
+        R-squared value (array for batched inputs)
     """
-    result = simple_linear_regression(x, y)
-    return result.r_squared
+    x_cols, y_cols, shape = _as_columns(x, y)
+    _, _, (sxx, syy, sxy) = _cross_moments(x_cols, y_cols)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        r_squared = np.minimum(sxy ** 2 / (sxx * syy), 1.0)
+
+    return float(r_squared[0, 0]) if shape == () else r_squared.reshape(shape)
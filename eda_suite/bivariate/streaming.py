@@ -0,0 +1,181 @@
+"""
+Streaming and mergeable co-moment accumulation.
+
+Accumulates the count, means and centered cross-product matrix of k
+variables over data that arrives in chunks, using the pairwise update of
+Chan et al. (1979). Partial accumulators from separate workers merge
+exactly into covariance, correlation and regression results.
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Union
+from eda_suite.bivariate.association import CorrelationMatrix, _correlation_p_values
+from eda_suite.bivariate.regression import RegressionResult, _regression_from_moments
+from eda_suite.univariate.columnar import _as_matrix
+
+
+class StreamingCoMoments:
+    """Mergeable accumulator for count, means and the co-moment matrix."""
+
+    def __init__(self):
+        """Initialize an empty accumulator."""
+        self.count = 0
+        self.mean = None
+        self.comoment = None
+        self.variables = None
+
+    def update(
+        self,
+        chunk: Union[pd.DataFrame, np.ndarray]
+    ) -> 'StreamingCoMoments':
+        """
+        Add a chunk of observations (rows with any NaN are skipped).
+
+        Args:
+            chunk: DataFrame (numeric columns) or (n, k) array; the column
+                layout must match earlier chunks
+
+        Returns:
+            Self for method chaining
+        """
+        matrix, variables = _as_matrix(chunk)
+        matrix = matrix[~np.isnan(matrix).any(axis=1)]
+
+        if self.variables is None:
+            self.variables = variables
+        elif len(variables) != len(self.variables):
+            raise ValueError("Chunk has a different number of columns")
+
+        if matrix.shape[0] == 0:
+            return self
+
+        mean = matrix.mean(axis=0, dtype=np.float64)
+        centered = matrix - mean
+        comoment = centered.T @ centered
+
+        return self._combine(matrix.shape[0], mean, comoment)
+
+    def merge(self, other: 'StreamingCoMoments') -> 'StreamingCoMoments':
+        """
+        Fold another accumulator into this one.
+
+        Merging is exact (up to rounding), so partial results computed by
+        separate workers can be combined in any order.
+
+        Args:
+            other: Accumulator built from a disjoint part of the data
+
+        Returns:
+            Self for method chaining
+        """
+        if other.count == 0:
+            return self
+
+        if self.variables is None:
+            self.variables = other.variables
+
+        return self._combine(other.count, other.mean, other.comoment)
+
+    def _combine(
+        self,
+        n_b: int,
+        mean_b: np.ndarray,
+        comoment_b: np.ndarray
+    ) -> 'StreamingCoMoments':
+        """Apply the pairwise update for (count, mean, co-moment matrix)."""
+        if self.count == 0:
+            self.count = n_b
+            self.mean = np.array(mean_b, dtype=np.float64)
+            self.comoment = np.array(comoment_b, dtype=np.float64)
+            return self
+
+        if mean_b.shape != self.mean.shape:
+            raise ValueError("Accumulators track different numbers of variables")
+
+        n_a, n = self.count, self.count + n_b
+        delta = mean_b - self.mean
+
+        self.comoment += comoment_b + np.outer(delta, delta) * (n_a * n_b / n)
+        self.mean += delta * (n_b / n)
+        self.count = n
+
+        return self
+
+    def _require(self, minimum: int) -> None:
+        """Raise if fewer than ``minimum`` rows have been accumulated."""
+        if self.count < minimum:
+            raise ValueError(f"At least {minimum} observations are required")
+
+    def covariance(self, ddof: int = 1) -> np.ndarray:
+        """
+        Covariance matrix of everything seen so far.
+
+        Args:
+            ddof: Delta degrees of freedom (1 matches ``np.cov``)
+
+        Returns:
+            (k, k) covariance matrix
+        """
+        self._require(ddof + 1)
+        return self.comoment / (self.count - ddof)
+
+    def correlation(self) -> CorrelationMatrix:
+        """
+        Pearson correlation matrix of everything seen so far.
+
+        Returns:
+            CorrelationMatrix equivalent to ``compute_correlation_matrix``
+            on the complete rows
+        """
+        self._require(2)
+        scale = np.sqrt(np.diag(self.comoment))
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            corr = self.comoment / np.outer(scale, scale)
+        np.clip(corr, -1.0, 1.0, out=corr)
+
+        n_obs = np.full(corr.shape, self.count)
+        p_values = _correlation_p_values(corr, n_obs)
+        np.fill_diagonal(corr, 1.0)
+        np.fill_diagonal(p_values, 0.0)
+
+        return CorrelationMatrix(
+            correlation=corr,
+            p_values=p_values,
+            variables=list(self.variables),
+            n_obs=n_obs
+        )
+
+    def regression(
+        self,
+        x: Union[int, str] = 0,
+        y: Union[int, str] = 1
+    ) -> RegressionResult:
+        """
+        Simple linear regression of one tracked variable on another.
+
+        Args:
+            x: Independent variable (column label or position)
+            y: Dependent variable (column label or position)
+
+        Returns:
+            RegressionResult equivalent to ``simple_linear_regression``
+        """
+        self._require(3)
+        i, j = (self.variables.index(v) if v in self.variables else v
+                for v in (x, y))
+
+        slope, intercept, r_squared, p_value, std_error = _regression_from_moments(
+            self.count,
+            (self.mean[i], self.mean[j]),
+            (self.comoment[i, i], self.comoment[j, j], self.comoment[i, j])
+        )
+
+        return RegressionResult(
+            slope=float(slope),
+            intercept=float(intercept),
+            r_squared=float(r_squared),
+            p_value=float(p_value),
+            std_error=float(std_error)
+        )
@@ -4,12 +4,11 @@ Discriminant analysis module for EDA Suite.
 Provides Linear Discriminant Analysis (LDA) and related methods.
 """
 
-from eda_suite.discriminant.lda import (
-    LinearDiscriminantAnalysis,
-    QuadraticDiscriminantAnalysis
-)
+from eda_suite._lazy import attach
 
-__all__ = [
-    "LinearDiscriminantAnalysis",
-    "QuadraticDiscriminantAnalysis"
-]
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "lda": [
+        "LinearDiscriminantAnalysis",
+        "QuadraticDiscriminantAnalysis"
+    ]
+})
@@ -4,12 +4,11 @@ Factorial analysis module for EDA Suite.
 Provides factor analysis and related dimension reduction methods.
 """
 
-from eda_suite.factorial.factor_analysis import (
-    FactorAnalysis,
-    PrincipalComponentAnalysis
-)
+from eda_suite._lazy import attach
 
-__all__ = [
-    "FactorAnalysis",
-    "PrincipalComponentAnalysis"
-]
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "factor_analysis": [
+        "FactorAnalysis",
+        "PrincipalComponentAnalysis"
+    ]
+})
@@ -9,6 +9,7 @@ import pandas as pd
 from sklearn.decomposition import FactorAnalysis as SklearnFA
 from sklearn.decomposition import PCA as SklearnPCA
 from dataclasses import dataclass
+from eda_suite.utils.cache import memoize
 
 
 @dataclass
@@ -21,6 +22,21 @@ class FactorResult:
     n_components: int
 
 
+@memoize
+def _fit_model(model, X: np.ndarray):
+    """
+    Fit a scikit-learn estimator (memoized when caching is enabled).
+
+    Args:
+        model: Unfitted estimator
+        X: Feature matrix
+
+    Returns:
+        Fitted estimator
+    """
+    return model.fit(X)
+
+
 class FactorAnalysis:
     """Factor Analysis wrapper."""
 
@@ -45,7 +61,7 @@ class FactorAnalysis:
         Returns:
             Self for method chaining
         """
-        self.model.fit(X)
+        self.model = _fit_model(self.model, X)
         self.is_fitted = True
         return self
 
@@ -112,7 +128,7 @@ class PrincipalComponentAnalysis:
         Returns:
             Self for method chaining
         """
-        self.model.fit(X)
+        self.model = _fit_model(self.model, X)
         self.is_fitted = True
         return self
 
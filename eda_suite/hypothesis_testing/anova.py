@@ -9,11 +9,10 @@ import numpy as np
 import pandas as pd
 from scipy import stats
 from typing import List
-from statsmodels.formula.api import ols
-from statsmodels.stats.anova import anova_lm
+from eda_suite.utils.results import DATACLASS_SLOTS
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ANOVAResult:
     """Result of ANOVA test."""
 
@@ -64,6 +63,9 @@ def two_way_anova(
     Returns:
         DataFrame with ANOVA table
     """
+    from statsmodels.formula.api import ols
+    from statsmodels.stats.anova import anova_lm
+
     model = ols(formula, data=data).fit()
     anova_table = anova_lm(model, typ=2)
 
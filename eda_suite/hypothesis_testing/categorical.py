@@ -7,10 +7,12 @@ Implements chi-square and related tests for categorical data.
 from dataclasses import dataclass
 import numpy as np
 import pandas as pd
-from scipy import stats
+from scipy import sparse, stats
+from eda_suite.bivariate.contingency import ContingencyTable
+from eda_suite.utils.results import DATACLASS_SLOTS
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CategoricalTestResult:
     """Result of categorical test."""
 
@@ -20,6 +22,32 @@ class CategoricalTestResult:
     reject_null: bool
 
 
+def _sparse_chi_square(observed) -> tuple:
+    """
+    Chi-square independence statistic of a sparse table.
+
+    Uses chi2 = n * (sum(O^2 / (r_i * c_j)) - 1) over the nonzero cells only,
+    so the dense expected table is never formed.
+
+    Args:
+        observed: scipy.sparse table without empty rows or columns
+
+    Returns:
+        Tuple of (statistic, p_value)
+    """
+    cells = observed.tocoo()
+    row_totals = np.asarray(observed.sum(axis=1), dtype=np.float64).ravel()
+    col_totals = np.asarray(observed.sum(axis=0), dtype=np.float64).ravel()
+    total = row_totals.sum()
+    dof = (observed.shape[0] - 1) * (observed.shape[1] - 1)
+
+    counts = cells.data.astype(np.float64)
+    ratio = counts * counts / (row_totals[cells.row] * col_totals[cells.col])
+    statistic = max(total * (ratio.sum() - 1.0), 0.0)
+
+    return statistic, stats.chi2.sf(statistic, dof) if dof > 0 else 1.0
+
+
 def chi_square_test(
     observed: np.ndarray,
     expected: np.ndarray = None
@@ -28,12 +56,27 @@ def chi_square_test(
     Chi-square test for independence.
 
     Args:
-        observed: Observed frequency table
+        observed: Observed frequency table (array, DataFrame, scipy.sparse
+            matrix or ContingencyTable)
         expected: Expected frequency table (optional)
 
     Returns:
         CategoricalTestResult with test statistics
     """
+    if isinstance(observed, ContingencyTable):
+        observed = observed.counts
+
+    if sparse.issparse(observed):
+        if expected is None and observed.shape != (2, 2):
+            statistic, p_value = _sparse_chi_square(observed)
+            return CategoricalTestResult(
+                statistic=float(statistic),
+                p_value=float(p_value),
+                test_name="Chi-Square",
+                reject_null=p_value < 0.05
+            )
+        observed = observed.toarray()
+
     if expected is None:
         statistic, p_value, dof, expected = stats.chi2_contingency(observed)
     else:
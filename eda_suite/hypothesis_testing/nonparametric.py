@@ -8,10 +8,11 @@ from dataclasses import dataclass
 import numpy as np
 from scipy import stats
 from typing import List
-from eda_suite.utils.validators import validate_array
+from eda_suite.utils.validators import validate_array, validate_paired
+from eda_suite.utils.results import DATACLASS_SLOTS
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class NonparametricResult:
     """Result of non-parametric test."""
 
@@ -62,8 +63,7 @@ def wilcoxon_test(
     Returns:
         NonparametricResult with test statistics
     """
-    arr1 = validate_array(before)
-    arr2 = validate_array(after)
+    arr1, arr2 = validate_paired(before, after)
 
     statistic, p_value = stats.wilcoxon(arr1, arr2)
 
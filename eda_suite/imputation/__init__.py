@@ -4,22 +4,17 @@ Data imputation module for EDA Suite.
 Provides multiple imputation strategies for missing data.
 """
 
-from eda_suite.imputation.simple import (
-    mean_imputation,
-    median_imputation,
-    mode_imputation
-)
-from eda_suite.imputation.advanced import (
-    knn_imputation,
-    iterative_imputation,
-    mice_imputation
-)
+from eda_suite._lazy import attach
 
-__all__ = [
-    "mean_imputation",
-    "median_imputation",
-    "mode_imputation",
-    "knn_imputation",
-    "iterative_imputation",
-    "mice_imputation"
-]
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "simple": [
+        "mean_imputation",
+        "median_imputation",
+        "mode_imputation"
+    ],
+    "advanced": [
+        "knn_imputation",
+        "iterative_imputation",
+        "mice_imputation"
+    ]
+})
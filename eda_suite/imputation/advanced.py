@@ -6,10 +6,13 @@ Sophisticated imputation strategies using ML algorithms.
 
 import numpy as np
 import pandas as pd
+from sklearn.experimental import enable_iterative_imputer  # noqa: F401
 from sklearn.impute import KNNImputer, IterativeImputer
+from eda_suite.utils.cache import memoize
 from eda_suite.utils.config import ImputationConfig
 
 
+@memoize
 def knn_imputation(
     data: pd.DataFrame,
     config: ImputationConfig = ImputationConfig()
@@ -33,6 +36,7 @@ def knn_imputation(
     return result
 
 
+@memoize
 def iterative_imputation(
     data: pd.DataFrame,
     config: ImputationConfig = ImputationConfig()
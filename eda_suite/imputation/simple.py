@@ -7,8 +7,10 @@ Basic statistical imputation strategies.
 import numpy as np
 import pandas as pd
 from typing import Union
+from eda_suite.utils.cache import memoize
 
 
+@memoize
 def mean_imputation(data: pd.DataFrame) -> pd.DataFrame:
     """
     Impute missing values with column means.
@@ -29,6 +31,7 @@ def mean_imputation(data: pd.DataFrame) -> pd.DataFrame:
     return result
 
 
+@memoize
 def median_imputation(data: pd.DataFrame) -> pd.DataFrame:
     """
     Impute missing values with column medians.
@@ -49,6 +52,7 @@ def median_imputation(data: pd.DataFrame) -> pd.DataFrame:
     return result
 
 
+@memoize
 def mode_imputation(data: pd.DataFrame) -> pd.DataFrame:
     """
     Impute missing values with column modes.
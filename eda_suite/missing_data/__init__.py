@@ -4,20 +4,16 @@ Missing data analysis module for EDA Suite.
 Provides tools for detecting and analyzing missing data patterns.
 """
 
-from eda_suite.missing_data.detection import (
-    missing_summary,
-    missing_heatmap_data,
-    missing_patterns
-)
-from eda_suite.missing_data.mechanisms import (
-    test_mcar,
-    analyze_mechanism
-)
+from eda_suite._lazy import attach
 
-__all__ = [
-    "missing_summary",
-    "missing_heatmap_data",
-    "missing_patterns",
-    "test_mcar",
-    "analyze_mechanism"
-]
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "detection": [
+        "missing_summary",
+        "missing_heatmap_data",
+        "missing_patterns"
+    ],
+    "mechanisms": [
+        "test_mcar",
+        "analyze_mechanism"
+    ]
+})
@@ -8,9 +8,11 @@ import numpy as np
 import pandas as pd
 from scipy import stats
 from dataclasses import dataclass
+from typing import Dict
+from eda_suite.utils.results import DATACLASS_SLOTS
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class MCARTestResult:
     """Result of MCAR test."""
 
@@ -4,18 +4,22 @@ Multivariate analysis module for EDA Suite.
 Provides tools for analyzing multiple variables simultaneously.
 """
 
-from eda_suite.multivariate.clustering import (
-    kmeans_analysis,
-    hierarchical_clustering
-)
-from eda_suite.multivariate.outliers import (
-    detect_multivariate_outliers,
-    mahalanobis_distance
-)
+from eda_suite._lazy import attach
 
-__all__ = [
-    "kmeans_analysis",
-    "hierarchical_clustering",
-    "detect_multivariate_outliers",
-    "mahalanobis_distance"
-]
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "clustering": [
+        "kmeans_analysis",
+        "kmeans_sweep",
+        "hierarchical_clustering"
+    ],
+    "outliers": [
+        "detect_multivariate_outliers",
+        "mahalanobis_distance"
+    ],
+    "projection": [
+        "detect_projection_outliers"
+    ],
+    "robust": [
+        "fast_mcd"
+    ]
+})
@@ -4,10 +4,19 @@ Clustering analysis for multivariate data.
 Implements k-means and hierarchical clustering.
 """
 
+import os
 import numpy as np
 import pandas as pd
-from sklearn.cluster import KMeans, AgglomerativeClustering
+from concurrent.futures import ProcessPoolExecutor
+from sklearn.cluster import KMeans, AgglomerativeClustering, MiniBatchKMeans
+from sklearn.metrics import pairwise_distances_argmin_min, silhouette_score
+from threadpoolctl import threadpool_limits
 from dataclasses import dataclass
+from typing import Callable, Iterator, List, Optional, Tuple
+from eda_suite.utils.cache import memoize
+from eda_suite.utils.config import MiniBatchConfig, SweepConfig
+from eda_suite.utils.sampling import row_chunks
+from eda_suite.utils.validators import is_tabular, validate_array
 
 
 @dataclass
@@ -20,20 +29,200 @@ class ClusteringResult:
     centroids: np.ndarray
 
 
+@dataclass
+class SweepResult:
+    """Cluster-quality criteria of k-means for several numbers of clusters."""
+
+    k_values: np.ndarray
+    inertia: np.ndarray
+    calinski_harabasz: np.ndarray
+    silhouette: np.ndarray
+    elbow: int
+    centroids: List[np.ndarray]
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Convert to a DataFrame with one row per number of clusters.
+
+        Returns:
+            DataFrame indexed by k with inertia, Calinski-Harabasz and
+            silhouette columns
+        """
+        return pd.DataFrame({
+            "inertia": self.inertia,
+            "calinski_harabasz": self.calinski_harabasz,
+            "silhouette": self.silhouette
+        }, index=pd.Index(self.k_values, name="k"))
+
+
+def _chunk_source(
+    data,
+    chunk_size: int
+) -> Tuple[Callable[[], Iterator], bool]:
+    """
+    Turn the input of streaming k-means into a chunk iterator factory.
+
+    Args:
+        data: Array, memory map, DataFrame or Arrow table (read in chunks
+            of ``chunk_size`` rows), function returning an iterable of
+            chunks, or an iterable of chunks
+        chunk_size: Rows per chunk for array-like input
+
+    Returns:
+        Tuple of (function returning a fresh iterator of chunks, whether
+        the input can be read more than once)
+    """
+    if isinstance(data, np.ndarray) or is_tabular(data):
+        matrix = validate_array(data)
+        return (lambda: row_chunks(matrix, chunk_size)), True
+
+    if callable(data):
+        return (lambda: iter(data())), True
+
+    if iter(data) is data:
+        return (lambda: data), False
+
+    return (lambda: iter(data)), True
+
+
+def _as_rows(chunk) -> np.ndarray:
+    """Convert one chunk to a 2-D array of rows."""
+    rows = validate_array(chunk)
+    return rows.reshape(len(rows), -1)
+
+
+def _init_rows(model: MiniBatchKMeans) -> int:
+    """Rows used to initialize the centroids (default 3 batches, at least k)."""
+    return max(model.init_size or 3 * model.batch_size, model.n_clusters)
+
+
+def _buffered_rows(chunks: Iterator, min_rows: int) -> Iterator[np.ndarray]:
+    """
+    Rows of every chunk, the leading chunks merged until the first block
+    holds at least ``min_rows`` rows (or every row, if there are fewer).
+    """
+    pending, n_pending = [], 0
+    for chunk in chunks:
+        pending.append(_as_rows(chunk))
+        n_pending += len(pending[-1])
+        if n_pending >= min_rows:
+            break
+
+    if pending:
+        yield np.concatenate(pending)
+    for chunk in chunks:
+        yield _as_rows(chunk)
+
+
+def _init_centroids(model: MiniBatchKMeans, rows: np.ndarray) -> int:
+    """
+    Initialize the centroids (k-means++) from the first rows.
+
+    Returns:
+        Number of rows used
+    """
+    if len(rows) < model.n_clusters:
+        raise ValueError(f"n_clusters={model.n_clusters} exceeds the "
+                         f"{len(rows)} rows of the data")
+
+    size = _init_rows(model)
+    model.partial_fit(rows[:size])
+    return size
+
+
+def _partial_fit_chunk(
+    model: MiniBatchKMeans,
+    rows: np.ndarray,
+    rng: np.random.Generator
+) -> None:
+    """
+    Mini-batch updates over one block of rows, in a random order; the
+    first block also initializes the centroids.
+    """
+    rows = rows[rng.permutation(len(rows))]
+    start = 0 if hasattr(model, "cluster_centers_") else _init_centroids(model, rows)
+
+    for offset in range(start, len(rows), model.batch_size):
+        model.partial_fit(rows[offset:offset + model.batch_size])
+
+
+def _assign(
+    rows: np.ndarray,
+    centroids: np.ndarray
+) -> Tuple[np.ndarray, float]:
+    """Nearest-centroid labels of a chunk and its contribution to inertia."""
+    labels, distances = pairwise_distances_argmin_min(rows, centroids)
+    return labels.astype(np.int32), float(np.dot(distances, distances))
+
+
+def _streaming_kmeans(
+    data,
+    n_clusters: int,
+    config: MiniBatchConfig
+) -> ClusteringResult:
+    """
+    Mini-batch k-means over chunks, with labels and inertia from a final
+    pass against the final centroids.
+
+    Leading chunks are buffered until k-means++ has ``init_size`` rows (at
+    least ``n_clusters``). Input that can only be read once (an iterator)
+    is fitted in one epoch and each chunk labeled right after its updates,
+    so its inertia is a progressive rather than a final-pass estimate.
+    """
+    chunks, replayable = _chunk_source(data, config.chunk_size)
+    model = MiniBatchKMeans(n_clusters=n_clusters, batch_size=config.batch_size,
+                            init_size=config.init_size, compute_labels=False,
+                            random_state=config.seed)
+    rng = np.random.default_rng(config.seed)
+    assigned = []
+
+    for _ in range(config.n_epochs if replayable else 1):
+        for rows in _buffered_rows(chunks(), _init_rows(model)):
+            _partial_fit_chunk(model, rows, rng)
+            if not replayable:
+                assigned.append(_assign(rows, model.cluster_centers_))
+
+    if not hasattr(model, "cluster_centers_"):
+        raise ValueError("Input array cannot be empty")
+
+    if replayable:
+        assigned = [_assign(_as_rows(chunk), model.cluster_centers_)
+                    for chunk in chunks()]
+
+    return ClusteringResult(
+        labels=np.concatenate([labels for labels, _ in assigned]),
+        n_clusters=n_clusters,
+        inertia=sum(inertia for _, inertia in assigned),
+        centroids=model.cluster_centers_
+    )
+
+
+@memoize
 def kmeans_analysis(
     data: np.ndarray,
-    n_clusters: int = 3
+    n_clusters: int = 3,
+    streaming: Optional[MiniBatchConfig] = None
 ) -> ClusteringResult:
     """
     Perform k-means clustering.
 
+    With ``streaming``, the data are read in chunks and clustered with
+    mini-batch updates in bounded memory: ``data`` may then also be a
+    memory map, a function returning an iterable of chunks (re-read for
+    every epoch and the final pass) or a one-shot iterator of chunks.
+    Such sources are never served from the result cache.
+
     Args:
-        data: Feature matrix
+        data: Feature matrix (or chunk source when streaming)
         n_clusters: Number of clusters
+        streaming: Mini-batch settings; None runs full-batch k-means
 
     Returns:
         ClusteringResult with cluster assignments
     """
+    if streaming is not None:
+        return _streaming_kmeans(data, n_clusters, streaming)
+
     model = KMeans(n_clusters=n_clusters, random_state=42)
     labels = model.fit_predict(data)
 
@@ -45,6 +234,180 @@ def kmeans_analysis(
     )
 
 
+def _stratified_rows(
+    labels: np.ndarray,
+    size: int,
+    rng: np.random.Generator
+) -> np.ndarray:
+    """
+    Random rows with every cluster represented in proportion to its size
+    (at least two rows per cluster when it has them).
+    """
+    if len(labels) <= size:
+        return np.arange(len(labels))
+
+    counts = np.bincount(labels)
+    quota = np.maximum(np.round(size * counts / len(labels)), np.minimum(counts, 2))
+    order = np.argsort(labels.astype(np.min_scalar_type(len(counts))), kind="stable")
+    starts = np.cumsum(counts) - counts
+
+    return np.sort(np.concatenate([
+        order[start + rng.choice(count, int(take), replace=False)]
+        for start, count, take in zip(starts, counts, quota)
+    ]))
+
+
+def _add_centroids(
+    matrix: np.ndarray,
+    centroids: np.ndarray,
+    n_clusters: int,
+    rng: np.random.Generator
+) -> np.ndarray:
+    """
+    Warm start for a larger k: keep the previous centroids and add new
+    ones by greedy k-means++ on a subset of rows (several D^2 draws per
+    new centroid, keeping the one that lowers the potential most).
+    """
+    points = matrix[np.sort(rng.choice(len(matrix), min(len(matrix), 10_000),
+                                       replace=False))]
+    squared = ((points[:, None, :] - centroids) ** 2).sum(axis=2).min(axis=1)
+    n_trials = 2 + int(np.log(n_clusters))
+
+    while len(centroids) < n_clusters:
+        total = squared.sum()
+        draws = (rng.choice(len(points), n_trials, p=squared / total) if total > 0
+                 else rng.integers(len(points), size=n_trials))
+        trials = np.minimum(squared, ((points[:, None, :] - points[draws]) ** 2).sum(axis=2).T)
+        best = int(np.argmin(trials.sum(axis=1)))
+        centroids = np.vstack([centroids, points[draws[best]]])
+        squared = trials[best]
+
+    return centroids
+
+
+def _sweep_run(task: Tuple) -> List[Tuple]:
+    """
+    Fit k-means for an increasing run of k values, each warm-started from
+    the centroids of the previous one.
+
+    Args:
+        task: Tuple of (matrix, k values, whether to warm-start,
+            silhouette sample size, seed, threads per process)
+
+    Returns:
+        List of (k, inertia, silhouette, centroids)
+    """
+    matrix, k_values, warm_start, sample_size, seed, threads = task
+    rng = np.random.default_rng(seed)
+    centroids, outcomes = None, []
+
+    with threadpool_limits(limits=threads):
+        for n_clusters in k_values:
+            if centroids is None or not warm_start:
+                model = KMeans(n_clusters=n_clusters, random_state=seed)
+            else:
+                init = _add_centroids(matrix, centroids, n_clusters, rng)
+                model = KMeans(n_clusters=n_clusters, init=init, n_init=1,
+                               random_state=seed)
+
+            labels = model.fit_predict(matrix)
+            centroids = model.cluster_centers_
+
+            rows = _stratified_rows(labels, sample_size, rng)
+            silhouette = (silhouette_score(matrix[rows], labels[rows])
+                          if len(np.unique(labels[rows])) > 1 else np.nan)
+            outcomes.append((n_clusters, float(model.inertia_), float(silhouette),
+                             centroids))
+
+    return outcomes
+
+
+def _elbow(k_values: np.ndarray, inertia: np.ndarray) -> int:
+    """
+    k farthest below the chord from the first to the last point of the
+    inertia curve, both axes scaled to [0, 1].
+    """
+    if len(k_values) < 3 or inertia[0] == inertia[-1]:
+        return int(k_values[0])
+
+    x = (k_values - k_values[0]) / (k_values[-1] - k_values[0])
+    y = (inertia - inertia[-1]) / (inertia[0] - inertia[-1])
+
+    return int(k_values[np.argmax((1 - x) - y)])
+
+
+def _sweep_outcomes(
+    matrix: np.ndarray,
+    config: SweepConfig
+) -> Tuple[np.ndarray, List[Tuple]]:
+    """
+    Cut the sorted k values into runs of roughly equal cost (proportional
+    to k) and fit them, in worker processes when ``config.n_jobs`` > 1.
+
+    Returns:
+        Tuple of (sorted k values, (k, inertia, silhouette, centroids)
+        per k)
+    """
+    ks = np.unique(np.asarray(config.k_values, dtype=np.int64))
+    if ks[-1] >= len(matrix):
+        raise ValueError("k_values must lie between 2 and the number of rows - 1")
+
+    n_jobs = min(config.n_jobs or 1, len(ks))
+    runs = np.minimum((np.cumsum(ks) - ks) * n_jobs // ks.sum(), n_jobs - 1)
+    threads = max(1, (os.cpu_count() or 1) // n_jobs)
+    tasks = [(matrix, ks[runs == run], config.warm_start, config.silhouette_sample,
+              config.seed, threads) for run in np.unique(runs)]
+
+    if n_jobs == 1:
+        outcomes = map(_sweep_run, tasks)
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            outcomes = list(executor.map(_sweep_run, tasks))
+
+    return ks, [outcome for run in outcomes for outcome in run]
+
+
+def kmeans_sweep(
+    data: np.ndarray,
+    config: SweepConfig = SweepConfig()
+) -> SweepResult:
+    """
+    Fit k-means for several numbers of clusters to choose k.
+
+    Runs of k are fitted in ``config.n_jobs`` processes; within a run each
+    k is warm-started from the previous centroids plus k-means++ draws
+    (fewer Lloyd iterations, at the risk of a worse local optimum; set
+    ``config.warm_start`` to False for independent fits). The silhouette
+    uses a cluster-stratified sample of ``config.silhouette_sample`` rows.
+
+    Args:
+        data: Feature matrix
+        config: Numbers of clusters to try, workers, silhouette sample
+            size and seed
+
+    Returns:
+        SweepResult with one entry per k and the elbow of the inertia curve
+    """
+    matrix = validate_array(data)
+    if matrix.ndim != 2:
+        raise ValueError("data must be a 2-D feature matrix")
+
+    ks, outcomes = _sweep_outcomes(matrix, config)
+    inertia = np.array([outcome[1] for outcome in outcomes])
+    total = float(((matrix - matrix.mean(axis=0)) ** 2).sum())
+    with np.errstate(invalid="ignore", divide="ignore"):
+        calinski_harabasz = ((total - inertia) / (ks - 1)) / (inertia / (len(matrix) - ks))
+
+    return SweepResult(
+        k_values=ks,
+        inertia=inertia,
+        calinski_harabasz=calinski_harabasz,
+        silhouette=np.array([outcome[2] for outcome in outcomes]),
+        elbow=_elbow(ks, inertia),
+        centroids=[outcome[3] for outcome in outcomes]
+    )
+
+
 def hierarchical_clustering(
     data: np.ndarray,
     n_clusters: int = 3
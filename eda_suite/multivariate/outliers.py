@@ -7,56 +7,98 @@ Identifies outliers using multivariate methods.
 import numpy as np
 import pandas as pd
 from scipy import stats
-from scipy.spatial.distance import mahalanobis as scipy_mahalanobis
+from typing import Tuple
+from eda_suite.bivariate.streaming import StreamingCoMoments
+from eda_suite.multivariate.robust import _row_blocks, _squared_distances, fast_mcd
+from eda_suite.utils.config import OutlierConfig
+from eda_suite.utils.validators import validate_array
+
+
+def _location_scatter(
+    matrix: np.ndarray,
+    block_size: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Mean vector and covariance matrix accumulated block by block.
+
+    Rows with any NaN are left out of the estimates.
+
+    Args:
+        matrix: (n, p) array (may be a memory map)
+        block_size: Rows read per block
+
+    Returns:
+        Tuple of (mean, covariance) in float64
+    """
+    moments = StreamingCoMoments()
+    for rows in _row_blocks(matrix.shape[0], block_size):
+        moments.update(matrix[rows])
+
+    return moments.mean, moments.covariance()
 
 
 def mahalanobis_distance(
     data: np.ndarray,
-    robust: bool = False
+    config: OutlierConfig = OutlierConfig()
 ) -> np.ndarray:
     """
     Compute Mahalanobis distance for each observation.
 
+    Mean and covariance are accumulated in one pass and the distances
+    computed in a second, both over blocks of ``config.block_size`` rows,
+    so memory-mapped input is never loaded whole.
+
     Args:
-        data: Feature matrix
-        robust: Use robust estimates
+        data: Feature matrix (float32 input gives float32 distances)
+        config: Rows per block, and whether to use robust estimates
+            (FastMCD location and scatter with ``config.mcd``, so that
+            the outliers cannot mask themselves)
 
     Returns:
         Array of Mahalanobis distances
     """
-    mean = np.mean(data, axis=0)
-    cov = np.cov(data, rowvar=False)
-
-    inv_cov = np.linalg.inv(cov)
-    distances = []
+    matrix = validate_array(data)
+    if matrix.ndim != 2:
+        raise ValueError("data must be a 2-D feature matrix")
 
-    for obs in data:
-        dist = scipy_mahalanobis(obs, mean, inv_cov)
-        distances.append(dist)
+    if config.robust:
+        fit = fast_mcd(matrix, config.mcd)
+        location, scatter = fit.location, fit.covariance
+    else:
+        location, scatter = _location_scatter(matrix, config.block_size)
 
-    return np.array(distances)
+    return np.sqrt(_squared_distances(matrix, location, scatter, config.block_size))
 
 
 def detect_multivariate_outliers(
     data: np.ndarray,
-    threshold: float = 3.0
+    config: OutlierConfig = OutlierConfig()
 ) -> dict:
     """
     Detect multivariate outliers using Mahalanobis distance.
 
     Args:
         data: Feature matrix
-        threshold: Distance threshold for outliers
+        config: Distance threshold (default: square root of the
+            ``config.mcd.quantile`` chi-square quantile with p degrees of
+            freedom), robust estimates, rows per block and FastMCD
+            settings
 
     Returns:
         Dictionary with outlier information
     """
-    distances = mahalanobis_distance(data)
+    distances = mahalanobis_distance(data, config)
+    threshold = config.threshold
+    if threshold is None:
+        n_features = validate_array(data).shape[1]
+        threshold = float(np.sqrt(stats.chi2.ppf(config.mcd.quantile, n_features)))
+
     outliers = distances > threshold
 
     return {
         "distances": distances,
         "outlier_indices": np.where(outliers)[0],
         "n_outliers": int(np.sum(outliers)),
-        "outlier_percentage": float(np.mean(outliers) * 100)
+        "outlier_percentage": float(np.mean(outliers) * 100),
+        "threshold": threshold
     }
@@ -0,0 +1,264 @@
+"""
+Projection-pursuit outlier detection.
+
+Searches for the one-dimensional projection of the data that best exposes
+outliers (largest kurtosis, absolute skewness or variance) and flags the
+observations outside the boxplot fences of that projection, after
+iterative IQR trimming. Candidate directions are generated and scored in
+blocks, one matrix product per block of rows and directions, so memory
+stays bounded however many rows and directions there are.
+"""
+
+import numpy as np
+from scipy import stats
+from scipy.stats import qmc
+from dataclasses import dataclass
+from typing import Callable, Iterator, Tuple
+from eda_suite.multivariate.robust import _row_blocks
+from eda_suite.utils.config import ProjectionConfig
+from eda_suite.utils.validators import validate_array
+
+BLOCK_CELLS = 1 << 21
+
+
+@dataclass
+class _Pursuit:
+    """Data and settings shared by the projection-pursuit stages."""
+
+    matrix: np.ndarray
+    complete: np.ndarray
+    location: np.ndarray
+    config: ProjectionConfig
+
+    @property
+    def block_rows(self) -> int:
+        """Rows per block for a product against one direction per column."""
+        return max(1, BLOCK_CELLS // self.matrix.shape[1])
+
+
+def _prepare(data: np.ndarray, config: ProjectionConfig) -> _Pursuit:
+    """
+    Validate the data and find the rows without NaN and their mean,
+    accumulated block by block.
+    """
+    matrix = validate_array(data)
+    if matrix.ndim != 2:
+        raise ValueError("data must be a 2-D feature matrix")
+
+    block_rows = max(1, BLOCK_CELLS // matrix.shape[1])
+    complete = np.empty(matrix.shape[0], dtype=bool)
+    total = np.zeros(matrix.shape[1])
+
+    for rows in _row_blocks(matrix.shape[0], block_rows):
+        block = np.asarray(matrix[rows], dtype=np.float64)
+        complete[rows] = ~np.isnan(block).any(axis=1)
+        total += block[complete[rows]].sum(axis=0)
+
+    n_complete = int(complete.sum())
+    if n_complete < 4:
+        raise ValueError("Projection pursuit needs at least 4 complete rows")
+
+    return _Pursuit(matrix, complete, total / n_complete, config)
+
+
+def _direction_source(
+    state: _Pursuit,
+    rng: np.random.Generator
+) -> Tuple[int, Callable[[int, int], np.ndarray]]:
+    """
+    Number of candidate directions and a function drawing ``count`` of
+    them (unnormalized) starting at index ``start``.
+
+    "random" directions are Gaussian vectors. "spherical" directions sweep
+    the half circle at equal angles in two dimensions and map a scrambled
+    Halton sequence onto the sphere in more. "data" directions point from
+    the mean to a random subset of the observations.
+    """
+    config, n_cols = state.config, state.matrix.shape[1]
+    total = config.n_directions
+
+    if config.directions == "random":
+        return total, lambda start, count: rng.standard_normal((count, n_cols))
+
+    if config.directions == "data":
+        observations = np.flatnonzero(state.complete)
+        if len(observations) > total:
+            observations = np.sort(rng.choice(observations, total, replace=False))
+        return len(observations), lambda start, count: (
+            np.asarray(state.matrix[observations[start:start + count]],
+                       dtype=np.float64) - state.location)
+
+    if n_cols == 2:
+        def half_circle(start, count):
+            angles = np.pi * np.arange(start, start + count) / total
+            return np.column_stack([np.cos(angles), np.sin(angles)])
+        return total, half_circle
+
+    halton = qmc.Halton(d=n_cols, scramble=True, seed=rng)
+    return total, lambda start, count: stats.norm.ppf(
+        np.clip(halton.random(count), 1e-12, 1 - 1e-12))
+
+
+def _direction_blocks(state: _Pursuit) -> Iterator[np.ndarray]:
+    """Yield blocks of at most ``config.direction_block`` unit directions."""
+    rng = np.random.default_rng(state.config.seed)
+    total, draw = _direction_source(state, rng)
+
+    for start in range(0, total, state.config.direction_block):
+        block = draw(start, min(state.config.direction_block, total - start))
+        norms = np.linalg.norm(block, axis=1)
+        nonzero = norms > 0
+        yield block[nonzero] / norms[nonzero, None]
+
+
+def _power_sums(
+    state: _Pursuit,
+    directions: np.ndarray,
+    power: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Second and ``power``-th central power sums of the projections of the
+    complete rows on each direction, one matrix product per block of rows.
+    """
+    block_rows = max(1, BLOCK_CELLS // len(directions))
+    second = np.zeros(len(directions))
+    higher = np.zeros(len(directions))
+
+    for rows in _row_blocks(state.matrix.shape[0], block_rows):
+        block = np.asarray(state.matrix[rows], dtype=np.float64)[state.complete[rows]]
+        projected = (block - state.location) @ directions.T
+        if power == 3:
+            squared = projected * projected
+            higher += np.einsum("ij,ij->j", squared, projected)
+        else:
+            squared = np.multiply(projected, projected, out=projected)
+            if power == 4:
+                higher += np.einsum("ij,ij->j", squared, squared)
+        second += squared.sum(axis=0)
+
+    return second, higher
+
+
+def _projection_scores(state: _Pursuit, directions: np.ndarray) -> np.ndarray:
+    """
+    Criterion of the projections of the complete rows on each direction.
+
+    Returns:
+        (k,) array of kurtosis, absolute skewness or variance (NaN for a
+        constant projection)
+    """
+    power = {"variance": 2, "skewness": 3, "kurtosis": 4}[state.config.criterion]
+    second, higher = _power_sums(state, directions, power)
+
+    n_complete = state.complete.sum()
+    variance = second / n_complete
+    if power == 2:
+        return variance
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.abs(higher / n_complete) / variance ** (power / 2)
+
+
+def _best_direction(state: _Pursuit) -> Tuple[float, np.ndarray]:
+    """
+    Highest-scoring candidate direction.
+
+    Returns:
+        Tuple of (score, unit direction)
+    """
+    best_score, best_direction = -np.inf, None
+    for directions in _direction_blocks(state):
+        if len(directions) == 0:
+            continue
+
+        scores = _projection_scores(state, directions)
+        scores = np.where(np.isnan(scores), -np.inf, scores)
+        top = int(np.argmax(scores))
+        if best_direction is None or scores[top] > best_score:
+            best_score, best_direction = scores[top], directions[top]
+
+    if best_direction is None:
+        raise ValueError("No candidate direction has nonzero length")
+
+    return float(best_score), best_direction
+
+
+def _trimmed_fences(
+    values: np.ndarray,
+    config: ProjectionConfig
+) -> Tuple[float, float]:
+    """
+    Boxplot fences of a projection after iterative IQR trimming.
+
+    Values outside the fences are dropped and the fences recomputed until
+    none remain outside or ``config.max_trim`` of the values has been
+    dropped (the farthest from the median first), so that a cluster of
+    outliers cannot widen the IQR that is meant to expose it.
+
+    Returns:
+        Tuple of (lower fence, upper fence)
+    """
+    ordered = np.sort(values)
+    low, high = 0, len(ordered)
+    keep = int(np.ceil((1 - config.max_trim) * len(ordered)))
+
+    while True:
+        q1, median, q3 = np.quantile(ordered[low:high], [0.25, 0.5, 0.75])
+        spread = config.whisker * (q3 - q1)
+        lower, upper = q1 - spread, q3 + spread
+
+        new_low = max(low, int(np.searchsorted(ordered, lower, side="left")))
+        new_high = min(high, int(np.searchsorted(ordered, upper, side="right")))
+        if (new_low, new_high) == (low, high) or high - low <= keep:
+            return float(lower), float(upper)
+
+        budget = high - low - keep
+        if (new_low - low) + (high - new_high) > budget:
+            deviation = np.concatenate([median - ordered[low:new_low],
+                                        ordered[new_high:high][::-1] - median])
+            dropped = np.argpartition(-deviation, budget - 1)[:budget]
+            n_low = int(np.sum(dropped < new_low - low))
+            new_low, new_high = low + n_low, high - (budget - n_low)
+
+        low, high = new_low, new_high
+
+
+def detect_projection_outliers(
+    data: np.ndarray,
+    config: ProjectionConfig = ProjectionConfig()
+) -> dict:
+    """
+    Detect multivariate outliers by projection pursuit.
+
+    Every candidate direction is scored by the kurtosis, absolute skewness
+    or variance of the data projected on it; the data are projected on the
+    best direction and observations outside its boxplot fences (computed
+    after iterative IQR trimming) are outliers. Rows with NaN are ignored.
+
+    Args:
+        data: Feature matrix (may be a memory map)
+        config: Criterion, direction generator and count, fences and seed
+
+    Returns:
+        Dictionary with outlier information, the best direction and the
+        projection on it
+    """
+    state = _prepare(data, config)
+    score, direction = _best_direction(state)
+
+    projection = np.empty(state.matrix.shape[0])
+    for rows in _row_blocks(state.matrix.shape[0], state.block_rows):
+        projection[rows] = np.asarray(state.matrix[rows], dtype=np.float64) @ direction
+
+    lower, upper = _trimmed_fences(projection[state.complete], config)
+    outliers = (projection < lower) | (projection > upper)
+
+    return {
+        "projection": projection,
+        "direction": direction,
+        "score": score,
+        "fences": (lower, upper),
+        "outlier_indices": np.where(outliers)[0],
+        "n_outliers": int(np.sum(outliers)),
+        "outlier_percentage": float(np.mean(outliers) * 100)
+    }
@@ -0,0 +1,341 @@
+"""
+Robust location and scatter.
+
+FastMCD (Rousseeuw & Van Driessen, 1999) estimate of the Minimum Covariance
+Determinant: the mean and covariance of the h observations whose
+covariance has the smallest determinant. Random elemental starts are
+refined with concentration steps (C-steps) on small nested subsets, the
+best candidates are carried up to the full data, and the raw estimate is
+consistency-corrected and reweighted.
+"""
+
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from scipy import stats
+from scipy.linalg import cholesky, solve_triangular
+from typing import Iterator, List, Optional, Tuple
+from eda_suite.utils.config import RobustConfig
+from eda_suite.utils.validators import validate_array
+
+BLOCK_ROWS = 65536
+N_BEST = 10
+
+Candidate = Tuple[float, np.ndarray, np.ndarray]
+
+
+@dataclass
+class MCDResult:
+    """Robust location and scatter with the observations supporting them."""
+
+    location: np.ndarray
+    covariance: np.ndarray
+    raw_location: np.ndarray
+    raw_covariance: np.ndarray
+    support: np.ndarray
+
+
+def _row_blocks(n_rows: int, block_size: int) -> Iterator[slice]:
+    """Yield consecutive row slices of at most ``block_size`` rows."""
+    for start in range(0, n_rows, block_size):
+        yield slice(start, min(start + block_size, n_rows))
+
+
+def _whitening(scatter: np.ndarray) -> np.ndarray:
+    """
+    Matrix W with W^T W equal to the (pseudo-)inverse of ``scatter``.
+
+    The scatter matrix is factored once as L L^T and W = L^-1 comes from
+    one triangular solve against the identity. A singular scatter matrix
+    (e.g. fewer rows than features) falls back to its pseudo-inverse
+    square root on the non-null eigenspace.
+    """
+    try:
+        factor = cholesky(scatter, lower=True)
+        return solve_triangular(factor, np.eye(len(factor)), lower=True)
+    except np.linalg.LinAlgError:
+        eigenvalues, eigenvectors = np.linalg.eigh(scatter)
+        keep = eigenvalues > eigenvalues.max() * len(eigenvalues) * 1e-12
+        return (eigenvectors[:, keep] / np.sqrt(eigenvalues[keep])).T
+
+
+def _squared_distances(
+    matrix: np.ndarray,
+    location: np.ndarray,
+    scatter: np.ndarray,
+    block_size: int = BLOCK_ROWS
+) -> np.ndarray:
+    """
+    Squared Mahalanobis distances of all rows from one Cholesky factor.
+
+    Each block of rows is whitened with one matrix product against the
+    inverse Cholesky factor and scored as its squared row norms. float32
+    input is scored in float32.
+
+    Args:
+        matrix: (n, p) array (may be a memory map)
+        location: Center (p,)
+        scatter: Positive (semi-)definite (p, p) scatter matrix
+        block_size: Rows scored per block
+
+    Returns:
+        (n,) array of squared distances (NaN for rows with NaN)
+    """
+    dtype = np.float32 if matrix.dtype == np.float32 else np.float64
+    whitening = _whitening(scatter).T.astype(dtype)
+    location = np.asarray(location, dtype=dtype)
+    squared = np.empty(matrix.shape[0], dtype=dtype)
+
+    for rows in _row_blocks(matrix.shape[0], block_size):
+        whitened = (matrix[rows] - location) @ whitening
+        squared[rows] = np.einsum("ij,ij->i", whitened, whitened)
+
+    return squared
+
+
+def _mean_scatter(matrix: np.ndarray) -> Candidate:
+    """
+    Fit location and scatter to a set of rows.
+
+    Returns:
+        Tuple of (log-determinant, mean, covariance with ddof=0); the
+        log-determinant is -inf for a singular covariance
+    """
+    location = matrix.mean(axis=0)
+    centered = matrix - location
+    scatter = centered.T @ centered / matrix.shape[0]
+    sign, logdet = np.linalg.slogdet(scatter)
+
+    return (logdet if sign > 0 else -np.inf), location, scatter
+
+
+def _c_steps(
+    matrix: np.ndarray,
+    candidate: Candidate,
+    h: int,
+    max_steps: int
+) -> Candidate:
+    """
+    Concentration steps: refit to the h rows closest to the current fit.
+
+    Each step cannot increase the determinant; iteration stops when it no
+    longer decreases, on an exact fit, or after ``max_steps`` steps.
+    """
+    for _ in range(max_steps):
+        logdet, location, scatter = candidate
+        if logdet == -np.inf:
+            break
+
+        distances = _squared_distances(matrix, location, scatter)
+        closest = np.argpartition(distances, h - 1)[:h]
+        candidate = _mean_scatter(matrix[closest])
+
+        if candidate[0] >= logdet - 1e-10:
+            break
+
+    return candidate
+
+
+def _elemental_start(matrix: np.ndarray, rng: np.random.Generator) -> Candidate:
+    """Fit a random (p + 1)-subset, enlarged until its scatter is nonsingular."""
+    n_rows, n_cols = matrix.shape
+    order = rng.permutation(n_rows)
+    size = n_cols + 1
+    candidate = _mean_scatter(matrix[order[:size]])
+
+    while candidate[0] == -np.inf and size < n_rows:
+        size += 1
+        candidate = _mean_scatter(matrix[order[:size]])
+
+    return candidate
+
+
+def _best(candidates: List[Candidate], count: int) -> List[Candidate]:
+    """The ``count`` candidates with the smallest determinants."""
+    return sorted(candidates, key=lambda candidate: candidate[0])[:count]
+
+
+def _subset_candidates(task: Tuple) -> List[Candidate]:
+    """
+    Random starts on one subset, each refined with two C-steps.
+
+    Args:
+        task: Tuple of (subset rows, h for the subset, number of starts,
+            seed)
+
+    Returns:
+        The best ``N_BEST`` candidates
+    """
+    matrix, h, n_starts, seed = task
+    rng = np.random.default_rng(seed)
+
+    return _best([
+        _c_steps(matrix, _elemental_start(matrix, rng), h, 2)
+        for _ in range(n_starts)
+    ], N_BEST)
+
+
+def _refine(
+    matrix: np.ndarray,
+    candidates: List[Candidate],
+    h: int,
+    max_steps: int,
+    n_jobs: Optional[int]
+) -> List[Candidate]:
+    """C-steps for several candidates on the same rows, on worker threads."""
+    def refine(candidate):
+        return _c_steps(matrix, candidate, h, max_steps)
+
+    if n_jobs is None or n_jobs == 1:
+        return _best(list(map(refine, candidates)), N_BEST)
+
+    with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+        return _best(list(executor.map(refine, candidates)), N_BEST)
+
+
+def _complete_rows(data: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Validated float64 rows without NaN.
+
+    Returns:
+        Tuple of (complete rows, mask of the complete rows in ``data``)
+    """
+    matrix = validate_array(data)
+    if matrix.ndim != 2:
+        raise ValueError("data must be a 2-D feature matrix")
+
+    complete = ~np.isnan(matrix).any(axis=1)
+    rows = (matrix if complete.all() else matrix[complete]).astype(np.float64,
+                                                                   copy=False)
+    if rows.shape[0] <= rows.shape[1] + 1:
+        raise ValueError("FastMCD needs more observations than features")
+
+    return rows, complete
+
+
+def _support_size(shape: Tuple[int, int], fraction: Optional[float]) -> int:
+    """Number h of observations in the MCD support."""
+    n_rows, n_cols = shape
+    h = (n_rows + n_cols + 1) // 2 if fraction is None else int(np.ceil(fraction * n_rows))
+    return min(max(h, n_cols + 1), n_rows)
+
+
+def _start_tasks(
+    rows: np.ndarray,
+    h: int,
+    config: RobustConfig
+) -> Tuple[List[Tuple], Optional[np.ndarray]]:
+    """
+    Split the random starts into ``config.n_subsets`` tasks.
+
+    Above ``config.max_subset`` rows each task covers one disjoint subset
+    of a random merged set; otherwise every task covers all rows.
+
+    Returns:
+        Tuple of (tasks for ``_subset_candidates``, merged row indices or
+        None)
+    """
+    n_rows = len(rows)
+    seeds = np.random.SeedSequence(config.seed).spawn(config.n_subsets + 1)
+    starts = max(1, config.n_starts // config.n_subsets)
+
+    if n_rows <= config.max_subset:
+        return [(rows, h, starts, seed) for seed in seeds[:-1]], None
+
+    rng = np.random.default_rng(seeds[-1])
+    merged = np.sort(rng.choice(n_rows, config.max_subset, replace=False))
+    parts = np.array_split(merged, config.n_subsets)
+
+    return [(rows[part], int(np.ceil(len(part) * h / n_rows)), starts, seed)
+            for part, seed in zip(parts, seeds)], merged
+
+
+def _raw_estimate(rows: np.ndarray, h: int, config: RobustConfig) -> Candidate:
+    """
+    Raw MCD fit: random starts (in ``config.n_jobs`` worker processes),
+    refined on the merged set when there is one, then on all rows until
+    convergence.
+    """
+    tasks, merged = _start_tasks(rows, h, config)
+    if config.n_jobs is None or config.n_jobs == 1:
+        found = map(_subset_candidates, tasks)
+    else:
+        with ProcessPoolExecutor(max_workers=config.n_jobs) as executor:
+            found = list(executor.map(_subset_candidates, tasks))
+    pool = [candidate for part in found for candidate in part]
+
+    if merged is None:
+        candidates = _best(pool, N_BEST)
+    else:
+        h_merged = int(np.ceil(len(merged) * h / len(rows)))
+        candidates = _refine(rows[merged], _best(pool, 5 * N_BEST), h_merged, 2,
+                             config.n_jobs)
+        candidates = _refine(rows, candidates, h, 2, config.n_jobs)[:1]
+
+    return _refine(rows, candidates, h, 100, config.n_jobs)[0]
+
+
+def _reweight(
+    rows: np.ndarray,
+    raw: Candidate,
+    quantile: float
+) -> Tuple[Candidate, np.ndarray, np.ndarray]:
+    """
+    Consistency-correct the raw fit and refit on the rows within the
+    ``quantile`` chi-square cutoff.
+
+    Returns:
+        Tuple of (reweighted fit, corrected raw scatter, inlier mask)
+    """
+    _, raw_location, raw_scatter = raw
+    n_cols = rows.shape[1]
+
+    distances = _squared_distances(rows, raw_location, raw_scatter)
+    correction = np.median(distances) / stats.chi2.ppf(0.5, n_cols)
+    if correction > 0:
+        distances /= correction
+        raw_scatter = raw_scatter * correction
+
+    inliers = distances <= stats.chi2.ppf(quantile, n_cols)
+    return _mean_scatter(rows[inliers]), raw_scatter, inliers
+
+
+def fast_mcd(
+    data: np.ndarray,
+    config: RobustConfig = RobustConfig()
+) -> MCDResult:
+    """
+    Minimum Covariance Determinant location and scatter (FastMCD).
+
+    Random starts run as ``config.n_subsets`` tasks in ``config.n_jobs``
+    worker processes: on disjoint subsets of a random merged set when
+    there are more than ``config.max_subset`` rows (the best candidates
+    are then refined on the merged set), on all rows otherwise. The best
+    candidates are refined on the full data with C-steps until
+    convergence. The raw estimate is scaled for consistency at the normal
+    model and reweighted on the observations within the
+    ``config.quantile`` chi-square quantile. Rows with NaN are ignored.
+
+    Args:
+        data: (n, p) feature matrix
+        config: Support fraction, starts, subsets, cutoff, workers and seed
+
+    Returns:
+        MCDResult with reweighted and raw estimates and the support mask
+    """
+    rows, complete = _complete_rows(data)
+    h = _support_size(rows.shape, config.support_fraction)
+    raw = _raw_estimate(rows, h, config)
+    (_, location, covariance), raw_scatter, inliers = _reweight(rows, raw,
+                                                                config.quantile)
+
+    support = np.zeros(len(complete), dtype=bool)
+    support[np.flatnonzero(complete)[inliers]] = True
+
+    return MCDResult(
+        location=location,
+        covariance=covariance,
+        raw_location=raw[1],
+        raw_covariance=raw_scatter,
+        support=support
+    )
@@ -4,32 +4,26 @@ Statistical tests module for EDA Suite.
 Provides normality, variance, and correlation tests.
 """
 
-from eda_suite.statistical_tests.normality import (
-    shapiro_test,
-    anderson_test,
-    jarque_bera_test,
-    kolmogorov_smirnov_test
-)
-from eda_suite.statistical_tests.variance import (
-    levene_test,
-    bartlett_test,
-    fligner_test
-)
-from eda_suite.statistical_tests.correlation import (
-    pearson_test,
-    spearman_test,
-    kendall_test
-)
+from eda_suite._lazy import attach
 
-__all__ = [
-    "shapiro_test",
-    "anderson_test",
-    "jarque_bera_test",
-    "kolmogorov_smirnov_test",
-    "levene_test",
-    "bartlett_test",
-    "fligner_test",
-    "pearson_test",
-    "spearman_test",
-    "kendall_test"
-]
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "normality": [
+        "shapiro_test",
+        "anderson_test",
+        "jarque_bera_test",
+        "kolmogorov_smirnov_test"
+    ],
+    "variance": [
+        "levene_test",
+        "bartlett_test",
+        "fligner_test"
+    ],
+    "correlation": [
+        "pearson_test",
+        "approximate_pearson_test",
+        "spearman_test",
+        "kendall_test",
+        "spearman_matrix",
+        "kendall_matrix"
+    ]
+})
@@ -4,35 +4,143 @@ Correlation tests for relationship analysis.
 Implements parametric and non-parametric correlation tests.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from typing import Iterator, Optional, Tuple, Union
 import numpy as np
+import pandas as pd
 from scipy import stats
-from eda_suite.utils.validators import validate_array
+from eda_suite.bivariate.association import (
+    CorrelationMatrix,
+    _correlation_p_values,
+    _pearson_complete
+)
+from eda_suite.univariate.columnar import _as_matrix
+from eda_suite.utils.config import ApproxConfig
+from eda_suite.utils.results import DATACLASS_SLOTS
+from eda_suite.utils.sampling import (
+    bootstrap_interval,
+    draw_paired_sample,
+    fisher_interval
+)
+from eda_suite.utils.validators import validate_paired
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CorrelationResult:
-    """Result of correlation test."""
+    """
+    Result of correlation test.
+
+    Fields are scalars for two 1-D inputs and arrays for batched inputs
+    (``ResultTable.from_result`` turns the latter into one row per pair).
+    ``ci_low`` and ``ci_high`` bound the coefficient when it was estimated
+    from a sample (``approximate_pearson_test``).
+    """
+
+    coefficient: Union[float, np.ndarray]
+    p_value: Union[float, np.ndarray]
+    test_name: str
+    is_significant: Union[bool, np.ndarray]
+    ci_low: Union[None, float, np.ndarray] = None
+    ci_high: Union[None, float, np.ndarray] = None
+
+
+def _column_pairs(
+    x: np.ndarray,
+    y: np.ndarray
+) -> Optional[Tuple[np.ndarray, np.ndarray, Tuple[int, ...]]]:
+    """
+    Validate batched inputs as column matrices.
+
+    Args:
+        x: Array of shape (n,) or (n, k)
+        y: Array of shape (n,) or (n, m)
+
+    Returns:
+        Tuple of (x as (n, k), y as (n, m), result shape), where the result
+        shape drops the axis of any 1-D input; None when both are 1-D
+    """
+    x_arr, y_arr = validate_paired(x, y)
+
+    if x_arr.ndim == 1 and y_arr.ndim == 1:
+        return None
+
+    if x_arr.ndim > 2 or y_arr.ndim > 2:
+        raise ValueError("Inputs must be 1-D or 2-D")
+
+    if x_arr.shape[0] != y_arr.shape[0]:
+        raise ValueError("x and y must have the same number of rows")
+
+    shape = x_arr.shape[1:] + y_arr.shape[1:]
+    x_cols = x_arr.reshape(x_arr.shape[0], -1).astype(np.float64, copy=False)
+    y_cols = y_arr.reshape(y_arr.shape[0], -1).astype(np.float64, copy=False)
+
+    return x_cols, y_cols, shape
+
 
-    coefficient: float
-    p_value: float
+def _batched_result(
+    coefficients: np.ndarray,
+    p_values: np.ndarray,
+    shape: Tuple[int, ...],
     test_name: str
-    is_significant: bool
+) -> CorrelationResult:
+    """Wrap (k, m) coefficient and p-value arrays in a CorrelationResult."""
+    coefficients = coefficients.reshape(shape)
+    p_values = p_values.reshape(shape)
+
+    return CorrelationResult(
+        coefficient=coefficients,
+        p_value=p_values,
+        test_name=test_name,
+        is_significant=p_values < 0.05
+    )
+
+
+def _column_blocks(
+    shape: Tuple[int, int],
+    max_elements: int = 1 << 22
+) -> Iterator[slice]:
+    """Yield column slices holding at most ``max_elements`` entries each."""
+    step = max(1, max_elements // max(shape[0], 1))
+    for start in range(0, shape[1], step):
+        yield slice(start, start + step)
+
+
+def _mask_missing(
+    coefficients: np.ndarray,
+    p_values: np.ndarray,
+    columns: Tuple[np.ndarray, np.ndarray]
+) -> None:
+    """Set results to NaN in place for column pairs containing NaNs."""
+    x_cols, y_cols = columns
+    invalid = np.isnan(x_cols).any(axis=0)[:, None] | np.isnan(y_cols).any(axis=0)
+    coefficients[invalid] = np.nan
+    p_values[invalid] = np.nan
 
 
 def pearson_test(x: np.ndarray, y: np.ndarray) -> CorrelationResult:
     """
     Pearson correlation coefficient test.
 
+    Either input may be 2-D: every column of ``x`` is tested against every
+    column of ``y`` in one matrix product, and the result holds arrays of
+    shape (k, m) (or (m,) / (k,) when one input is 1-D).
+
     Args:
-        x: First variable
-        y: Second variable
+        x: First variable, shape (n,) or (n, k)
+        y: Second variable, shape (n,) or (n, m)
 
     Returns:
         CorrelationResult with test statistics
     """
-    x_arr = validate_array(x)
-    y_arr = validate_array(y)
+    batched = _column_pairs(x, y)
+    if batched is not None:
+        x_cols, y_cols, shape = batched
+        coefficients = _pearson_complete(x_cols, y_cols)
+        p_values = _correlation_p_values(coefficients, x_cols.shape[0])
+        return _batched_result(coefficients, p_values, shape, "Pearson")
+
+    x_arr, y_arr = validate_paired(x, y)
 
     coefficient, p_value = stats.pearsonr(x_arr, y_arr)
 
@@ -44,19 +152,70 @@ def pearson_test(x: np.ndarray, y: np.ndarray) -> CorrelationResult:
     )
 
 
+def approximate_pearson_test(
+    arrays: Tuple[np.ndarray, ...],
+    approx: ApproxConfig
+) -> CorrelationResult:
+    """
+    Pearson test on a reservoir sample drawn in one pass over the rows.
+
+    The p-value refers to the sample; ``ci_low`` and ``ci_high`` bound the
+    coefficient of the full data.
+
+    Args:
+        arrays: Tuple of (x, y) as for ``pearson_test``, or (x, y, strata)
+            to sample proportionally per stratum
+        approx: Sample size (or target error), interval type and seed
+
+    Returns:
+        CorrelationResult with test statistics and confidence bounds
+    """
+    x_sample, y_sample = draw_paired_sample(arrays, approx)
+    result = pearson_test(x_sample, y_sample)
+
+    if approx.interval == "bootstrap":
+        low, high = bootstrap_interval(
+            lambda xs, ys: pearson_test(xs, ys).coefficient,
+            [x_sample, y_sample], approx
+        )
+    else:
+        low, high = fisher_interval(result.coefficient, len(x_sample),
+                                    approx.confidence)
+
+    scalar = np.ndim(result.coefficient) == 0
+    result.ci_low = float(low) if scalar else low
+    result.ci_high = float(high) if scalar else high
+
+    return result
+
+
 def spearman_test(x: np.ndarray, y: np.ndarray) -> CorrelationResult:
     """
     Spearman rank correlation coefficient test.
 
+    Batched like ``pearson_test``: every column is ranked once and the
+    coefficients are one Pearson product of the ranks.
+
     Args:
-        x: First variable
-        y: Second variable
+        x: First variable, shape (n,) or (n, k)
+        y: Second variable, shape (n,) or (n, m)
 
     Returns:
         CorrelationResult with test statistics
     """
-    x_arr = validate_array(x)
-    y_arr = validate_array(y)
+    batched = _column_pairs(x, y)
+    if batched is not None:
+        x_cols, y_cols, shape = batched
+        x_ranks = _column_ranks(x_cols)
+        coefficients = np.hstack([
+            _pearson_complete(x_ranks, _column_ranks(y_cols[:, cols]))
+            for cols in _column_blocks(y_cols.shape)
+        ])
+        p_values = _correlation_p_values(coefficients, x_cols.shape[0])
+        _mask_missing(coefficients, p_values, (x_cols, y_cols))
+        return _batched_result(coefficients, p_values, shape, "Spearman")
+
+    x_arr, y_arr = validate_paired(x, y)
 
     coefficient, p_value = stats.spearmanr(x_arr, y_arr)
 
@@ -72,15 +231,35 @@ def kendall_test(x: np.ndarray, y: np.ndarray) -> CorrelationResult:
     """
     Kendall tau correlation coefficient test.
 
+    Batched like ``pearson_test``: each column of ``x`` is compared with all
+    columns of ``y`` in one vectorized merge-sort pass. Batched p-values use
+    the asymptotic normal approximation.
+
     Args:
-        x: First variable
-        y: Second variable
+        x: First variable, shape (n,) or (n, k)
+        y: Second variable, shape (n,) or (n, m)
 
     Returns:
         CorrelationResult with test statistics
     """
-    x_arr = validate_array(x)
-    y_arr = validate_array(y)
+    batched = _column_pairs(x, y)
+    if batched is not None:
+        x_cols, y_cols, shape = batched
+        x_ranks, x_ties = _dense_ranks(x_cols)
+        coefficients = np.empty((x_cols.shape[1], y_cols.shape[1]))
+        p_values = np.empty_like(coefficients)
+
+        for cols in _column_blocks(y_cols.shape):
+            others = _dense_ranks(y_cols[:, cols])
+            for index in range(x_cols.shape[1]):
+                coefficients[index, cols], p_values[index, cols] = _kendall_against(
+                    (x_ranks[:, index], x_ties[index]), others
+                )
+
+        _mask_missing(coefficients, p_values, (x_cols, y_cols))
+        return _batched_result(coefficients, p_values, shape, "Kendall")
+
+    x_arr, y_arr = validate_paired(x, y)
 
     coefficient, p_value = stats.kendalltau(x_arr, y_arr)
 
@@ -90,3 +269,292 @@ def kendall_test(x: np.ndarray, y: np.ndarray) -> CorrelationResult:
         test_name="Kendall",
         is_significant=p_value < 0.05
     )
+
+
+def _complete_rows(
+    data: Union[pd.DataFrame, np.ndarray]
+) -> Tuple[np.ndarray, list]:
+    """Numeric matrix with incomplete rows dropped, plus column labels."""
+    matrix, variables = _as_matrix(data)
+    incomplete = np.isnan(matrix).any(axis=1)
+
+    return (matrix[~incomplete] if incomplete.any() else matrix), variables
+
+
+def spearman_matrix(data: Union[pd.DataFrame, np.ndarray]) -> CorrelationMatrix:
+    """
+    Spearman rank correlations between every pair of columns.
+
+    Each column is ranked once; the coefficients are the Pearson matrix of
+    the ranks and p-values use the same t approximation as
+    ``scipy.stats.spearmanr``. Rows with any NaN are dropped.
+
+    Args:
+        data: DataFrame with numeric variables (or 2-D array)
+
+    Returns:
+        CorrelationMatrix with coefficients and p-values
+    """
+    matrix, variables = _complete_rows(data)
+    ranks = _column_ranks(matrix)
+
+    corr = _pearson_complete(ranks)
+    n_obs = np.full(corr.shape, matrix.shape[0])
+    p_values = _correlation_p_values(corr, n_obs)
+    np.fill_diagonal(corr, 1.0)
+    np.fill_diagonal(p_values, 0.0)
+
+    return CorrelationMatrix(
+        correlation=corr,
+        p_values=p_values,
+        variables=variables,
+        n_obs=n_obs
+    )
+
+
+def _tie_sums(ranks: np.ndarray) -> np.ndarray:
+    """
+    Tie statistics of integer ranks, as used by the tau-b variance.
+
+    Args:
+        ranks: Dense 0-based ranks (1-D)
+
+    Returns:
+        Array of (sum t(t-1)/2, sum t(t-1)(t-2), sum t(t-1)(2t+5)) over ties
+    """
+    counts = np.bincount(ranks).astype(np.float64)
+    counts = counts[counts > 1]
+
+    return np.array([
+        (counts * (counts - 1) / 2).sum(),
+        (counts * (counts - 1) * (counts - 2)).sum(),
+        (counts * (counts - 1) * (2 * counts + 5)).sum()
+    ])
+
+
+def _count_inversions(sequences: np.ndarray) -> np.ndarray:
+    """
+    Count inversions (i < j with a[i] > a[j]) of many sequences at once.
+
+    Bottom-up merge sort: at each level adjacent sorted runs are merged,
+    and every element of a right run moves left by exactly the number of
+    left-run elements greater than it, so the inversions added per level
+    are the summed displacements of right-run elements. Each key packs
+    (block, value, offset in block) into bit fields so a sort performs the
+    merge and still records where every element came from. The keys are
+    already two sorted runs per block, in block order, so the stable sort
+    (timsort) merges each level in linear time: O(n log n) overall.
+
+    Args:
+        sequences: (m, n) non-negative integers below n, one sequence per row
+
+    Returns:
+        Inversion count per row
+    """
+    n = sequences.shape[1]
+    value_bits = max(int(n - 1).bit_length(), 1)
+    runs = sequences.astype(np.int64)
+    position = np.arange(n, dtype=np.int64)
+    inversions = np.zeros(sequences.shape[0], dtype=np.int64)
+    level = 0
+
+    while (1 << level) < n:
+        level += 1
+        offset = position & ((1 << level) - 1)
+        block = position >> level
+
+        keys = (((block << value_bits) | runs) << level) | offset
+        keys = np.sort(keys, axis=1, kind="stable")
+        source = keys & ((1 << level) - 1)
+        right = source >= (1 << (level - 1))
+        inversions += np.where(right, source - offset, 0).sum(axis=1)
+
+        runs = (keys >> level) & ((1 << value_bits) - 1)
+
+    return inversions
+
+
+def _column_ranks(matrix: np.ndarray, method: str = "average") -> np.ndarray:
+    """
+    Rank every column with one argsort.
+
+    Columns are ranked as contiguous rows of the transpose. NaNs sort last
+    and each forms its own group; callers mask columns that contained them.
+
+    Args:
+        matrix: (n, p) floating matrix
+        method: "average" (1-based, ties averaged) or "dense" (0-based)
+
+    Returns:
+        (n, p) array of ranks
+    """
+    rows = np.ascontiguousarray(matrix.T)
+    n = rows.shape[1]
+    order = np.argsort(rows, axis=1)
+    ordered = np.take_along_axis(rows, order, axis=1)
+
+    starts = np.ones(ordered.shape, dtype=bool)
+    starts[:, 1:] = ordered[:, 1:] != ordered[:, :-1]
+
+    if method == "dense":
+        ranked = np.cumsum(starts, axis=1, dtype=np.int64) - 1
+    else:
+        position = np.arange(n)
+        ends = np.ones(ordered.shape, dtype=bool)
+        ends[:, :-1] = starts[:, 1:]
+        first = np.maximum.accumulate(np.where(starts, position, 0), axis=1)
+        last = np.minimum.accumulate(np.where(ends, position, n)[:, ::-1], axis=1)
+        ranked = (first + last[:, ::-1]) / 2 + 1
+
+    ranks = np.empty(rows.shape, dtype=ranked.dtype)
+    np.put_along_axis(ranks, order, ranked, axis=1)
+
+    return ranks.T
+
+
+def _dense_ranks(matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Dense 0-based ranks of every column and their tie statistics.
+
+    Args:
+        matrix: (n, p) floating matrix
+
+    Returns:
+        Tuple of (integer ranks (n, p), tie sums (p, 3))
+    """
+    ranks = _column_ranks(matrix, method="dense")
+    return ranks, np.array([_tie_sums(column) for column in ranks.T])
+
+
+def _kendall_against(
+    reference: Tuple[np.ndarray, np.ndarray],
+    others: Tuple[np.ndarray, np.ndarray]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Tau-b and asymptotic p-values of one column against many columns.
+
+    Args:
+        reference: Tuple of (dense ranks (n,), tie sums (3,))
+        others: Tuple of (dense ranks (n, m), tie sums (m, 3))
+
+    Returns:
+        Tuple of (tau-b, p-values), one entry per column of ``others``
+    """
+    ranks, (x_tie, x0, x1) = reference
+    other_ranks, other_ties = others
+    n = ranks.shape[0]
+
+    pairs = np.sort(ranks * n + other_ranks.T, axis=1)
+    joint_ties = _run_pair_counts(np.diff(pairs, axis=1) == 0)
+    discordant = _count_inversions(pairs % n)
+
+    total = n * (n - 1) / 2
+    y_tie, y0, y1 = other_ties.T
+    score = total - x_tie - y_tie + joint_ties - 2 * discordant
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        tau = score / np.sqrt(total - x_tie) / np.sqrt(total - y_tie)
+        var = ((n * (n - 1) * (2.0 * n + 5) - x1 - y1) / 18
+               + 2.0 * x_tie * y_tie / (n * (n - 1))
+               + x0 * y0 / (9.0 * n * (n - 1) * (n - 2)))
+        p_values = 2 * stats.norm.sf(np.abs(score) / np.sqrt(var))
+
+    return np.clip(tau, -1.0, 1.0), p_values
+
+
+def _kendall_row(
+    task: Tuple[int, np.ndarray, np.ndarray]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Tau-b and asymptotic p-values of one column against later columns.
+
+    Later columns are compared in ``_column_blocks`` slices, so the (m, n)
+    temporaries of ``_kendall_against`` stay bounded however wide the
+    matrix is.
+
+    Args:
+        task: Tuple of (column index, dense ranks (n, p), tie sums (p, 3))
+
+    Returns:
+        Tuple of (tau-b, p-values) for columns after ``index``
+    """
+    index, ranks, ties = task
+    reference = (ranks[:, index], ties[index])
+    later_ranks, later_ties = ranks[:, index + 1:], ties[index + 1:]
+    tau = np.empty(later_ranks.shape[1])
+    p_values = np.empty_like(tau)
+
+    for cols in _column_blocks(later_ranks.shape):
+        tau[cols], p_values[cols] = _kendall_against(
+            reference, (later_ranks[:, cols], later_ties[cols])
+        )
+
+    return tau, p_values
+
+
+def _run_pair_counts(equal_next: np.ndarray) -> np.ndarray:
+    """
+    Count pairs inside runs of equal values, row by row.
+
+    Args:
+        equal_next: (m, n - 1) flags, True where an element equals the next
+
+    Returns:
+        Sum of t(t-1)/2 over runs of length t in each row
+    """
+    padded = np.pad(equal_next, ((0, 0), (1, 1)))
+    edges = np.diff(padded.astype(np.int8), axis=1)
+    starts = np.nonzero(edges == 1)
+    ends = np.nonzero(edges == -1)
+    lengths = (ends[1] - starts[1] + 1).astype(np.float64)
+
+    return np.bincount(starts[0], weights=lengths * (lengths - 1) / 2,
+                       minlength=equal_next.shape[0])
+
+
+def kendall_matrix(
+    data: Union[pd.DataFrame, np.ndarray],
+    n_jobs: Optional[int] = None
+) -> CorrelationMatrix:
+    """
+    Kendall tau-b correlations between every pair of columns.
+
+    Columns are ranked once. For each column, the discordant pairs against
+    every later column come from vectorized merge-sort inversion counts
+    (O(n log n) merges per pair) over bounded blocks of columns, with rows
+    of the matrix spread over ``n_jobs`` worker threads. P-values use the
+    asymptotic normal approximation
+    (``scipy.stats.kendalltau(method="asymptotic")``). Rows with any NaN are
+    dropped.
+
+    Args:
+        data: DataFrame with numeric variables (or 2-D array)
+        n_jobs: Worker threads (None or 1 runs serially)
+
+    Returns:
+        CorrelationMatrix with coefficients and p-values
+    """
+    matrix, variables = _complete_rows(data)
+    n_rows, n_cols = matrix.shape
+    ranks, ties = _dense_ranks(matrix)
+
+    corr = np.eye(n_cols)
+    p_values = np.zeros((n_cols, n_cols))
+    tasks = [(index, ranks, ties) for index in range(n_cols - 1)]
+
+    if n_jobs is None or n_jobs == 1:
+        rows = map(_kendall_row, tasks)
+    else:
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            rows = list(executor.map(_kendall_row, tasks))
+
+    for index, (tau, p_row) in enumerate(rows):
+        corr[index, index + 1:] = corr[index + 1:, index] = tau
+        p_values[index, index + 1:] = p_values[index + 1:, index] = p_row
+
+    return CorrelationMatrix(
+        correlation=corr,
+        p_values=p_values,
+        variables=variables,
+        n_obs=np.full(corr.shape, n_rows)
+    )
@@ -4,26 +4,20 @@ Time series analysis module for EDA Suite.
 Provides tools for analyzing temporal data patterns.
 """
 
-from eda_suite.timeseries.decomposition import (
-    seasonal_decomposition,
-    trend_analysis
-)
-from eda_suite.timeseries.stationarity import (
-    adf_test,
-    kpss_test,
-    test_stationarity
-)
-from eda_suite.timeseries.autocorrelation import (
-    compute_acf,
-    compute_pacf
-)
+from eda_suite._lazy import attach
 
-__all__ = [
-    "seasonal_decomposition",
-    "trend_analysis",
-    "adf_test",
-    "kpss_test",
-    "test_stationarity",
-    "compute_acf",
-    "compute_pacf"
-]
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "decomposition": [
+        "seasonal_decomposition",
+        "trend_analysis"
+    ],
+    "stationarity": [
+        "adf_test",
+        "kpss_test",
+        "test_stationarity"
+    ],
+    "autocorrelation": [
+        "compute_acf",
+        "compute_pacf"
+    ]
+})
@@ -4,20 +4,30 @@ Univariate analysis module for EDA Suite.
 Provides comprehensive single-variable statistical analysis.
 """
 
-from eda_suite.univariate.descriptive import (
-    compute_statistics,
-    compute_moments,
-    compute_quantiles
-)
-from eda_suite.univariate.distribution import (
-    fit_distribution,
-    test_distribution_fit
-)
+from eda_suite._lazy import attach
 
-__all__ = [
-    "compute_statistics",
-    "compute_moments",
-    "compute_quantiles",
-    "fit_distribution",
-    "test_distribution_fit"
-]
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "descriptive": [
+        "compute_statistics",
+        "compute_moments",
+        "compute_quantiles",
+        "describe_array"
+    ],
+    "columnar": [
+        "compute_statistics_frame",
+        "compute_moments_frame",
+        "compute_quantiles_frame"
+    ],
+    "sketch": [
+        "QuantileSketch",
+        "build_quantile_sketch"
+    ],
+    "streaming": [
+        "StreamingMoments"
+    ],
+    "distribution": [
+        "fit_distribution",
+        "test_distribution_fit",
+        "test_distribution_fit_frame"
+    ]
+})
@@ -0,0 +1,254 @@
+"""
+Column-batched descriptive statistics.
+
+Reduces every column of a DataFrame or 2-D array along axis 0 in a single
+vectorized call, ignoring missing values (NaN) column by column.
+"""
+
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple, Union
+from eda_suite.univariate.descriptive import QUANTILE_LEVELS
+from eda_suite.utils.validators import (
+    is_tabular,
+    validate_array,
+    validate_dataframe
+)
+
+
+@dataclass
+class ColumnarStats:
+    """Per-column statistics stored as one array per statistic."""
+
+    columns: List
+    values: Dict[str, np.ndarray]
+
+    def __getitem__(self, statistic: str) -> np.ndarray:
+        """Return the array for one statistic."""
+        return self.values[statistic]
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Convert to a DataFrame with one row per column.
+
+        Returns:
+            DataFrame indexed by column name, one column per statistic
+        """
+        return pd.DataFrame(self.values, index=pd.Index(self.columns))
+
+
+def _as_matrix(data: Union[pd.DataFrame, np.ndarray]) -> Tuple[np.ndarray, List]:
+    """
+    Convert a DataFrame or array to a floating (n, p) matrix.
+
+    Args:
+        data: DataFrame or Arrow table (numeric columns are used) or
+            1-D/2-D array
+
+    Returns:
+        Tuple of (matrix, column labels)
+    """
+    if is_tabular(data):
+        numeric = validate_dataframe(data).select_dtypes(include=[np.number])
+        matrix = numeric.to_numpy(dtype=np.float64, na_value=np.nan)
+        return matrix, list(numeric.columns)
+
+    arr = validate_array(data)
+    if arr.ndim > 2:
+        raise ValueError("Array must be 1-D or 2-D")
+
+    matrix = arr.reshape(arr.shape[0], -1)
+    if not np.issubdtype(matrix.dtype, np.floating):
+        matrix = matrix.astype(np.float64)
+
+    return matrix, list(range(matrix.shape[1]))
+
+
+def _sorted_columns(
+    data: Union[pd.DataFrame, np.ndarray]
+) -> Tuple[np.ndarray, np.ndarray, List]:
+    """
+    Sort every column once, NaNs last, and count the valid entries.
+
+    Args:
+        data: DataFrame or array
+
+    Returns:
+        Tuple of (sorted matrix, valid counts per column, column labels)
+    """
+    matrix, columns = _as_matrix(data)
+    sorted_matrix = np.sort(matrix, axis=0)
+    counts = matrix.shape[0] - np.count_nonzero(np.isnan(matrix), axis=0)
+
+    return sorted_matrix, counts, columns
+
+
+def _column_quantiles(
+    sorted_matrix: np.ndarray,
+    counts: np.ndarray,
+    levels: Sequence[float]
+) -> np.ndarray:
+    """
+    Linearly interpolated quantiles of NaN-last sorted columns.
+
+    Args:
+        sorted_matrix: Column-sorted (n, p) matrix
+        counts: Number of valid entries per column
+        levels: Quantile levels in [0, 1]
+
+    Returns:
+        (len(levels), p) array; all-NaN columns yield NaN
+    """
+    last = np.maximum(counts - 1, 0)
+    position = np.asarray(levels, dtype=np.float64)[:, None] * last
+    lower = np.floor(position).astype(np.intp)
+    upper = np.minimum(lower + 1, last)
+
+    low_values = np.take_along_axis(sorted_matrix, lower, axis=0)
+    high_values = np.take_along_axis(sorted_matrix, upper, axis=0)
+    result = low_values + (high_values - low_values) * (position - lower)
+
+    return np.where(counts > 0, result, np.nan)
+
+
+def _column_modes(sorted_matrix: np.ndarray) -> np.ndarray:
+    """
+    Most frequent value per column (smallest on ties), ignoring NaNs.
+
+    Args:
+        sorted_matrix: Column-sorted (n, p) matrix, NaNs last
+
+    Returns:
+        Array of modal values
+    """
+    n = sorted_matrix.shape[0]
+    index = np.arange(n)[:, None]
+
+    new_run = np.ones(sorted_matrix.shape, dtype=bool)
+    new_run[1:] = sorted_matrix[1:] != sorted_matrix[:-1]
+    run_start = np.maximum.accumulate(np.where(new_run, index, 0), axis=0)
+
+    run_length = np.where(np.isnan(sorted_matrix), 0, index - run_start + 1)
+    best = np.argmax(run_length, axis=0)[None, :]
+
+    return np.take_along_axis(sorted_matrix, best, axis=0)[0]
+
+
+def _column_moments(
+    matrix: np.ndarray,
+    counts: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    NaN-aware column means and second to fourth central sums.
+
+    Args:
+        matrix: (n, p) matrix with NaNs for missing values
+        counts: Number of valid entries per column
+
+    Returns:
+        Tuple of (mean, sum d^2, sum d^3, sum d^4) arrays
+    """
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.nansum(matrix, axis=0, dtype=np.float64) / counts
+
+    deviations = np.subtract(matrix, mean, dtype=np.float64)
+    np.nan_to_num(deviations, copy=False, nan=0.0)
+    squared = deviations * deviations
+
+    return (
+        mean,
+        squared.sum(axis=0),
+        np.einsum("ij,ij->j", squared, deviations),
+        np.einsum("ij,ij->j", squared, squared)
+    )
+
+
+def compute_statistics_frame(
+    data: Union[pd.DataFrame, np.ndarray]
+) -> ColumnarStats:
+    """
+    Column-wise descriptive statistics in one vectorized call.
+
+    Columnar counterpart of ``compute_statistics``; NaNs are ignored per
+    column and all-NaN columns produce NaN.
+
+    Args:
+        data: DataFrame (numeric columns) or 2-D array (n_samples, n_columns)
+
+    Returns:
+        ColumnarStats with the DescriptiveStats fields as arrays
+    """
+    sorted_matrix, counts, columns = _sorted_columns(data)
+    q1, median, q3 = _column_quantiles(sorted_matrix, counts, [0.25, 0.5, 0.75])
+    mean, m2, _, _ = _column_moments(sorted_matrix, counts)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        variance = np.where(counts > 1, m2 / (counts - 1), np.nan)
+
+    minimum = np.where(counts > 0, sorted_matrix[0], np.nan)
+    maximum = _column_quantiles(sorted_matrix, counts, [1.0])[0]
+
+    return ColumnarStats(columns=columns, values={
+        "mean": mean,
+        "median": median,
+        "mode": _column_modes(sorted_matrix),
+        "std": np.sqrt(variance),
+        "variance": variance,
+        "min": minimum,
+        "max": maximum,
+        "range": maximum - minimum,
+        "iqr": q3 - q1
+    })
+
+
+def compute_moments_frame(
+    data: Union[pd.DataFrame, np.ndarray]
+) -> ColumnarStats:
+    """
+    Column-wise skewness and kurtosis in one vectorized call.
+
+    Columnar counterpart of ``compute_moments`` (biased estimators).
+
+    Args:
+        data: DataFrame (numeric columns) or 2-D array (n_samples, n_columns)
+
+    Returns:
+        ColumnarStats with the MomentStats fields as arrays
+    """
+    matrix, columns = _as_matrix(data)
+    counts = matrix.shape[0] - np.count_nonzero(np.isnan(matrix), axis=0)
+    _, m2, m3, m4 = _column_moments(matrix, counts)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        variance = np.where(m2 > 0, m2 / counts, np.nan)
+        skewness = (m3 / counts) / variance ** 1.5
+        kurtosis = (m4 / counts) / variance ** 2
+
+    return ColumnarStats(columns=columns, values={
+        "skewness": skewness,
+        "kurtosis": kurtosis,
+        "excess_kurtosis": kurtosis - 3
+    })
+
+
+def compute_quantiles_frame(
+    data: Union[pd.DataFrame, np.ndarray]
+) -> ColumnarStats:
+    """
+    Column-wise quantiles in one vectorized call.
+
+    Columnar counterpart of ``compute_quantiles`` with the same ``qNN`` keys.
+
+    Args:
+        data: DataFrame (numeric columns) or 2-D array (n_samples, n_columns)
+
+    Returns:
+        ColumnarStats with one array per quantile level
+    """
+    sorted_matrix, counts, columns = _sorted_columns(data)
+    values = _column_quantiles(sorted_matrix, counts, QUANTILE_LEVELS)
+
+    return ColumnarStats(columns=columns, values={
+        f"q{int(q*100):02d}": row for q, row in zip(QUANTILE_LEVELS, values)
+    })
@@ -5,10 +5,13 @@ Computes measures of central tendency and dispersion.
 """
 
 import numpy as np
-from scipy import stats
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from typing import Tuple
+from eda_suite.univariate.sketch import build_quantile_sketch
 from eda_suite.utils.validators import validate_array
 
+QUANTILE_LEVELS = (0.01, 0.05, 0.1, 0.25, 0.5, 0.75, 0.9, 0.95, 0.99)
+
 
 @dataclass
 class DescriptiveStats:
@@ -35,22 +38,7 @@ def compute_statistics(data: np.ndarray) -> DescriptiveStats:
     Returns:
         DescriptiveStats with all measures
     """
-    arr = validate_array(data)
-
-    q1, q3 = np.percentile(arr, [25, 75])
-    mode_result = stats.mode(arr, keepdims=True)
-
-    return DescriptiveStats(
-        mean=float(np.mean(arr)),
-        median=float(np.median(arr)),
-        mode=float(mode_result.mode[0]),
-        std=float(np.std(arr, ddof=1)),
-        variance=float(np.var(arr, ddof=1)),
-        min=float(np.min(arr)),
-        max=float(np.max(arr)),
-        range=float(np.ptp(arr)),
-        iqr=float(q3 - q1)
-    )
+    return describe_array(data)[0]
 
 
 @dataclass
@@ -72,31 +60,177 @@ def compute_moments(data: np.ndarray) -> MomentStats:
     Returns:
         MomentStats with moment measures
     """
+    arr = validate_array(data).ravel()
+    _, sums = _central_moments(arr)
+
+    return _moments_from_sums(arr.size, sums)
+
+
+def compute_quantiles(data: np.ndarray, method: str = "exact") -> dict:
+    """
+    Compute various quantiles.
+
+    Args:
+        data: Input array; with method="sketch" also a memory map, an
+            iterable of array chunks or a QuantileSketch
+        method: "exact" (np.percentile) or "sketch" (bounded-memory KLL
+            estimate, see ``eda_suite.univariate.sketch`` for error bounds)
+
+    Returns:
+        Dictionary with quantile values
+    """
+    if method == "sketch":
+        sketch = build_quantile_sketch(data)
+        return _quantile_dict(sketch.quantiles(QUANTILE_LEVELS))
+
+    if method != "exact":
+        raise ValueError("method must be 'exact' or 'sketch'")
+
     arr = validate_array(data)
 
-    skew = stats.skew(arr)
-    kurt = stats.kurtosis(arr, fisher=False)
+    values = np.percentile(arr, [q * 100 for q in QUANTILE_LEVELS])
 
-    return MomentStats(
-        skewness=float(skew),
-        kurtosis=float(kurt),
-        excess_kurtosis=float(kurt - 3)
+    return _quantile_dict(values)
+
+
+def _quantile_dict(values: np.ndarray) -> dict:
+    """Label quantile values with their ``qNN`` keys."""
+    return {
+        f"q{int(q*100):02d}": float(v)
+        for q, v in zip(QUANTILE_LEVELS, values)
+    }
+
+
+def _sorted_quantiles(sorted_arr: np.ndarray, levels: np.ndarray) -> np.ndarray:
+    """
+    Linearly interpolated quantiles of an already sorted array.
+
+    Matches ``np.percentile`` with its default (linear) method.
+
+    Args:
+        sorted_arr: Sorted 1-D array
+        levels: Quantile levels in [0, 1]
+
+    Returns:
+        Array of quantile values
+    """
+    position = np.asarray(levels, dtype=np.float64) * (sorted_arr.size - 1)
+    lower = np.floor(position).astype(np.intp)
+    upper = np.minimum(lower + 1, sorted_arr.size - 1)
+    fraction = position - lower
+
+    low_values = sorted_arr[lower].astype(np.float64)
+    high_values = sorted_arr[upper].astype(np.float64)
+
+    return low_values + (high_values - low_values) * fraction
+
+
+def _sorted_mode(sorted_arr: np.ndarray) -> float:
+    """
+    Most frequent value of a sorted array (smallest on ties).
+
+    Args:
+        sorted_arr: Sorted 1-D array
+
+    Returns:
+        Modal value
+    """
+    starts = np.flatnonzero(sorted_arr[1:] != sorted_arr[:-1]) + 1
+    starts = np.concatenate(([0], starts))
+    counts = np.diff(np.append(starts, sorted_arr.size))
+
+    return float(sorted_arr[starts[np.argmax(counts)]])
+
+
+def _central_moments(
+    arr: np.ndarray
+) -> Tuple[float, Tuple[float, float, float]]:
+    """
+    Mean and second to fourth central sums in two passes.
+
+    Args:
+        arr: 1-D array
+
+    Returns:
+        Tuple of (mean, (sum d^2, sum d^3, sum d^4))
+    """
+    mean = float(np.sum(arr, dtype=np.float64) / arr.size)
+    deviations = np.subtract(arr, mean, dtype=np.float64)
+    squared = deviations * deviations
+
+    return mean, (
+        float(np.sum(squared)),
+        float(np.dot(squared, deviations)),
+        float(np.dot(squared, squared))
     )
 
 
-def compute_quantiles(data: np.ndarray) -> dict:
+def describe_array(
+    data: np.ndarray
+) -> Tuple[DescriptiveStats, MomentStats, dict]:
     """
-    Compute various quantiles.
+    Compute descriptive statistics, moments and quantiles in one pass.
+
+    The array is validated and sorted once; order statistics, the mode and
+    the central moments are all derived from that single sorted copy. NaN
+    left in by the active nan_policy ("propagate") sorts to the end and
+    makes every statistic NaN, as ``np.percentile`` and ``np.min`` would.
 
     Args:
         data: Input array
 
     Returns:
-        Dictionary with quantile values
+        Tuple of (DescriptiveStats, MomentStats, quantile dictionary)
     """
-    arr = validate_array(data)
+    arr = np.sort(validate_array(data), axis=None)
+    n = arr.size
+    if n and np.isnan(arr[-1]):
+        return _nan_description()
+
+    mean, sums = _central_moments(arr)
+    levels = np.array((0.25, 0.5, 0.75) + QUANTILE_LEVELS)
+    q1, median, q3, *quantiles = _sorted_quantiles(arr, levels)
+    variance = sums[0] / (n - 1) if n > 1 else np.nan
+
+    summary = DescriptiveStats(
+        mean=mean,
+        median=float(median),
+        mode=_sorted_mode(arr),
+        std=float(np.sqrt(variance)),
+        variance=float(variance),
+        min=float(arr[0]),
+        max=float(arr[-1]),
+        range=float(arr[-1] - arr[0]),
+        iqr=float(q3 - q1)
+    )
+
+    return summary, _moments_from_sums(n, sums), _quantile_dict(quantiles)
+
+
+def _nan_description() -> Tuple[DescriptiveStats, MomentStats, dict]:
+    """All-NaN result of ``describe_array`` for input containing NaN."""
+    summary = DescriptiveStats(*[np.nan] * len(fields(DescriptiveStats)))
+    moments = MomentStats(np.nan, np.nan, np.nan)
 
-    quantiles = [0.01, 0.05, 0.1, 0.25, 0.5, 0.75, 0.9, 0.95, 0.99]
-    values = np.percentile(arr, [q * 100 for q in quantiles])
+    return summary, moments, _quantile_dict(np.full(len(QUANTILE_LEVELS), np.nan))
 
-    return {f"q{int(q*100):02d}": float(v) for q, v in zip(quantiles, values)}
+
+def _moments_from_sums(
+    n: int,
+    sums: Tuple[float, float, float]
+) -> MomentStats:
+    """Build biased skewness/kurtosis (scipy defaults) from central sums."""
+    m2, m3, m4 = sums
+
+    if m2 == 0:
+        skew = kurt = np.nan
+    else:
+        variance = m2 / n
+        skew = (m3 / n) / variance ** 1.5
+        kurt = (m4 / n) / variance ** 2
+
+    return MomentStats(
+        skewness=float(skew),
+        kurtosis=float(kurt),
+        excess_kurtosis=float(kurt - 3)
+    )
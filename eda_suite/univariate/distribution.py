@@ -4,10 +4,20 @@ Distribution fitting and testing.
 Fits theoretical distributions to empirical data.
 """
 
+import signal
+import threading
+import time
+import warnings
 import numpy as np
+import pandas as pd
 from scipy import stats
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Tuple
+from typing import Dict, Optional, Tuple, Union
+from eda_suite.univariate.columnar import _as_matrix
+from eda_suite.utils.cache import memoize
+from eda_suite.utils.config import FitConfig
 from eda_suite.utils.validators import validate_array
 
 
@@ -22,53 +32,295 @@ class DistributionFit:
     is_good_fit: bool
 
 
+def _closed_form_parameters(
+    sorted_arr: np.ndarray,
+    spec: Tuple[str, Optional[float]]
+) -> Optional[Tuple]:
+    """
+    Maximum likelihood parameters for distributions with closed forms.
+
+    Closed forms are used only where they give the same estimate as
+    ``dist.fit`` with the same arguments: ``norm`` and ``expon`` with a
+    free loc, and ``lognorm`` with loc fixed at 0 on strictly positive
+    data (the two-parameter log-normal).
+
+    Args:
+        sorted_arr: Sorted sample
+        spec: Tuple of (scipy.stats distribution name, fixed location or
+            None to estimate it)
+
+    Returns:
+        Parameter tuple in scipy order, or None if no closed form applies
+    """
+    distribution, floc = spec
+    if distribution == "norm" and floc is None:
+        return (float(np.mean(sorted_arr)), float(np.std(sorted_arr)))
+
+    if distribution == "expon" and floc is None:
+        loc = float(sorted_arr[0])
+        return (loc, float(np.mean(sorted_arr)) - loc)
+
+    if distribution == "lognorm" and floc == 0 and sorted_arr[0] > 0:
+        logs = np.log(sorted_arr)
+        return (float(np.std(logs)), 0.0, float(np.exp(np.mean(logs))))
+
+    return None
+
+
+def _ks_sorted(
+    sorted_arr: np.ndarray,
+    cdf_values: np.ndarray
+) -> Tuple[float, float]:
+    """
+    Two-sided one-sample KS test on an already sorted sample.
+
+    Args:
+        sorted_arr: Sorted sample
+        cdf_values: Theoretical CDF evaluated at ``sorted_arr``
+
+    Returns:
+        Tuple of (KS statistic, exact p-value as in ``stats.kstest``)
+    """
+    n = sorted_arr.size
+    d_plus = np.max(np.arange(1, n + 1) / n - cdf_values)
+    d_minus = np.max(cdf_values - np.arange(n) / n)
+    statistic = max(d_plus, d_minus)
+
+    return float(statistic), float(np.clip(stats.kstwo.sf(statistic, n), 0, 1))
+
+
+def _fit_sorted(
+    sorted_arr: np.ndarray,
+    spec: Tuple[str, Optional[float]]
+) -> DistributionFit:
+    """
+    Fit one distribution to a sorted sample and test the fit.
+
+    Args:
+        sorted_arr: Sorted sample
+        spec: Tuple of (scipy.stats distribution name, fixed location or
+            None to estimate it)
+
+    Returns:
+        DistributionFit with parameters and fit statistics
+    """
+    distribution, floc = spec
+    dist = getattr(stats, distribution)
+    params = _closed_form_parameters(sorted_arr, spec)
+    if params is None:
+        params = dist.fit(sorted_arr) if floc is None else dist.fit(sorted_arr, floc=floc)
+
+    ks_stat, p_val = _ks_sorted(sorted_arr, dist.cdf(sorted_arr, *params))
+
+    return DistributionFit(
+        distribution_name=distribution,
+        parameters=tuple(params),
+        ks_statistic=ks_stat,
+        p_value=p_val,
+        is_good_fit=p_val > 0.05
+    )
+
+
+@memoize
 def fit_distribution(
     data: np.ndarray,
-    distribution: str = "norm"
+    distribution: Union[str, FitConfig] = "norm"
 ) -> DistributionFit:
     """
     Fit theoretical distribution to data.
 
+    ``norm`` and ``expon`` use closed-form maximum likelihood estimates,
+    as does ``lognorm`` with its location fixed at 0 on positive data (the
+    faster two-parameter log-normal); everything else uses ``dist.fit``.
+
     Args:
         data: Input array
-        distribution: Distribution name (norm, expon, gamma, etc.)
+        distribution: Distribution name (norm, expon, gamma, etc.), or a
+            FitConfig naming one distribution, whose ``fixed_loc`` is used
 
     Returns:
         DistributionFit with parameters and fit statistics
     """
-    arr = validate_array(data)
+    if isinstance(distribution, str):
+        distribution = FitConfig(distributions=[distribution])
+    if len(distribution.distributions) != 1:
+        raise ValueError("fit_distribution fits exactly one distribution")
 
-    dist = getattr(stats, distribution)
-    params = dist.fit(arr)
+    name = distribution.distributions[0]
+    arr = np.sort(validate_array(data), axis=None)
+    return _fit_sorted(arr, (name, distribution.fixed_loc.get(name)))
 
-    ks_stat, p_val = stats.kstest(arr, distribution, args=params)
 
-    return DistributionFit(
-        distribution_name=distribution,
-        parameters=params,
-        ks_statistic=float(ks_stat),
-        p_value=float(p_val),
-        is_good_fit=p_val > 0.05
+def _alarm_available() -> bool:
+    """
+    Whether a SIGALRM time limit can be set here: POSIX, on the main
+    thread, and without a timer of the caller's already running.
+    """
+    return (
+        hasattr(signal, "SIGALRM")
+        and threading.current_thread() is threading.main_thread()
+        and signal.getitimer(signal.ITIMER_REAL)[0] == 0
     )
 
 
-def test_distribution_fit(data: np.ndarray) -> dict:
+@contextmanager
+def _time_limit(seconds: Optional[float]):
+    """
+    Raise TimeoutError in the block after ``seconds``, best effort.
+
+    The limit is a SIGALRM timer, so it is only set where
+    ``_alarm_available`` holds; elsewhere the block runs to completion.
+    The caller's SIGALRM handler is restored afterwards.
+    """
+    if seconds is None or not _alarm_available():
+        yield
+        return
+
+    def _expire(signum, frame):
+        raise TimeoutError(f"fit exceeded {seconds}s")
+
+    previous = signal.signal(signal.SIGALRM, _expire)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def _guarded_fit(
+    sorted_arr: np.ndarray,
+    task: Tuple[str, Optional[float], Optional[float], Optional[float]]
+) -> Tuple[Optional[DistributionFit], Optional[str]]:
+    """
+    Run one fit under a time limit, capturing failures.
+
+    Fits that would start after the batch deadline are skipped.
+
+    Args:
+        sorted_arr: Sorted sample
+        task: Tuple of (distribution name, fixed location, timeout,
+            wall-clock deadline of the batch)
+
+    Returns:
+        Tuple of (fit or None, error message or None)
+    """
+    distribution, floc, timeout, deadline = task
+    if deadline is not None and time.time() > deadline:
+        return None, "batch deadline reached"
+
+    try:
+        with _time_limit(timeout):
+            return _fit_sorted(sorted_arr, (distribution, floc)), None
+    except Exception as error:
+        return None, f"{type(error).__name__}: {error}"
+
+
+_WORKER_SAMPLES: Dict = {}
+
+
+def _share_samples(samples: Dict) -> None:
+    """Pool initializer: receive the batch's samples once per worker."""
+    global _WORKER_SAMPLES
+    _WORKER_SAMPLES = samples
+
+
+def _pooled_fit(task: Tuple) -> Tuple[Optional[DistributionFit], Optional[str]]:
+    """``_guarded_fit`` in a worker, on a sample named by the task's key."""
+    key, fit_task = task
+    return _guarded_fit(_WORKER_SAMPLES[key], fit_task)
+
+
+def _check_timeout(config: FitConfig) -> None:
+    """Warn when ``config.timeout`` cannot be enforced where fits will run."""
+    serial = config.n_jobs is None or config.n_jobs == 1
+    if config.timeout is not None and not (
+            _alarm_available() if serial else hasattr(signal, "SIGALRM")):
+        warnings.warn("timeout cannot be enforced here (it needs SIGALRM on "
+                      "the main thread); fits run to completion")
+
+
+def _run_fits(
+    samples: Dict,
+    config: FitConfig
+) -> Dict:
+    """
+    Fit every configured distribution to every sorted sample.
+
+    Args:
+        samples: Mapping of key to sorted sample
+        config: Distributions, workers, per-fit timeout and batch deadline
+
+    Returns:
+        Mapping of key to {distribution: DistributionFit}; failed,
+        timed-out and skipped fits are omitted and reported with a warning
+    """
+    serial = config.n_jobs is None or config.n_jobs == 1
+    _check_timeout(config)
+
+    deadline = None if config.deadline is None else time.time() + config.deadline
+    keys = [(key, dist) for key in samples for dist in config.distributions]
+    tasks = [(key, (dist, config.fixed_loc.get(dist), config.timeout, deadline))
+             for key, dist in keys]
+
+    if serial:
+        outcomes = (_guarded_fit(samples[key], task) for key, task in tasks)
+    else:
+        with ProcessPoolExecutor(max_workers=config.n_jobs,
+                                 initializer=_share_samples,
+                                 initargs=(samples,)) as executor:
+            outcomes = list(executor.map(_pooled_fit, tasks))
+
+    results = {key: {} for key in samples}
+    for (key, dist), (fit, error) in zip(keys, outcomes):
+        if fit is not None:
+            results[key][dist] = fit
+        else:
+            warnings.warn(f"Skipped {dist} fit for {key!r}: {error}")
+
+    return results
+
+
+def test_distribution_fit(
+    data: np.ndarray,
+    config: FitConfig = FitConfig()
+) -> dict:
     """
     Test multiple distributions.
 
+    The data is sorted once and shared by every fit and KS statistic.
+
     Args:
         data: Input array
+        config: Distributions, workers, per-fit timeout and batch deadline
 
     Returns:
         Dictionary with fit results for multiple distributions
     """
-    distributions = ["norm", "expon", "gamma", "lognorm", "weibull_min"]
-    results = {}
+    arr = np.sort(validate_array(data), axis=None)
+    return _run_fits({"data": arr}, config)["data"]
 
-    for dist in distributions:
-        try:
-            results[dist] = fit_distribution(data, dist)
-        except:
-            continue
 
-    return results
+def test_distribution_fit_frame(
+    data: Union[pd.DataFrame, np.ndarray],
+    config: FitConfig = FitConfig()
+) -> Dict:
+    """
+    Test multiple distributions on every column.
+
+    Columns are sorted once (NaNs dropped); with ``config.n_jobs`` the
+    column/distribution pairs are spread over a process pool.
+
+    Args:
+        data: DataFrame (numeric columns) or 2-D array (n_samples, n_columns)
+        config: Distributions, workers, per-fit timeout and batch deadline
+
+    Returns:
+        Dictionary mapping column to {distribution: DistributionFit}
+    """
+    matrix, columns = _as_matrix(data)
+    samples = {}
+    for column, values in zip(columns, matrix.T):
+        samples[column] = np.sort(values[~np.isnan(values)])
+
+    return _run_fits(samples, config)
@@ -0,0 +1,227 @@
+"""
+Mergeable approximate quantile sketch.
+
+Implements a KLL sketch (Karnin, Lang & Liberty, 2016) that summarizes a
+stream of values in memory bounded by roughly ``3 * k`` retained items.
+
+Error bounds:
+    A query at level q returns a value whose true rank differs from q * n by
+    at most eps * n, with eps (the normalized rank error) of order 1 / k.
+    Empirically eps is about 1.65% at the default k = 200 with 99%
+    confidence, and it roughly halves each time k doubles. While fewer than
+    k values have been seen the sketch is exact.
+"""
+
+import io
+import numpy as np
+from typing import Iterable, Iterator, Optional, Sequence, Union
+from eda_suite.utils.validators import validate_array
+
+CHUNK_SIZE = 1 << 20
+
+
+class QuantileSketch:
+    """KLL quantile sketch with chunked updates, merging and serialization."""
+
+    def __init__(self, k: int = 200, seed: Optional[int] = None):
+        """
+        Initialize an empty sketch.
+
+        Args:
+            k: Accuracy parameter (larger is more accurate and uses more memory)
+            seed: Seed for the random compaction offsets
+        """
+        if k < 8:
+            raise ValueError("k must be at least 8")
+
+        self.k = k
+        self.count = 0
+        self.min = np.inf
+        self.max = -np.inf
+        self._levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, chunk: np.ndarray) -> 'QuantileSketch':
+        """
+        Add a chunk of observations (NaNs are skipped).
+
+        Args:
+            chunk: Array of observations (flattened)
+
+        Returns:
+            Self for method chaining
+        """
+        arr = validate_array(chunk).ravel().astype(np.float64)
+        arr = arr[~np.isnan(arr)]
+
+        if arr.size == 0:
+            return self
+
+        self.count += arr.size
+        self.min = min(self.min, float(arr.min()))
+        self.max = max(self.max, float(arr.max()))
+        self._levels[0] = np.concatenate((self._levels[0], arr))
+        self._compress()
+
+        return self
+
+    def merge(self, other: 'QuantileSketch') -> 'QuantileSketch':
+        """
+        Fold another sketch into this one.
+
+        Args:
+            other: Sketch built from a disjoint part of the data
+
+        Returns:
+            Self for method chaining
+        """
+        for height, items in enumerate(other._levels):
+            if height == len(self._levels):
+                self._levels.append(np.empty(0))
+            self._levels[height] = np.concatenate((self._levels[height], items))
+
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress()
+
+        return self
+
+    def quantiles(self, levels: Sequence[float]) -> np.ndarray:
+        """
+        Estimate quantiles of everything seen so far.
+
+        Args:
+            levels: Quantile levels in [0, 1]
+
+        Returns:
+            Array of estimated quantile values
+        """
+        if self.count == 0:
+            raise ValueError("No observations have been accumulated")
+
+        probs = np.asarray(levels, dtype=np.float64)
+        if len(self._levels) == 1:
+            return np.quantile(self._levels[0], probs)
+
+        items = np.concatenate(self._levels)
+        weights = np.concatenate([
+            np.full(level.size, 2.0 ** height)
+            for height, level in enumerate(self._levels)
+        ])
+        order = np.argsort(items, kind="stable")
+        cumulative = np.cumsum(weights[order])
+
+        index = np.searchsorted(cumulative, probs * cumulative[-1], side="left")
+        values = items[order][np.minimum(index, items.size - 1)]
+        values = np.where(probs <= 0, self.min, values)
+
+        return np.where(probs >= 1, self.max, values)
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the sketch (without pickle).
+
+        Returns:
+            Portable byte string readable by ``from_bytes``
+        """
+        buffer = io.BytesIO()
+        header = np.array([self.k, self.count], dtype=np.int64)
+        extremes = np.array([self.min, self.max])
+        levels = {f"level_{h}": level for h, level in enumerate(self._levels)}
+
+        np.savez(buffer, header=header, extremes=extremes, **levels)
+        return buffer.getvalue()
+
+    @classmethod
+    def from_bytes(cls, payload: bytes) -> 'QuantileSketch':
+        """
+        Restore a sketch produced by ``to_bytes``.
+
+        Args:
+            payload: Serialized sketch
+
+        Returns:
+            QuantileSketch with the same state
+        """
+        with np.load(io.BytesIO(payload), allow_pickle=False) as stored:
+            k, count = (int(v) for v in stored["header"])
+            sketch = cls(k=k)
+            sketch.count = count
+            sketch.min, sketch.max = (float(v) for v in stored["extremes"])
+            n_levels = sum(1 for name in stored.files if name.startswith("level_"))
+            sketch._levels = [stored[f"level_{h}"] for h in range(n_levels)]
+
+        return sketch
+
+    def _capacity(self, height: int) -> int:
+        """Capacity of a level; lower levels shrink geometrically."""
+        depth = len(self._levels) - 1 - height
+        return max(2, int(np.ceil(self.k * (2.0 / 3.0) ** depth)))
+
+    def _compress(self) -> None:
+        """Compact full levels until the sketch fits its total capacity."""
+        while True:
+            sizes = [level.size for level in self._levels]
+            capacities = [self._capacity(h) for h in range(len(sizes))]
+            if sum(sizes) <= sum(capacities):
+                return
+
+            height = next(h for h, (s, c) in enumerate(zip(sizes, capacities))
+                          if s >= c)
+            self._compact(height)
+
+    def _compact(self, height: int) -> None:
+        """Sort a level and promote every other item to the next level."""
+        level = self._levels[height]
+        held_back = level[:level.size % 2]
+        survivors = np.sort(level[level.size % 2:])
+        promoted = survivors[self._rng.integers(2)::2]
+
+        if height + 1 == len(self._levels):
+            self._levels.append(np.empty(0))
+
+        self._levels[height] = held_back
+        self._levels[height + 1] = np.concatenate(
+            (self._levels[height + 1], promoted)
+        )
+
+
+def build_quantile_sketch(
+    data: Union[np.ndarray, Iterable[np.ndarray], QuantileSketch]
+) -> QuantileSketch:
+    """
+    Summarize an array, memory map or stream of chunks in bounded memory.
+
+    Array-likes (ndarrays including ``np.memmap``, pandas Series, Arrow
+    arrays, lists of numbers) are read in blocks of ``CHUNK_SIZE`` values,
+    so only one block is resident at a time. Iterators and lists of
+    arrays are taken as chunks.
+
+    Args:
+        data: Array-like, iterator or list of array chunks, or an
+            existing sketch
+
+    Returns:
+        QuantileSketch over all values
+    """
+    if isinstance(data, QuantileSketch):
+        return data
+
+    sketch = QuantileSketch()
+    chunked = isinstance(data, Iterator) or (
+        isinstance(data, (list, tuple)) and len(data) > 0 and np.ndim(data[0]) > 0
+    )
+    if chunked:
+        for chunk in data:
+            sketch.update(chunk)
+        return sketch
+
+    if len(data) == 0:
+        return sketch
+
+    flat = validate_array(data).reshape(-1)
+    for start in range(0, flat.size, CHUNK_SIZE):
+        sketch.update(flat[start:start + CHUNK_SIZE])
+
+    return sketch
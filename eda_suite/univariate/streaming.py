@@ -0,0 +1,143 @@
+"""
+Streaming and mergeable moment accumulation.
+
+Computes descriptive moments over data that arrives in chunks, without
+materializing the whole column, using the pairwise update formulas of
+Chan et al. (1979) and Pebay (2008).
+"""
+
+import numpy as np
+from typing import Tuple
+from eda_suite.univariate.descriptive import (
+    DescriptiveStats,
+    MomentStats,
+    _central_moments,
+    _moments_from_sums
+)
+from eda_suite.utils.validators import validate_array
+
+
+class StreamingMoments:
+    """Mergeable accumulator for count, mean, M2-M4, min and max."""
+
+    def __init__(self):
+        """Initialize an empty accumulator."""
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.m3 = 0.0
+        self.m4 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def update(self, chunk: np.ndarray) -> 'StreamingMoments':
+        """
+        Add a chunk of observations (NaNs are skipped).
+
+        Args:
+            chunk: Array of observations (flattened)
+
+        Returns:
+            Self for method chaining
+        """
+        arr = validate_array(chunk).ravel()
+        if np.issubdtype(arr.dtype, np.floating):
+            arr = arr[~np.isnan(arr)]
+
+        if arr.size == 0:
+            return self
+
+        mean, sums = _central_moments(arr)
+        extremes = (float(np.min(arr)), float(np.max(arr)))
+
+        return self._combine((arr.size, mean) + sums, extremes)
+
+    def merge(self, other: 'StreamingMoments') -> 'StreamingMoments':
+        """
+        Fold another accumulator into this one.
+
+        Merging is exact (up to rounding), so partial results computed by
+        separate workers can be combined in any order.
+
+        Args:
+            other: Accumulator built from a disjoint part of the data
+
+        Returns:
+            Self for method chaining
+        """
+        if other.count == 0:
+            return self
+
+        state = (other.count, other.mean, other.m2, other.m3, other.m4)
+        return self._combine(state, (other.min, other.max))
+
+    def _combine(
+        self,
+        state: Tuple[int, float, float, float, float],
+        extremes: Tuple[float, float]
+    ) -> 'StreamingMoments':
+        """Apply the pairwise update for (count, mean, M2, M3, M4)."""
+        n_b, mean_b, m2_b, m3_b, m4_b = state
+        n_a, n = self.count, self.count + n_b
+        delta = mean_b - self.mean
+        delta_n = delta / n
+
+        m4 = (
+            self.m4 + m4_b
+            + delta * delta_n ** 3 * n_a * n_b * (n_a * n_a - n_a * n_b + n_b * n_b)
+            + 6 * delta_n ** 2 * (n_a * n_a * m2_b + n_b * n_b * self.m2)
+            + 4 * delta_n * (n_a * m3_b - n_b * self.m3)
+        )
+        m3 = (
+            self.m3 + m3_b
+            + delta * delta_n ** 2 * n_a * n_b * (n_a - n_b)
+            + 3 * delta_n * (n_a * m2_b - n_b * self.m2)
+        )
+        self.m2 += m2_b + delta * delta_n * n_a * n_b
+        self.m3, self.m4 = m3, m4
+        self.mean += delta_n * n_b
+        self.count = n
+
+        self.min = min(self.min, extremes[0])
+        self.max = max(self.max, extremes[1])
+
+        return self
+
+    def moment_stats(self) -> MomentStats:
+        """
+        Skewness and kurtosis of everything seen so far.
+
+        Returns:
+            MomentStats equivalent to ``compute_moments`` on the full data
+        """
+        if self.count == 0:
+            raise ValueError("No observations have been accumulated")
+
+        return _moments_from_sums(self.count, (self.m2, self.m3, self.m4))
+
+    def descriptive_stats(self) -> DescriptiveStats:
+        """
+        Moment-based descriptive statistics of everything seen so far.
+
+        Order statistics that need the full data (median, mode, IQR) are
+        reported as NaN.
+
+        Returns:
+            DescriptiveStats equivalent to ``compute_statistics``
+        """
+        if self.count == 0:
+            raise ValueError("No observations have been accumulated")
+
+        variance = self.m2 / (self.count - 1) if self.count > 1 else np.nan
+
+        return DescriptiveStats(
+            mean=float(self.mean),
+            median=np.nan,
+            mode=np.nan,
+            std=float(np.sqrt(variance)),
+            variance=float(variance),
+            min=float(self.min),
+            max=float(self.max),
+            range=float(self.max - self.min),
+            iqr=np.nan
+        )
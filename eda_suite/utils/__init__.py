@@ -4,26 +4,51 @@ Utility functions and configuration classes for EDA Suite.
 Provides data structures and helper functions used across modules.
 """
 
-from eda_suite.utils.config import (
-    TestConfig,
-    ImputationConfig,
-    VisualizationConfig
-)
-from eda_suite.utils.validators import (
-    validate_array,
-    validate_dataframe
-)
-from eda_suite.utils.transformers import (
-    standardize,
-    normalize
-)
+from eda_suite._lazy import attach
 
-__all__ = [
-    "TestConfig",
-    "ImputationConfig",
-    "VisualizationConfig",
-    "validate_array",
-    "validate_dataframe",
-    "standardize",
-    "normalize"
-]
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "config": [
+        "TestConfig",
+        "ImputationConfig",
+        "VisualizationConfig",
+        "FitConfig",
+        "CacheConfig",
+        "InputConfig",
+        "ScalingConfig",
+        "CorrelationConfig",
+        "AssociationConfig",
+        "ApproxConfig",
+        "RobustConfig",
+        "OutlierConfig",
+        "ProjectionConfig",
+        "MiniBatchConfig",
+        "SweepConfig"
+    ],
+    "cache": [
+        "enable_cache",
+        "disable_cache",
+        "clear_cache",
+        "memoize"
+    ],
+    "validators": [
+        "validate_array",
+        "validate_paired",
+        "validate_dataframe",
+        "adapt_array",
+        "set_input_policy",
+        "get_input_policy",
+        "AdaptedArray",
+        "InputCopyWarning"
+    ],
+    "results": [
+        "ResultTable"
+    ],
+    "sampling": [
+        "ReservoirSampler",
+        "required_sample_size"
+    ],
+    "transformers": [
+        "standardize",
+        "normalize"
+    ]
+})
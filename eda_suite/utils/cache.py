@@ -0,0 +1,240 @@
+"""
+Content-addressed result cache for expensive computations.
+
+Results are keyed by a hash of the input data (buffer, dtype and shape)
+and the call parameters, held in an in-memory LRU with a byte budget and
+optionally spilled to an on-disk tier. Caching is off until
+``enable_cache`` is called.
+"""
+
+import dataclasses
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, Callable, Optional
+import numpy as np
+import pandas as pd
+from eda_suite.utils.config import CacheConfig
+
+_lock = threading.Lock()
+_state = {"config": None, "memory": OrderedDict(), "memory_bytes": 0}
+
+
+def enable_cache(config: CacheConfig = CacheConfig()) -> None:
+    """
+    Turn on memoization of decorated functions.
+
+    Args:
+        config: Memory budget and optional on-disk tier settings
+    """
+    with _lock:
+        _state["config"] = config
+        if config.disk_dir is not None:
+            Path(config.disk_dir).mkdir(parents=True, exist_ok=True)
+        _evict_memory(config.max_memory_bytes)
+
+
+def disable_cache() -> None:
+    """Turn off memoization and drop the in-memory tier."""
+    with _lock:
+        _state["config"] = None
+        _evict_memory(0)
+
+
+def clear_cache() -> None:
+    """Remove every cached result from both tiers."""
+    with _lock:
+        _evict_memory(0)
+        config = _state["config"]
+        if config is not None and config.disk_dir is not None:
+            for path in Path(config.disk_dir).glob("*.pkl"):
+                path.unlink(missing_ok=True)
+
+
+def _reject_code(value: Any) -> None:
+    """
+    Refuse arguments holding functions or other callables.
+
+    Callables pickle as references to code by qualified name, not as their
+    behavior or the data they close over, so they cannot address a cache
+    entry. Containers and dataclasses are searched as well.
+
+    Raises:
+        TypeError: If ``value`` is or contains a callable
+    """
+    if callable(value) and not isinstance(value, type):
+        raise TypeError(f"{type(value).__name__} arguments are not cacheable")
+
+    if isinstance(value, dict):
+        for item in value.items():
+            _reject_code(item)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            _reject_code(item)
+    elif dataclasses.is_dataclass(value) and not isinstance(value, type):
+        for field in dataclasses.fields(value):
+            _reject_code(getattr(value, field.name))
+
+
+def _feed(digest: Any, value: Any) -> None:
+    """
+    Add one argument value to a running hash.
+
+    Memory maps and iterators are refused too: hashing the first would
+    read the whole file before a streaming computation starts, and the
+    second would consume the data.
+
+    Raises:
+        TypeError: If the value cannot identify a result (a callable,
+            memory map or iterator)
+    """
+    if isinstance(value, (np.memmap, Iterator)):
+        raise TypeError(f"{type(value).__name__} arguments are not cacheable")
+
+    if isinstance(value, np.ndarray) and value.dtype != object:
+        digest.update(f"ndarray:{value.dtype.str}:{value.shape}".encode())
+        digest.update(memoryview(np.ascontiguousarray(value)).cast("B"))
+    elif isinstance(value, (pd.DataFrame, pd.Series)):
+        frame = value.to_frame() if isinstance(value, pd.Series) else value
+        layout = (type(value).__name__, list(frame.columns), frame.dtypes.tolist())
+        digest.update(repr(layout).encode())
+        hashed = pd.util.hash_pandas_object(value, index=True).to_numpy()
+        digest.update(memoryview(hashed).cast("B"))
+    else:
+        _reject_code(value)
+        digest.update(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def make_key(func: Callable, arguments: dict) -> str:
+    """
+    Build the content-addressed key for a call.
+
+    Args:
+        func: Function being called
+        arguments: Bound arguments, defaults applied
+
+    Returns:
+        Hex digest identifying the function, data and parameters
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(f"{func.__module__}.{func.__qualname__}".encode())
+
+    for name, value in arguments.items():
+        digest.update(name.encode())
+        _feed(digest, value)
+
+    return digest.hexdigest()
+
+
+def _evict_memory(budget: int) -> None:
+    """Drop least recently used entries until the tier fits ``budget``."""
+    memory = _state["memory"]
+    while memory and _state["memory_bytes"] > budget:
+        _, payload = memory.popitem(last=False)
+        _state["memory_bytes"] -= len(payload)
+
+
+def _evict_disk(directory: str, budget: int) -> None:
+    """Drop least recently used files until the tier fits ``budget``."""
+    files = sorted(Path(directory).glob("*.pkl"), key=os.path.getmtime)
+    total = sum(path.stat().st_size for path in files)
+
+    for path in files:
+        if total <= budget:
+            break
+        total -= path.stat().st_size
+        path.unlink(missing_ok=True)
+
+
+def _lookup(key: str, config: CacheConfig) -> Optional[bytes]:
+    """Fetch a serialized result from memory, then disk."""
+    memory = _state["memory"]
+    if key in memory:
+        memory.move_to_end(key)
+        return memory[key]
+
+    if config.disk_dir is None:
+        return None
+
+    path = Path(config.disk_dir) / f"{key}.pkl"
+    if not path.exists():
+        return None
+
+    payload = path.read_bytes()
+    os.utime(path)
+    _store_memory(key, payload, config)
+
+    return payload
+
+
+def _store_memory(key: str, payload: bytes, config: CacheConfig) -> None:
+    """Insert a serialized result into the memory tier."""
+    if key in _state["memory"] or len(payload) > config.max_memory_bytes:
+        return
+
+    _state["memory"][key] = payload
+    _state["memory_bytes"] += len(payload)
+    _evict_memory(config.max_memory_bytes)
+
+
+def _store(key: str, payload: bytes, config: CacheConfig) -> None:
+    """Insert a serialized result into both tiers."""
+    _store_memory(key, payload, config)
+
+    if config.disk_dir is not None and len(payload) <= config.max_disk_bytes:
+        path = Path(config.disk_dir) / f"{key}.pkl"
+        temporary = path.with_suffix(f".{os.getpid()}.tmp")
+        temporary.write_bytes(payload)
+        os.replace(temporary, path)
+        _evict_disk(config.disk_dir, config.max_disk_bytes)
+
+
+def memoize(func: Callable) -> Callable:
+    """
+    Cache a function's results when caching is enabled.
+
+    Results are stored serialized, so callers always get a fresh copy and
+    cannot corrupt the cache by mutating what they receive. Calls with an
+    argument that cannot be hashed by content (a function, an iterator or
+    a memory map) are not cached.
+
+    Args:
+        func: Deterministic function of its arguments
+
+    Returns:
+        Wrapped function
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        config = _state["config"]
+        if config is None:
+            return func(*args, **kwargs)
+
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        try:
+            key = make_key(func, bound.arguments)
+        except (TypeError, AttributeError, pickle.PicklingError):
+            return func(*args, **kwargs)
+
+        with _lock:
+            payload = _lookup(key, config)
+        if payload is not None:
+            return pickle.loads(payload)
+
+        result = func(*args, **kwargs)
+        payload = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        with _lock:
+            _store(key, payload, config)
+
+        return result
+
+    return wrapper
@@ -5,7 +5,7 @@ Following SOLID principles by encapsulating configuration logic.
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, List
+from typing import Any, Callable, Dict, Optional, List, Sequence
 
 
 @dataclass
@@ -60,3 +60,310 @@ class VisualizationConfig:
         valid_contexts = ["paper", "notebook", "talk", "poster"]
         if self.context not in valid_contexts:
             raise ValueError(f"Context must be one of {valid_contexts}")
+
+
+@dataclass
+class FitConfig:
+    """
+    Configuration for batch distribution fitting.
+
+    ``timeout`` limits each fit with a SIGALRM timer and is best effort:
+    it is only enforced on POSIX in the main thread (or a worker process)
+    and is skipped, with a warning, elsewhere. ``deadline`` bounds the
+    whole batch cooperatively: fits that would start after it are
+    skipped, but a running fit is never interrupted.
+    """
+
+    distributions: List[str] = field(default_factory=lambda: [
+        "norm", "expon", "gamma", "lognorm", "weibull_min"
+    ])
+    n_jobs: Optional[int] = None
+    timeout: Optional[float] = None
+    deadline: Optional[float] = None
+    fixed_loc: Dict[str, float] = field(default_factory=dict)
+
+    def __post_init__(self):
+        """Validate configuration parameters."""
+        if self.n_jobs is not None and self.n_jobs < 1:
+            raise ValueError("n_jobs must be positive")
+
+        unknown = set(self.fixed_loc) - set(self.distributions)
+        if unknown:
+            raise ValueError(f"fixed_loc names unfitted distributions: {sorted(unknown)}")
+
+        if self.timeout is not None and self.timeout <= 0:
+            raise ValueError("timeout must be positive")
+
+        if self.deadline is not None and self.deadline <= 0:
+            raise ValueError("deadline must be positive")
+
+
+@dataclass
+class CacheConfig:
+    """Configuration for the result cache."""
+
+    max_memory_bytes: int = 256 * 1024 ** 2
+    disk_dir: Optional[str] = None
+    max_disk_bytes: int = 2 * 1024 ** 3
+
+    def __post_init__(self):
+        """Validate configuration parameters."""
+        if self.max_memory_bytes < 0 or self.max_disk_bytes < 0:
+            raise ValueError("Cache size budgets must be non-negative")
+
+
+@dataclass
+class InputConfig:
+    """Input handling policy shared by every validated array."""
+
+    nan_policy: str = "propagate"
+    float_dtype: Optional[str] = None
+    warn_on_copy: bool = False
+
+    def __post_init__(self):
+        """Validate configuration parameters."""
+        valid_policies = ["propagate", "raise", "omit"]
+        if self.nan_policy not in valid_policies:
+            raise ValueError(f"nan_policy must be one of {valid_policies}")
+
+        valid_dtypes = [None, "float32", "float64"]
+        if self.float_dtype not in valid_dtypes:
+            raise ValueError(f"float_dtype must be one of {valid_dtypes}")
+
+
+@dataclass
+class ScalingConfig:
+    """
+    Configuration for standardization and normalization.
+
+    ``out`` is an optional floating buffer with the input's shape that
+    receives the result; pass the input itself to scale in place.
+    """
+
+    robust: bool = False
+    chunk_size: Optional[int] = None
+    out: Optional[Any] = None
+
+    def __post_init__(self):
+        """Validate configuration parameters."""
+        if self.chunk_size is not None and self.chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+
+
+@dataclass
+class ApproxConfig:
+    """
+    Configuration for sampling-based approximate statistics.
+
+    ``strata_column`` names the DataFrame column holding stratum labels for
+    ``compute_correlation_matrix``; paired inputs take their labels as a
+    third array instead.
+    """
+
+    sample_size: Optional[int] = None
+    target_error: float = 0.01
+    confidence: float = 0.95
+    interval: str = "analytic"
+    n_bootstrap: int = 200
+    strata_column: Optional[Any] = None
+    max_strata: Optional[int] = 100
+    chunk_size: int = 1_000_000
+    seed: Optional[int] = None
+
+    def __post_init__(self):
+        """Validate configuration parameters."""
+        if self.sample_size is not None and self.sample_size < 4:
+            raise ValueError("sample_size must be at least 4")
+
+        if not 0 < self.target_error < 1:
+            raise ValueError("target_error must be between 0 and 1")
+
+        if not 0 < self.confidence < 1:
+            raise ValueError("confidence must be between 0 and 1")
+
+        if self.interval not in ("analytic", "bootstrap"):
+            raise ValueError("interval must be 'analytic' or 'bootstrap'")
+
+        if self.n_bootstrap < 1 or self.chunk_size < 1:
+            raise ValueError("n_bootstrap and chunk_size must be positive")
+
+        if self.max_strata is not None and self.max_strata < 1:
+            raise ValueError("max_strata must be positive")
+
+
+@dataclass
+class CorrelationConfig:
+    """
+    Configuration for correlation matrices.
+
+    ``missing`` and ``approx`` (estimate from a reservoir sample) apply to
+    ``compute_correlation_matrix``, the rest to blocked (tiled) correlation.
+    ``out`` is an optional (p, p) array, typically
+    ``np.lib.format.open_memmap``, receiving the full matrix; ``callback``
+    is called as ``callback(rows, cols, tile)`` for every upper-triangle
+    tile.
+    """
+
+    block_size: int = 2048
+    n_jobs: Optional[int] = None
+    top_k: Optional[int] = 100
+    threshold: Optional[float] = None
+    missing: str = "pairwise"
+    approx: Optional[ApproxConfig] = None
+    out: Optional[Any] = None
+    callback: Optional[Callable] = None
+
+    def __post_init__(self):
+        """Validate configuration parameters."""
+        if self.block_size < 1:
+            raise ValueError("block_size must be positive")
+
+        if self.n_jobs is not None and self.n_jobs < 1:
+            raise ValueError("n_jobs must be positive")
+
+        if self.top_k is not None and self.top_k < 1:
+            raise ValueError("top_k must be positive")
+
+        if self.threshold is not None and not 0 <= self.threshold <= 1:
+            raise ValueError("threshold must be between 0 and 1")
+
+        if self.missing not in ("pairwise", "listwise"):
+            raise ValueError("missing must be 'pairwise' or 'listwise'")
+
+        if self.callback is not None and not callable(self.callback):
+            raise ValueError("callback must be callable")
+
+
+@dataclass
+class AssociationConfig:
+    """Configuration for the all-pairs categorical association matrix."""
+
+    columns: Optional[List] = None
+    n_jobs: Optional[int] = None
+
+    def __post_init__(self):
+        """Validate configuration parameters."""
+        if self.n_jobs is not None and self.n_jobs < 1:
+            raise ValueError("n_jobs must be positive")
+
+
+@dataclass
+class RobustConfig:
+    """Configuration for the FastMCD robust location/scatter estimator."""
+
+    support_fraction: Optional[float] = None
+    n_starts: int = 500
+    max_subset: int = 1500
+    n_subsets: int = 5
+    quantile: float = 0.975
+    n_jobs: Optional[int] = None
+    seed: Optional[int] = 0
+
+    def __post_init__(self):
+        """Validate configuration parameters."""
+        if self.support_fraction is not None and not 0.5 <= self.support_fraction <= 1:
+            raise ValueError("support_fraction must be between 0.5 and 1")
+
+        if self.n_starts < 1 or self.n_subsets < 1:
+            raise ValueError("n_starts and n_subsets must be positive")
+
+        if self.max_subset < self.n_subsets:
+            raise ValueError("max_subset must be at least n_subsets")
+
+        if not 0 < self.quantile < 1:
+            raise ValueError("quantile must be between 0 and 1")
+
+        if self.n_jobs is not None and self.n_jobs < 1:
+            raise ValueError("n_jobs must be positive")
+
+
+@dataclass
+class OutlierConfig:
+    """Configuration for Mahalanobis-distance outlier detection."""
+
+    robust: bool = False
+    threshold: Optional[float] = None
+    block_size: int = 65536
+    mcd: RobustConfig = field(default_factory=RobustConfig)
+
+    def __post_init__(self):
+        """Validate configuration parameters."""
+        if self.threshold is not None and self.threshold <= 0:
+            raise ValueError("threshold must be positive")
+
+        if self.block_size < 1:
+            raise ValueError("block_size must be positive")
+
+
+@dataclass
+class ProjectionConfig:
+    """Configuration for projection-pursuit outlier detection."""
+
+    criterion: str = "kurtosis"
+    directions: str = "random"
+    n_directions: int = 2000
+    direction_block: int = 256
+    whisker: float = 1.5
+    max_trim: float = 0.1
+    seed: Optional[int] = 0
+
+    def __post_init__(self):
+        """Validate configuration parameters."""
+        if self.criterion not in ("kurtosis", "skewness", "variance"):
+            raise ValueError("criterion must be 'kurtosis', 'skewness' or 'variance'")
+
+        if self.directions not in ("random", "spherical", "data"):
+            raise ValueError("directions must be 'random', 'spherical' or 'data'")
+
+        if self.n_directions < 1 or self.direction_block < 1:
+            raise ValueError("n_directions and direction_block must be positive")
+
+        if self.whisker <= 0:
+            raise ValueError("whisker must be positive")
+
+        if not 0 <= self.max_trim < 1:
+            raise ValueError("max_trim must be between 0 and 1")
+
+
+@dataclass
+class MiniBatchConfig:
+    """Configuration for streaming (mini-batch) k-means."""
+
+    batch_size: int = 4096
+    chunk_size: int = 1_000_000
+    n_epochs: int = 1
+    init_size: Optional[int] = None
+    seed: Optional[int] = 42
+
+    def __post_init__(self):
+        """Validate configuration parameters."""
+        if self.batch_size < 1 or self.chunk_size < 1:
+            raise ValueError("batch_size and chunk_size must be positive")
+
+        if self.n_epochs < 1:
+            raise ValueError("n_epochs must be positive")
+
+        if self.init_size is not None and self.init_size < 1:
+            raise ValueError("init_size must be positive")
+
+
+@dataclass
+class SweepConfig:
+    """Configuration for the k-means sweep over numbers of clusters."""
+
+    k_values: Sequence[int] = tuple(range(2, 11))
+    n_jobs: Optional[int] = None
+    warm_start: bool = True
+    silhouette_sample: int = 5000
+    seed: Optional[int] = 42
+
+    def __post_init__(self):
+        """Validate configuration parameters."""
+        if len(self.k_values) == 0 or min(self.k_values) < 2:
+            raise ValueError("k_values must be non-empty and at least 2")
+
+        if self.n_jobs is not None and self.n_jobs < 1:
+            raise ValueError("n_jobs must be positive")
+
+        if self.silhouette_sample < 2:
+            raise ValueError("silhouette_sample must be at least 2")
@@ -0,0 +1,199 @@
+"""
+Columnar containers for bulk statistical results.
+
+``ResultTable`` stores many results of one result dataclass as one array
+per field (struct of arrays) instead of one object per result. Columns
+convert to pandas or Arrow without copying, and the legacy dataclasses are
+only built when the table is iterated.
+"""
+
+import sys
+from dataclasses import fields, is_dataclass
+from typing import Any, Dict, Iterable, Iterator, Optional, Type
+import numpy as np
+import pandas as pd
+
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+ROWS_PER_BATCH = 4096
+
+
+class ResultTable:
+    """
+    Struct-of-arrays table of results sharing one dataclass schema.
+
+    Field values that are the same for every row (such as ``test_name``)
+    are kept once as constants rather than repeated per row.
+    """
+
+    def __init__(
+        self,
+        record_type: Type,
+        columns: Dict[str, np.ndarray],
+        constants: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Args:
+            record_type: Result dataclass describing one row
+            columns: Mapping of field name to 1-D array (one entry per row)
+            constants: Mapping of field name to a value shared by all rows
+        """
+        constants = dict(constants or {})
+        names = [f.name for f in fields(record_type)]
+        missing = set(names) - set(columns) - set(constants)
+        if missing:
+            raise ValueError(f"Missing fields: {sorted(missing)}")
+
+        columns = {name: np.asarray(columns[name]) for name in names
+                   if name in columns}
+        lengths = {values.shape for values in columns.values()}
+        if len(lengths) > 1 or any(len(shape) != 1 for shape in lengths):
+            raise ValueError("Columns must be 1-D arrays of equal length")
+
+        self.record_type = record_type
+        self.columns = columns
+        self.constants = {name: constants[name] for name in names
+                          if name in constants}
+        self.n_rows = lengths.pop()[0] if lengths else 0
+
+    @classmethod
+    def from_records(cls, records: Iterable) -> "ResultTable":
+        """
+        Build a table from result dataclass instances.
+
+        Args:
+            records: Non-empty iterable of instances of one dataclass
+
+        Returns:
+            ResultTable with one row per record
+        """
+        records = list(records)
+        if not records:
+            raise ValueError("records cannot be empty")
+
+        record_type = type(records[0])
+        columns = {
+            f.name: np.array([getattr(record, f.name) for record in records])
+            for f in fields(record_type)
+        }
+
+        return cls(record_type, columns)
+
+    @classmethod
+    def from_result(cls, result: Any) -> "ResultTable":
+        """
+        Build a table from a batched result whose fields hold arrays.
+
+        Array fields are flattened (as views where possible); scalar fields
+        become constants.
+
+        Args:
+            result: Result dataclass instance with array-valued fields
+
+        Returns:
+            ResultTable with one row per array element
+        """
+        if not is_dataclass(result):
+            raise ValueError("result must be a dataclass instance")
+
+        columns, constants = {}, {}
+        for f in fields(result):
+            value = getattr(result, f.name)
+            if isinstance(value, np.ndarray):
+                columns[f.name] = value.ravel()
+            else:
+                constants[f.name] = value
+
+        return cls(type(result), columns, constants)
+
+    def __len__(self) -> int:
+        """Number of rows."""
+        return self.n_rows
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        """Return one field as an array (constants are broadcast)."""
+        if name in self.columns:
+            return self.columns[name]
+        if name in self.constants:
+            return np.broadcast_to(np.asarray(self.constants[name]), (self.n_rows,))
+        raise KeyError(name)
+
+    def __getattr__(self, name: str) -> np.ndarray:
+        """Expose fields as attributes, like the result dataclasses."""
+        state = self.__dict__
+        if name in state.get("columns", {}) or name in state.get("constants", {}):
+            return self[name]
+        raise AttributeError(name)
+
+    def __iter__(self) -> Iterator:
+        """Yield one result dataclass per row, built lazily in batches."""
+        for start in range(0, self.n_rows, ROWS_PER_BATCH):
+            rows = slice(start, start + ROWS_PER_BATCH)
+            batch = {name: values[rows].tolist()
+                     for name, values in self.columns.items()}
+            for index in range(len(next(iter(batch.values())))):
+                values = {name: column[index] for name, column in batch.items()}
+                yield self.record_type(**values, **self.constants)
+
+    def __repr__(self) -> str:
+        """Summarize the schema and size."""
+        return (f"ResultTable({self.record_type.__name__}, "
+                f"{self.n_rows} rows, fields={list(self.columns)})")
+
+    def to_pandas(self) -> pd.DataFrame:
+        """
+        Convert to a DataFrame whose columns reuse the stored arrays.
+
+        Constant fields become single-category categoricals (one byte per
+        row); constants that are None (unset optional fields) become
+        all-NaN columns.
+
+        Returns:
+            DataFrame with one column per field
+        """
+        data = dict(self.columns)
+        codes = np.zeros(self.n_rows, dtype=np.int8)
+        for name, value in self.constants.items():
+            if value is None:
+                data[name] = np.full(self.n_rows, np.nan)
+            else:
+                data[name] = pd.Categorical.from_codes(codes, categories=[value])
+
+        order = [f.name for f in fields(self.record_type)]
+        return pd.DataFrame({name: data[name] for name in order}, copy=False)
+
+    def to_arrow(self):
+        """
+        Convert to a pyarrow Table.
+
+        Numeric columns are wrapped without copying (booleans are bit-packed
+        by Arrow); constant fields become dictionary-encoded columns, and
+        None constants all-null columns.
+
+        Returns:
+            pyarrow.Table with one column per field
+        """
+        import pyarrow as pa
+
+        codes = pa.array(np.zeros(self.n_rows, dtype=np.int8))
+        arrays = {name: pa.array(values) for name, values in self.columns.items()}
+        for name, value in self.constants.items():
+            if value is None:
+                arrays[name] = pa.nulls(self.n_rows)
+            else:
+                arrays[name] = pa.DictionaryArray.from_arrays(codes, pa.array([value]))
+
+        order = [f.name for f in fields(self.record_type)]
+        return pa.table({name: arrays[name] for name in order})
+
+    def to_parquet(self, path: str, **kwargs) -> None:
+        """
+        Write the table to a Parquet file through Arrow.
+
+        Args:
+            path: Destination file
+            **kwargs: Passed to ``pyarrow.parquet.write_table``
+        """
+        import pyarrow.parquet as pq
+
+        pq.write_table(self.to_arrow(), path, **kwargs)
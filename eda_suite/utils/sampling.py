@@ -0,0 +1,328 @@
+"""
+Reservoir sampling and confidence intervals for approximate statistics.
+
+``ReservoirSampler`` draws a uniform (or proportionally stratified) sample
+of rows in one pass over chunks. Every row gets a uniform random key and,
+per stratum, the rows with the smallest keys are kept, so samplers fed
+disjoint parts of the data can be merged.
+"""
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+from typing import Callable, Iterable, Iterator, Optional, Sequence, Tuple
+from eda_suite.utils.config import ApproxConfig
+from eda_suite.utils.validators import _is_arrow, validate_paired
+
+
+class ReservoirSampler:
+    """
+    Bottom-k reservoir of rows, optionally kept per stratum.
+
+    The proportional allocation is only known once every row has been
+    seen, so a stratified reservoir keeps up to ``size`` rows for every
+    stratum: memory is bounded by ``size`` x the number of strata, which
+    is capped by ``max_strata``.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        seed: Optional[int] = None,
+        max_strata: Optional[int] = 100
+    ):
+        """
+        Args:
+            size: Number of rows to sample (and to keep per stratum)
+            seed: Random seed
+            max_strata: Most distinct strata accepted (None for no limit)
+        """
+        self.size = size
+        self.max_strata = max_strata
+        self.rng = np.random.default_rng(seed)
+        self.n_seen = 0
+        self.stratum_counts = pd.Series(dtype=np.int64)
+        self._keys = np.empty(0)
+        self._strata = None
+        self._rows = None
+
+    def _add_counts(self, counts: pd.Series) -> None:
+        """Add rows per stratum, rejecting more than ``max_strata`` strata."""
+        totals = self.stratum_counts.add(counts, fill_value=0).astype(np.int64)
+        if self.max_strata is not None and len(totals) > self.max_strata:
+            raise ValueError(
+                f"More than max_strata={self.max_strata} strata; the reservoir "
+                f"keeps up to {self.size} rows for each one"
+            )
+        self.stratum_counts = totals
+
+    def _floors(self, labels: Optional[np.ndarray]) -> np.ndarray:
+        """Largest key a new row of each label may have to enter."""
+        if labels is None:
+            full = len(self._keys) >= self.size
+            return self._keys.max() if full else 1.0
+        if self._strata is None:
+            return np.ones(len(labels))
+
+        kept = pd.Series(self._keys).groupby(self._strata, sort=False)
+        floors = kept.max().where(kept.size() >= self.size, 1.0)
+        return floors.reindex(labels, fill_value=1.0).to_numpy()
+
+    def _keep(
+        self,
+        keys: np.ndarray,
+        labels: Optional[np.ndarray],
+        rows: np.ndarray
+    ) -> None:
+        """Merge candidates into the reservoir and keep the smallest keys."""
+        if self._rows is not None and (labels is None) != (self._strata is None):
+            raise ValueError("Cannot mix stratified and unstratified rows")
+
+        keys = np.concatenate([self._keys, keys])
+        rows = rows if self._rows is None else np.vstack([self._rows, rows])
+
+        if labels is None:
+            order = np.arange(len(keys))
+            if len(keys) > self.size:
+                order = np.argpartition(keys, self.size - 1)[:self.size]
+            self._keys, self._rows = keys[order], rows[order]
+            return
+
+        if self._strata is not None:
+            labels = np.concatenate([self._strata, labels])
+        codes = pd.factorize(labels)[0]
+        order = np.lexsort((keys, codes))
+        grouped = codes[order]
+        rank = np.arange(len(order)) - np.searchsorted(grouped, grouped)
+        order = order[rank < self.size]
+
+        self._keys, self._strata, self._rows = keys[order], labels[order], rows[order]
+
+    def update(
+        self,
+        chunk: np.ndarray,
+        strata: Optional[Sequence] = None
+    ) -> "ReservoirSampler":
+        """
+        Offer a chunk of rows to the reservoir.
+
+        Args:
+            chunk: (n, p) array of rows (1-D arrays are one column)
+            strata: Optional stratum label of every row
+
+        Returns:
+            Self for method chaining
+        """
+        rows = np.asarray(chunk)
+        rows = rows.reshape(len(rows), -1)
+
+        if strata is None:
+            labels = None
+            counts = pd.Series({None: len(rows)})
+        else:
+            labels = np.asarray(strata, dtype=object)
+            if len(labels) != len(rows):
+                raise ValueError("strata must have one label per row")
+            counts = pd.Series(labels).value_counts()
+
+        self._add_counts(counts)
+        self.n_seen += len(rows)
+
+        keys = self.rng.random(len(rows))
+        candidates = np.flatnonzero(keys < self._floors(labels))
+        self._keep(keys[candidates],
+                   None if labels is None else labels[candidates],
+                   rows[candidates])
+
+        return self
+
+    def merge(self, other: "ReservoirSampler") -> "ReservoirSampler":
+        """
+        Fold in a sampler that saw a disjoint part of the data.
+
+        Args:
+            other: Sampler with the same size, row width and stratification
+
+        Returns:
+            Self for method chaining
+        """
+        self._add_counts(other.stratum_counts)
+        self.n_seen += other.n_seen
+        if other._rows is not None:
+            self._keep(other._keys, other._strata, other._rows)
+
+        return self
+
+    def sample(self) -> np.ndarray:
+        """
+        The sampled rows.
+
+        With several strata, each stratum contributes rows in proportion
+        to its share of the data (at least one), so the sample needs no
+        weights.
+
+        Returns:
+            (k, p) array of sampled rows
+        """
+        if self._rows is None:
+            raise ValueError("No rows have been sampled")
+
+        counts = self.stratum_counts
+        if self._strata is None or len(counts) == 1:
+            return self._rows
+
+        allocation = np.maximum(np.round(self.size * counts / counts.sum()), 1)
+        labels = pd.Series(self._strata)
+        rank = labels.groupby(labels, sort=False).cumcount().to_numpy()
+        quota = allocation.reindex(self._strata).to_numpy()
+
+        return self._rows[rank < quota]
+
+
+def required_sample_size(target_error: float, confidence: float = 0.95) -> int:
+    """
+    Sample size whose confidence interval for a correlation has half-width
+    at most ``target_error`` (worst case, a true correlation of zero).
+
+    Args:
+        target_error: Desired half-width on the correlation scale
+        confidence: Confidence level
+
+    Returns:
+        Number of rows to sample
+    """
+    z = stats.norm.ppf(0.5 + confidence / 2)
+    return int(np.ceil((z / target_error) ** 2)) + 3
+
+
+def row_chunks(data, chunk_size: int) -> Iterator:
+    """Yield consecutive row slices of an array, DataFrame or Arrow table."""
+    for start in range(0, len(data), chunk_size):
+        if isinstance(data, pd.DataFrame):
+            yield data.iloc[start:start + chunk_size]
+        elif _is_arrow(data):
+            yield data.slice(start, chunk_size)
+        else:
+            yield data[start:start + chunk_size]
+
+
+def _split_chunk(chunk) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """Rows and stratum labels of a chunk given as rows or (rows, labels)."""
+    if isinstance(chunk, tuple):
+        return chunk
+    return chunk, None
+
+
+def draw_sample(
+    chunks: Iterable,
+    config: ApproxConfig
+) -> np.ndarray:
+    """
+    Reservoir-sample rows from a stream of chunks in one pass.
+
+    Args:
+        chunks: Iterable of (n_i, p) arrays covering the data in order, or
+            of (rows, labels) pairs to sample proportionally per stratum
+        config: Sample size (or target error), strata limit and seed
+
+    Returns:
+        (k, p) array of sampled rows
+    """
+    size = config.sample_size or required_sample_size(config.target_error,
+                                                     config.confidence)
+    sampler = ReservoirSampler(size, config.seed, config.max_strata)
+
+    for chunk in chunks:
+        sampler.update(*_split_chunk(chunk))
+
+    return sampler.sample()
+
+
+def draw_paired_sample(
+    arrays: Tuple[np.ndarray, ...],
+    config: ApproxConfig
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reservoir-sample the same rows of two arrays in one pass.
+
+    Args:
+        arrays: Tuple of (x, y), or (x, y, strata) with one stratum label
+            per row; x has shape (n,) or (n, k) and y (n,) or (n, m)
+        config: Sample size (or target error), chunking and seed
+
+    Returns:
+        Tuple of (sampled x, sampled y), keeping the input dimensions
+    """
+    x_arr, y_arr = validate_paired(*arrays[:2])
+    strata = np.asarray(arrays[2]) if len(arrays) > 2 else None
+    if len(x_arr) != len(y_arr):
+        raise ValueError("x and y must have the same number of rows")
+    if strata is not None and len(strata) != len(x_arr):
+        raise ValueError("strata must have one label per row")
+
+    def chunks():
+        for start in range(0, len(x_arr), config.chunk_size):
+            rows = slice(start, start + config.chunk_size)
+            joined = np.hstack([x_arr[rows].reshape(len(x_arr[rows]), -1),
+                                y_arr[rows].reshape(len(y_arr[rows]), -1)])
+            yield joined if strata is None else (joined, strata[rows])
+
+    width = int(np.prod(x_arr.shape[1:], dtype=np.int64))
+    sample = draw_sample(chunks(), config)
+
+    return (sample[:, :width].reshape((-1,) + x_arr.shape[1:]),
+            sample[:, width:].reshape((-1,) + y_arr.shape[1:]))
+
+
+def fisher_interval(
+    r: np.ndarray,
+    n: np.ndarray,
+    confidence: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Confidence interval of Pearson correlations through Fisher's z.
+
+    Args:
+        r: Sample correlations
+        n: Observations behind each correlation
+        confidence: Confidence level
+
+    Returns:
+        Tuple of (lower, upper) bounds (NaN where n <= 3)
+    """
+    z = stats.norm.ppf(0.5 + confidence / 2)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        center = np.arctanh(np.clip(r, -1.0, 1.0))
+        half = z / np.sqrt(np.where(n > 3, n - 3.0, np.nan))
+
+    return np.tanh(center - half), np.tanh(center + half)
+
+
+def bootstrap_interval(
+    statistic: Callable[..., np.ndarray],
+    samples: Sequence[np.ndarray],
+    config: ApproxConfig
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Percentile bootstrap interval of a statistic of sampled rows.
+
+    Args:
+        statistic: Function of the resampled arrays returning an array
+        samples: Arrays sharing their first (row) axis, resampled together
+        config: Number of replicates, confidence level and seed
+
+    Returns:
+        Tuple of (lower, upper) bounds with the statistic's shape
+    """
+    rng = np.random.default_rng(config.seed)
+    n_rows = len(samples[0])
+    replicates = []
+
+    for _ in range(config.n_bootstrap):
+        rows = rng.integers(0, n_rows, n_rows)
+        replicates.append(np.asarray(statistic(*(s[rows] for s in samples))))
+
+    tail = 50 * (1 - config.confidence)
+    with np.errstate(invalid="ignore"):
+        return (np.nanpercentile(replicates, tail, axis=0),
+                np.nanpercentile(replicates, 100 - tail, axis=0))
@@ -2,47 +2,209 @@
 Data transformation utilities.
 
 Provides standardization and normalization functions.
+
+Both functions scale 1-D arrays as a whole and 2-D arrays column by
+column. Floating inputs keep their dtype (float32 stays float32), results
+can be written into ``ScalingConfig.out`` (pass the input itself to scale
+in place), and
+``ScalingConfig.chunk_size`` processes row blocks so that memory-mapped
+inputs are never loaded whole.
 """
 
 import numpy as np
+from typing import Iterator, Optional, Tuple
+from eda_suite.utils.config import ScalingConfig
 from eda_suite.utils.validators import validate_array
 
+MAD_TO_STD = 1.4826
+
+
+def _prepare(
+    data: np.ndarray,
+    out: Optional[np.ndarray]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Validate input and output buffers as (n_samples, n_columns) views.
+
+    Args:
+        data: 1-D or 2-D input
+        out: Optional output buffer with the input's shape
+
+    Returns:
+        Tuple of (input matrix, output matrix, output buffer)
+    """
+    arr = validate_array(data)
+    if arr.ndim > 2:
+        raise ValueError("Array must be 1-D or 2-D")
+
+    dtype = arr.dtype if np.issubdtype(arr.dtype, np.floating) else np.float64
+    if out is None:
+        out = np.empty(arr.shape, dtype=dtype)
+    elif out.shape != arr.shape or not np.issubdtype(out.dtype, np.floating):
+        raise ValueError("out must be a floating array with the input's shape")
+
+    if arr.ndim == 1:
+        return arr[:, None], out[:, None], out
+
+    return arr, out, out
+
+
+def _blocks(n_rows: int, chunk_size: Optional[int]) -> Iterator[slice]:
+    """Yield row slices of at most ``chunk_size`` rows."""
+    step = chunk_size or max(n_rows, 1)
+    for start in range(0, n_rows, step):
+        yield slice(start, start + step)
+
+
+def _apply(
+    arrays: Tuple[np.ndarray, np.ndarray],
+    params: Tuple[np.ndarray, np.ndarray],
+    chunk_size: Optional[int]
+) -> None:
+    """
+    Write (x - center) / scale block by block.
+
+    Args:
+        arrays: Tuple of (input matrix, output matrix)
+        params: Tuple of (center, scale) per column; zero scale maps to 0
+        chunk_size: Rows per block (None for one block)
+    """
+    matrix, result = arrays
+    center = params[0].astype(result.dtype)
+    scale = np.where(params[1] == 0, 1, params[1]).astype(result.dtype)
+
+    for rows in _blocks(matrix.shape[0], chunk_size):
+        np.subtract(matrix[rows], center, out=result[rows], casting="unsafe")
+        np.divide(result[rows], scale, out=result[rows])
+
+
+def _moment_params(
+    matrix: np.ndarray,
+    chunk_size: Optional[int]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Column means and sample standard deviations in one blocked pass.
+
+    Block results are combined with Chan's pairwise update.
+
+    Args:
+        matrix: (n, p) input
+        chunk_size: Rows per block (None for one block)
+
+    Returns:
+        Tuple of (mean, std with ddof=1)
+    """
+    count, mean, m2 = 0, 0.0, 0.0
+
+    for rows in _blocks(matrix.shape[0], chunk_size):
+        block = matrix[rows]
+        n_b = block.shape[0]
+        mean_b = np.mean(block, axis=0, dtype=np.float64)
+        m2_b = np.sum((block - mean_b) ** 2, axis=0, dtype=np.float64)
+
+        delta = mean_b - mean
+        total = count + n_b
+        mean = mean + delta * n_b / total
+        m2 = m2 + m2_b + delta ** 2 * count * n_b / total
+        count = total
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return mean, np.sqrt(m2 / (count - 1))
 
-def standardize(data: np.ndarray) -> np.ndarray:
+
+def _robust_params(
+    matrix: np.ndarray,
+    chunk_size: Optional[int]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Column medians and normal-consistent MADs.
+
+    Exact in memory; with ``chunk_size`` both are estimated from
+    bounded-memory quantile sketches (one pass each).
+
+    Args:
+        matrix: (n, p) input
+        chunk_size: Rows per block (None for exact in-memory estimates)
+
+    Returns:
+        Tuple of (median, MAD * 1.4826)
+    """
+    if chunk_size is None:
+        median = np.median(matrix, axis=0)
+        mad = np.median(np.abs(matrix - median), axis=0)
+        return median, mad * MAD_TO_STD
+
+    from eda_suite.univariate.sketch import QuantileSketch
+
+    def column_medians(transform):
+        sketches = [QuantileSketch() for _ in range(matrix.shape[1])]
+        for rows in _blocks(matrix.shape[0], chunk_size):
+            block = transform(matrix[rows])
+            for column, sketch in enumerate(sketches):
+                sketch.update(block[:, column])
+        return np.array([s.quantiles([0.5])[0] for s in sketches])
+
+    median = column_medians(lambda block: block)
+    mad = column_medians(lambda block: np.abs(block - median))
+
+    return median, mad * MAD_TO_STD
+
+
+def standardize(
+    data: np.ndarray,
+    config: ScalingConfig = ScalingConfig()
+) -> np.ndarray:
     """
     Standardize data to mean=0 and std=1.
 
+    With ``config.robust`` the data is centered on the median and scaled by
+    the normal-consistent median absolute deviation instead.
+
     Args:
-        data: Input array
+        data: Input array (1-D, or 2-D scaled column-wise)
+        config: Robust scaling, chunking and output buffer options
 
     Returns:
         Standardized array
     """
-    arr = validate_array(data)
-    mean = np.mean(arr)
-    std = np.std(arr, ddof=1)
+    matrix, result, out = _prepare(data, config.out)
+
+    if config.robust:
+        params = _robust_params(matrix, config.chunk_size)
+    else:
+        params = _moment_params(matrix, config.chunk_size)
 
-    if std == 0:
-        return np.zeros_like(arr)
+    _apply((matrix, result), params, config.chunk_size)
 
-    return (arr - mean) / std
+    return out
 
 
-def normalize(data: np.ndarray) -> np.ndarray:
+def normalize(
+    data: np.ndarray,
+    config: ScalingConfig = ScalingConfig()
+) -> np.ndarray:
     """
     Normalize data to range [0, 1].
 
     Args:
-        data: Input array
+        data: Input array (1-D, or 2-D scaled column-wise)
+        config: Chunking and output buffer options (robust scaling is not
+            defined here)
 
     Returns:
         Normalized array
     """
-    arr = validate_array(data)
-    min_val = np.min(arr)
-    max_val = np.max(arr)
+    if config.robust:
+        raise ValueError("Robust scaling is only available in standardize")
+
+    matrix, result, out = _prepare(data, config.out)
+    low = np.full(matrix.shape[1], np.inf)
+    high = np.full(matrix.shape[1], -np.inf)
+
+    for rows in _blocks(matrix.shape[0], config.chunk_size):
+        low = np.minimum(low, np.min(matrix[rows], axis=0))
+        high = np.maximum(high, np.max(matrix[rows], axis=0))
 
-    if max_val == min_val:
-        return np.zeros_like(arr)
+    _apply((matrix, result), (low, high - low), config.chunk_size)
 
-    return (arr - min_val) / (max_val - min_val)
+    return out
@@ -2,19 +2,175 @@
 Input validation functions for EDA Suite.
 
 Ensures data integrity following defensive programming principles.
+
+Inputs are adapted to NumPy without copying whenever the source layout
+allows it (ndarrays and memory maps, buffer-protocol objects, Arrow arrays
+without nulls, pandas NumPy-backed and nullable dtypes without missing
+values). The process-wide ``InputConfig`` set with ``set_input_policy``
+decides NaN handling and float dtype for every module.
 """
 
+import warnings
 import numpy as np
 import pandas as pd
-from typing import Union
+from dataclasses import dataclass, replace
+from typing import Any, Optional, Tuple, Union
+from eda_suite.utils.config import InputConfig
+
+_policy = {"config": InputConfig()}
+
+
+class InputCopyWarning(UserWarning):
+    """Warning emitted when an input could not be used without a copy."""
+
+
+@dataclass
+class AdaptedArray:
+    """NumPy view of an input plus how it was obtained."""
+
+    values: np.ndarray
+    copied: bool
+    reason: str
+
+
+def set_input_policy(config: InputConfig) -> None:
+    """
+    Set the NaN and dtype policy inherited by every module.
+
+    Args:
+        config: Input handling policy
+    """
+    _policy["config"] = config
+
+
+def get_input_policy() -> InputConfig:
+    """
+    Get the active input handling policy.
+
+    Returns:
+        Current InputConfig
+    """
+    return _policy["config"]
+
+
+def _is_arrow(data: Any) -> bool:
+    """Check for a pyarrow object without importing pyarrow."""
+    return type(data).__module__.split(".")[0] == "pyarrow"
 
 
-def validate_array(data: Union[np.ndarray, list]) -> np.ndarray:
+def is_tabular(data: Any) -> bool:
+    """
+    Check whether input is a table (pandas DataFrame or pyarrow Table).
+
+    Args:
+        data: Any input
+
+    Returns:
+        True for DataFrame-like inputs
+    """
+    return isinstance(data, pd.DataFrame) or (
+        _is_arrow(data) and hasattr(data, "column_names")
+    )
+
+
+def _adapt_arrow(data: Any) -> AdaptedArray:
+    """Convert a pyarrow Array or ChunkedArray, zero-copy when possible."""
+    if hasattr(data, "num_chunks"):
+        if data.num_chunks != 1:
+            return AdaptedArray(data.to_numpy(), True, "multi-chunk Arrow array")
+        data = data.chunk(0)
+
+    try:
+        return AdaptedArray(data.to_numpy(zero_copy_only=True), False, "arrow")
+    except Exception:
+        return AdaptedArray(
+            data.to_numpy(zero_copy_only=False), True, "Arrow nulls or layout"
+        )
+
+
+def _adapt_pandas(data: Union[pd.Series, pd.Index]) -> AdaptedArray:
+    """Convert a pandas Series/Index, unwrapping nullable dtypes."""
+    if isinstance(data.dtype, pd.ArrowDtype):
+        return _adapt_arrow(data.array.__arrow_array__())
+
+    if isinstance(data.dtype, pd.CategoricalDtype):
+        return AdaptedArray(np.asarray(data), True, "pandas categorical")
+
+    array = data.array
+    source = getattr(array, "_data", getattr(array, "_ndarray", None))
+
+    if isinstance(data.dtype, pd.api.extensions.ExtensionDtype) and data.hasnans:
+        values = data.to_numpy(dtype=np.float64, na_value=np.nan)
+    elif isinstance(source, np.ndarray):
+        values = data.to_numpy(dtype=source.dtype)
+    else:
+        values = data.to_numpy()
+
+    copied = not (isinstance(source, np.ndarray)
+                  and np.shares_memory(values, source))
+
+    return AdaptedArray(values, copied, f"pandas {data.dtype}")
+
+
+def adapt_array(data: Any) -> AdaptedArray:
+    """
+    Convert array-like input to NumPy, avoiding copies where possible.
+
+    Args:
+        data: ndarray/memmap, pandas Series/Index, pyarrow array,
+            buffer-protocol object or any array-like
+
+    Returns:
+        AdaptedArray with the values and whether a copy was made
+    """
+    if isinstance(data, np.ndarray):
+        return AdaptedArray(np.asarray(data), False, "ndarray")
+
+    if isinstance(data, (pd.Series, pd.Index)):
+        return _adapt_pandas(data)
+
+    if _is_arrow(data):
+        return _adapt_arrow(data)
+
+    try:
+        view = memoryview(data)
+    except TypeError:
+        return AdaptedArray(np.asarray(data), True, type(data).__name__)
+
+    return AdaptedArray(np.asarray(view), False, "buffer")
+
+
+def _apply_policy(arr: np.ndarray, config: InputConfig) -> np.ndarray:
+    """Apply the float dtype and NaN policy to a numeric array."""
+    if config.float_dtype is not None:
+        arr = arr.astype(config.float_dtype, copy=False)
+
+    if config.nan_policy == "propagate" or not np.issubdtype(arr.dtype, np.floating):
+        return arr
+
+    missing = np.isnan(arr)
+    if not missing.any():
+        return arr
+
+    if config.nan_policy == "raise":
+        raise ValueError("Input contains NaN values")
+
+    if arr.ndim > 1:
+        return arr[~_missing_rows(arr)]
+
+    return arr[~missing]
+
+
+def validate_array(
+    data: Union[np.ndarray, list],
+    config: Optional[InputConfig] = None
+) -> np.ndarray:
     """
     Validate and convert input to numpy array.
 
     Args:
-        data: Input data (array-like)
+        data: Input data (array-like, memmap, buffer, Arrow or pandas)
+        config: Input policy (defaults to the process-wide policy)
 
     Returns:
         Validated numpy array
@@ -22,7 +178,13 @@ def validate_array(data: Union[np.ndarray, list]) -> np.ndarray:
     Raises:
         ValueError: If data is empty or invalid
     """
-    arr = np.asarray(data)
+    config = config or get_input_policy()
+    adapted = adapt_array(data)
+    arr = adapted.values
+
+    if config.warn_on_copy and adapted.copied:
+        warnings.warn(f"Input copied ({adapted.reason})", InputCopyWarning,
+                      stacklevel=2)
 
     if arr.size == 0:
         raise ValueError("Input array cannot be empty")
@@ -30,15 +192,69 @@ def validate_array(data: Union[np.ndarray, list]) -> np.ndarray:
     if not np.issubdtype(arr.dtype, np.number):
         raise ValueError("Array must contain numeric values")
 
-    return arr
+    return _apply_policy(arr, config)
+
+
+def validate_paired(
+    x: Any,
+    y: Any,
+    config: Optional[InputConfig] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Validate two arrays whose rows are paired observations.
+
+    The NaN policy is applied to the pair jointly: under "omit" a row is
+    dropped from both arrays when either has a NaN in it, so the pairs
+    stay aligned.
+
+    Args:
+        x: First input, shape (n,) or (n, k)
+        y: Second input, shape (n,) or (n, m)
+        config: Input policy (defaults to the process-wide policy)
+
+    Returns:
+        Tuple of validated (x, y)
+
+    Raises:
+        ValueError: If either input is invalid, or on NaN under "raise"
+    """
+    config = config or get_input_policy()
+    unmasked = replace(config, nan_policy="propagate")
+    x_arr = validate_array(x, unmasked)
+    y_arr = validate_array(y, unmasked)
+
+    if config.nan_policy == "propagate":
+        return x_arr, y_arr
+
+    if len(x_arr) != len(y_arr):
+        raise ValueError("x and y must have the same number of rows")
+
+    missing = _missing_rows(x_arr) | _missing_rows(y_arr)
+    if not missing.any():
+        return x_arr, y_arr
+
+    if config.nan_policy == "raise":
+        raise ValueError("Input contains NaN values")
+
+    return x_arr[~missing], y_arr[~missing]
+
+
+def _missing_rows(arr: np.ndarray) -> np.ndarray:
+    """Mask of rows holding any NaN."""
+    if not np.issubdtype(arr.dtype, np.floating):
+        return np.zeros(len(arr), dtype=bool)
+
+    return np.isnan(arr.reshape(len(arr), -1)).any(axis=1)
 
 
 def validate_dataframe(data: pd.DataFrame) -> pd.DataFrame:
     """
     Validate pandas DataFrame.
 
+    Arrow tables are wrapped as Arrow-backed DataFrames without copying.
+
     Args:
-        data: Input DataFrame
+        data: Input DataFrame or pyarrow Table
 
     Returns:
         Validated DataFrame
@@ -46,10 +262,16 @@ def validate_dataframe(data: pd.DataFrame) -> pd.DataFrame:
     Raises:
         ValueError: If DataFrame is empty or invalid
     """
+    if _is_arrow(data) and hasattr(data, "column_names"):
+        data = data.to_pandas(types_mapper=pd.ArrowDtype)
+
     if not isinstance(data, pd.DataFrame):
         raise ValueError("Input must be a pandas DataFrame")
 
     if data.empty:
         raise ValueError("DataFrame cannot be empty")
 
+    if get_input_policy().nan_policy == "raise" and data.isna().any().any():
+        raise ValueError("DataFrame contains missing values")
+
     return data
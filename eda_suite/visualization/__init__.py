@@ -4,26 +4,20 @@ Visualization utilities for EDA Suite.
 Provides plotting functions for exploratory data analysis.
 """
 
-from eda_suite.visualization.distributions import (
-    plot_histogram,
-    plot_qq,
-    plot_boxplot
-)
-from eda_suite.visualization.relationships import (
-    plot_scatter,
-    plot_correlation_heatmap
-)
-from eda_suite.visualization.timeseries import (
-    plot_timeseries,
-    plot_acf_pacf
-)
+from eda_suite._lazy import attach
 
-__all__ = [
-    "plot_histogram",
-    "plot_qq",
-    "plot_boxplot",
-    "plot_scatter",
-    "plot_correlation_heatmap",
-    "plot_timeseries",
-    "plot_acf_pacf"
-]
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "distributions": [
+        "plot_histogram",
+        "plot_qq",
+        "plot_boxplot"
+    ],
+    "relationships": [
+        "plot_scatter",
+        "plot_correlation_heatmap"
+    ],
+    "timeseries": [
+        "plot_timeseries",
+        "plot_acf_pacf"
+    ]
+})
@@ -10,6 +10,7 @@ from eda_suite.discriminant import LinearDiscriminantAnalysis
 from eda_suite.factorial import PrincipalComponentAnalysis
 from eda_suite.multivariate import kmeans_analysis, detect_multivariate_outliers
 from eda_suite.timeseries import adf_test, compute_acf
+from eda_suite.utils import OutlierConfig
 
 
 def example_discriminant_analysis():
@@ -89,7 +90,7 @@ def example_outlier_detection():
 
     X = np.vstack([normal_data, outliers])
 
-    result = detect_multivariate_outliers(X, threshold=3.0)
+    result = detect_multivariate_outliers(X, OutlierConfig(threshold=3.0))
 
     print(f"Outlier Detection Results:")
     print(f"  Number of outliers: {result['n_outliers']}")
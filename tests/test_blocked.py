@@ -0,0 +1,28 @@
+"""
+Tests for blocked (tiled) correlation.
+"""
+
+import numpy as np
+import pytest
+from eda_suite.bivariate import compute_correlation_blocks
+from eda_suite.utils import CorrelationConfig
+
+_X = np.random.default_rng(0).normal(size=(200, 30))
+
+
+def test_out_and_callback_receive_every_tile(tmp_path):
+    out = np.lib.format.open_memmap(tmp_path / "corr.npy", mode="w+",
+                                    dtype=np.float64, shape=(30, 30))
+    tiles = []
+    config = CorrelationConfig(block_size=7, out=out,
+                               callback=lambda rows, cols, tile: tiles.append(tile))
+
+    compute_correlation_blocks(_X, config)
+
+    np.testing.assert_allclose(np.load(tmp_path / "corr.npy"), np.corrcoef(_X.T))
+    assert len(tiles) == 5 * 6 // 2
+
+
+def test_out_shape_is_checked():
+    with pytest.raises(ValueError, match="out"):
+        compute_correlation_blocks(_X, CorrelationConfig(out=np.empty((3, 3))))
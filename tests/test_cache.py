@@ -0,0 +1,80 @@
+"""
+Tests for the content-addressed result cache.
+"""
+
+import functools
+import numpy as np
+import pytest
+from eda_suite.utils import CacheConfig, disable_cache, enable_cache, memoize
+from eda_suite.utils.cache import make_key
+
+
+@pytest.fixture
+def cache():
+    """Enable an in-memory cache for one test."""
+    enable_cache(CacheConfig())
+    yield
+    disable_cache()
+
+
+_SOURCE = {"values": np.arange(4.0)}
+
+
+def _read():
+    return _SOURCE["values"]
+
+
+@memoize
+def _total(source):
+    return float(np.sum(source() if callable(source) else source))
+
+
+def test_arrays_are_keyed_by_content(cache):
+    data = np.arange(4.0)
+    assert _total(data) == 6.0
+
+    data += 1
+    assert _total(data) == 10.0
+
+
+@pytest.mark.parametrize("wrap", [
+    lambda values: (lambda: values),
+    lambda values: functools.partial(np.copy, values)
+])
+def test_callable_arguments_are_not_cached(cache, wrap):
+    values = np.arange(4.0)
+    assert _total(wrap(values)) == 6.0
+
+    values += 100
+    assert _total(wrap(values)) == 406.0
+
+
+def test_module_functions_are_not_cached(cache):
+    assert _total(_read) == 6.0
+
+    _SOURCE["values"] = _SOURCE["values"] + 100
+    assert _total(_read) == 406.0
+
+
+def test_nested_callables_are_rejected():
+    with pytest.raises(TypeError):
+        make_key(_total, {"source": [np.sum]})
+
+    with pytest.raises(TypeError):
+        make_key(_total, {"source": {"reader": lambda: None}})
+
+
+def test_iterators_and_memmaps_are_not_cached(cache, tmp_path):
+    with pytest.raises(TypeError):
+        make_key(_total, {"source": iter([1.0, 2.0])})
+
+    path = tmp_path / "values.dat"
+    mapped = np.memmap(path, dtype=np.float64, mode="w+", shape=(4,))
+    mapped[:] = np.arange(4.0)
+    assert _total(mapped) == 6.0
+
+    mapped[:] += 100
+    assert _total(mapped) == 406.0
+
+    with pytest.raises(TypeError):
+        make_key(_total, {"source": mapped})
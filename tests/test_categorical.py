@@ -0,0 +1,32 @@
+"""
+Tests for categorical hypothesis tests.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+from eda_suite.bivariate import contingency_table
+from eda_suite.hypothesis_testing import chi_square_test
+
+
+def test_frame_with_counts_column_is_a_table():
+    observed = pd.DataFrame({"counts": [10, 20], "other": [30, 5]})
+
+    result = chi_square_test(observed)
+
+    assert result.statistic == pytest.approx(stats.chi2_contingency(observed)[0])
+    assert result.p_value < 0.05
+
+
+@pytest.mark.parametrize("as_sparse", [False, True])
+def test_contingency_tables_are_unwrapped(as_sparse):
+    rng = np.random.default_rng(0)
+    x = rng.integers(0, 4, 500)
+    y = (x + rng.integers(0, 2, 500)) % 3
+    table = contingency_table(x, y, as_sparse=as_sparse)
+
+    result = chi_square_test(table)
+
+    dense = pd.crosstab(x, y).to_numpy()
+    assert result.statistic == pytest.approx(stats.chi2_contingency(dense)[0])
@@ -0,0 +1,80 @@
+"""
+Tests for k-means clustering.
+"""
+
+import numpy as np
+import pytest
+from sklearn.datasets import make_blobs
+from eda_suite.multivariate import kmeans_analysis, kmeans_sweep
+from eda_suite.utils import (
+    CacheConfig,
+    MiniBatchConfig,
+    SweepConfig,
+    disable_cache,
+    enable_cache
+)
+
+_DATA = {"X": make_blobs(6000, n_features=3, centers=3, random_state=0)[0]}
+
+
+def _chunks():
+    X = _DATA["X"]
+    return (X[start:start + 1000] for start in range(0, len(X), 1000))
+
+
+@pytest.fixture
+def cache():
+    """Enable an in-memory cache for one test."""
+    enable_cache(CacheConfig())
+    yield
+    disable_cache()
+
+
+def test_streaming_matches_full_batch():
+    X = _DATA["X"]
+    full = kmeans_analysis(X, 3)
+    streamed = kmeans_analysis(X, 3, streaming=MiniBatchConfig(chunk_size=1000))
+
+    assert streamed.labels.shape == (len(X),)
+    assert streamed.inertia == pytest.approx(full.inertia, rel=1e-3)
+    assert streamed.inertia == pytest.approx(
+        ((X - streamed.centroids[streamed.labels]) ** 2).sum())
+
+
+def test_streaming_sources_bypass_cache(cache):
+    first = kmeans_analysis(_chunks, 3, streaming=MiniBatchConfig())
+
+    original = _DATA["X"]
+    _DATA["X"] = original * 2
+    try:
+        second = kmeans_analysis(_chunks, 3, streaming=MiniBatchConfig())
+    finally:
+        _DATA["X"] = original
+
+    assert second.inertia == pytest.approx(4 * first.inertia, rel=1e-2)
+
+
+def test_short_first_chunk_is_buffered():
+    X = _DATA["X"]
+    config = MiniBatchConfig(batch_size=256)
+
+    result = kmeans_analysis(iter([X[:2], X[2:5000], X[5000:]]), 5, streaming=config)
+
+    assert result.labels.shape == (len(X),)
+    assert result.centroids.shape == (5, 3)
+
+
+def test_fewer_rows_than_clusters_are_rejected():
+    with pytest.raises(ValueError, match="n_clusters"):
+        kmeans_analysis(iter([_DATA["X"][:3]]), 5, streaming=MiniBatchConfig())
+
+
+def test_sweep_takes_k_values_from_config():
+    X = np.random.default_rng(0).normal(size=(200, 2))
+
+    result = kmeans_sweep(X, SweepConfig(k_values=[4, 2, 3]))
+
+    np.testing.assert_array_equal(result.k_values, [2, 3, 4])
+    assert len(result.centroids[-1]) == 4
+    with pytest.raises(ValueError, match="k_values"):
+        SweepConfig(k_values=[1, 2])
@@ -0,0 +1,51 @@
+"""
+Tests for factorized contingency tables and the association matrix.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+from eda_suite.bivariate import contingency
+from eda_suite.utils import AssociationConfig
+
+
+@pytest.mark.parametrize("n_jobs", [None, 3])
+def test_association_matrix_matches_scipy(monkeypatch, n_jobs):
+    monkeypatch.setattr(contingency, "BLOCK_ELEMENTS", 400)
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame({
+        name: rng.choice(list("abcdef"[:k]), 200).astype(object)
+        for name, k in [("two", 2), ("also_two", 2), ("three", 3), ("six", 6)]
+    })
+    frame.loc[rng.random(200) < 0.1, "three"] = None
+
+    result = contingency.compute_association_matrix(
+        frame, AssociationConfig(n_jobs=n_jobs))
+
+    for i, x in enumerate(frame.columns):
+        for j, y in enumerate(frame.columns[i + 1:], start=i + 1):
+            table = pd.crosstab(frame[x], frame[y]).to_numpy()
+            chi2, p_value = stats.chi2_contingency(table)[:2]
+            v = stats.contingency.association(table, correction=False)
+
+            assert result.p_values[i, j] == pytest.approx(p_value)
+            assert result.p_values[j, i] == pytest.approx(p_value)
+            assert result.cramers_v[i, j] == pytest.approx(v)
+            assert result.n_obs[i, j] == table.sum()
+
+
+@pytest.mark.parametrize("as_sparse", [False, True])
+def test_streaming_table_matches_crosstab(as_sparse):
+    rng = np.random.default_rng(0)
+    x = rng.choice(list("abcd"), 1000)
+    y = rng.choice(list("xyz"), 1000)
+    accumulator = contingency.StreamingContingency()
+    for start in range(0, 1000, 300):
+        accumulator.update(x[start:start + 300], y[start:start + 300])
+
+    table = accumulator.table(as_sparse=as_sparse)
+
+    assert table.is_sparse == as_sparse
+    pd.testing.assert_frame_equal(table.to_frame(), pd.crosstab(x, y),
+                                  check_names=False)
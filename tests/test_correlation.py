@@ -0,0 +1,33 @@
+"""
+Tests for the batched and pairwise correlation matrices.
+"""
+
+import numpy as np
+import pytest
+from scipy import stats
+from eda_suite.statistical_tests import correlation
+
+
+@pytest.mark.parametrize("n_jobs", [None, 2])
+def test_kendall_matrix_blocks_columns(monkeypatch, n_jobs):
+    rng = np.random.default_rng(0)
+    data = rng.normal(size=(40, 7)).round(1)
+    blocks = []
+    column_blocks = correlation._column_blocks
+
+    def small_blocks(shape):
+        for cols in column_blocks(shape, max_elements=80):
+            blocks.append(cols)
+            yield cols
+
+    monkeypatch.setattr(correlation, "_column_blocks", small_blocks)
+
+    result = correlation.kendall_matrix(data, n_jobs=n_jobs)
+
+    assert max(cols.stop - cols.start for cols in blocks) == 2
+    for i in range(7):
+        for j in range(i + 1, 7):
+            tau, p_value = stats.kendalltau(data[:, i], data[:, j],
+                                            method="asymptotic")
+            assert result.correlation[i, j] == pytest.approx(tau)
+            assert result.p_values[j, i] == pytest.approx(p_value)
@@ -0,0 +1,28 @@
+"""
+Tests for the fused descriptive statistics kernel.
+"""
+
+import numpy as np
+import pytest
+from eda_suite.univariate import describe_array
+from eda_suite.utils import InputConfig, set_input_policy
+
+
+def test_nan_propagates_to_every_statistic():
+    summary, moments, quantiles = describe_array([1.0, 2.0, 3.0, np.nan, 5.0])
+
+    assert np.isnan(list(vars(summary).values())).all()
+    assert np.isnan(list(vars(moments).values())).all()
+    assert np.isnan(list(quantiles.values())).all()
+
+
+def test_nan_is_omitted_under_omit_policy():
+    set_input_policy(InputConfig(nan_policy="omit"))
+    try:
+        summary, _, quantiles = describe_array([1.0, 2.0, 3.0, np.nan, 5.0])
+    finally:
+        set_input_policy(InputConfig())
+
+    assert summary.median == pytest.approx(2.5)
+    assert summary.max == 5.0
+    assert quantiles["q50"] == pytest.approx(np.percentile([1, 2, 3, 5], 50))
@@ -0,0 +1,103 @@
+"""
+Tests for distribution fitting.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pytest
+from scipy import stats
+from eda_suite import univariate
+from eda_suite.utils import FitConfig
+
+_SAMPLE = stats.lognorm.rvs(1.0, loc=-0.03, size=2000, random_state=0)
+
+
+def test_lognorm_keeps_three_parameter_fit():
+    fit = univariate.fit_distribution(_SAMPLE, "lognorm")
+
+    np.testing.assert_allclose(fit.parameters, stats.lognorm.fit(_SAMPLE), rtol=1e-6)
+
+
+def test_lognorm_with_fixed_loc_uses_closed_form():
+    positive = _SAMPLE[_SAMPLE > 0]
+    config = FitConfig(distributions=["lognorm"], fixed_loc={"lognorm": 0})
+    fit = univariate.fit_distribution(positive, config)
+
+    np.testing.assert_allclose(fit.parameters, stats.lognorm.fit(positive, floc=0),
+                               rtol=1e-9)
+
+
+def test_fixed_loc_in_batch_fits():
+    positive = _SAMPLE[_SAMPLE > 0]
+    config = FitConfig(distributions=["norm", "lognorm"], fixed_loc={"lognorm": 0})
+
+    fits = univariate.test_distribution_fit(positive, config)
+
+    assert fits["lognorm"].parameters[1] == 0
+    assert fits["norm"].parameters == pytest.approx(stats.norm.fit(positive))
+
+
+def test_single_fit_needs_one_distribution():
+    with pytest.raises(ValueError, match="exactly one"):
+        univariate.fit_distribution(_SAMPLE, FitConfig(distributions=["norm", "expon"]))
+
+
+def test_pool_fits_match_serial_fits():
+    frame = np.column_stack([_SAMPLE, np.abs(_SAMPLE)])
+    config = FitConfig(distributions=["norm", "lognorm"], fixed_loc={"lognorm": 0})
+
+    serial = univariate.test_distribution_fit_frame(frame, config)
+    pooled = univariate.test_distribution_fit_frame(
+        frame, FitConfig(distributions=["norm", "lognorm"], n_jobs=2,
+                         fixed_loc={"lognorm": 0})
+    )
+
+    for column in serial:
+        for name, fit in serial[column].items():
+            assert pooled[column][name].parameters == fit.parameters
+
+
+def test_fixed_loc_must_name_a_fitted_distribution():
+    with pytest.raises(ValueError):
+        FitConfig(distributions=["norm"], fixed_loc={"lognorm": 0})
+
+
+def test_deadline_skips_remaining_fits():
+    config = FitConfig(distributions=["norm", "gamma", "weibull_min"], deadline=1e-9)
+
+    with pytest.warns(UserWarning, match="deadline"):
+        fits = univariate.test_distribution_fit(_SAMPLE, config)
+
+    assert len(fits) < 3
+
+
+def test_timeout_warns_off_the_main_thread():
+    config = FitConfig(distributions=["norm"], timeout=5)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        with pytest.warns(UserWarning, match="cannot be enforced"):
+            fits = executor.submit(univariate.test_distribution_fit,
+                                   _SAMPLE, config).result()
+
+    assert "norm" in fits
+
+
+def test_timeout_leaves_caller_timer_running():
+    signal = pytest.importorskip("signal")
+    if not hasattr(signal, "SIGALRM"):
+        pytest.skip("SIGALRM is POSIX only")
+
+    def handler(signum, frame):
+        pass
+
+    previous = signal.signal(signal.SIGALRM, handler)
+    signal.setitimer(signal.ITIMER_REAL, 60)
+    try:
+        with pytest.warns(UserWarning, match="cannot be enforced"):
+            univariate.test_distribution_fit(_SAMPLE, FitConfig(distributions=["norm"],
+                                                                timeout=5))
+        assert signal.getitimer(signal.ITIMER_REAL)[0] > 0
+        assert signal.getsignal(signal.SIGALRM) is handler
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
@@ -0,0 +1,36 @@
+"""
+Tests for Mahalanobis-distance outlier detection.
+"""
+
+import numpy as np
+import pytest
+from eda_suite.multivariate import detect_multivariate_outliers, mahalanobis_distance
+from eda_suite.utils import OutlierConfig
+
+_RNG = np.random.default_rng(0)
+_X = np.vstack([_RNG.normal(size=(300, 3)), _RNG.normal(5, 0.3, size=(80, 3))])
+
+
+def test_blocks_do_not_change_distances():
+    np.testing.assert_allclose(
+        mahalanobis_distance(_X, OutlierConfig(block_size=7)),
+        mahalanobis_distance(_X)
+    )
+
+
+def test_robust_estimates_expose_masked_outliers():
+    classical = detect_multivariate_outliers(_X)
+    robust = detect_multivariate_outliers(_X, OutlierConfig(robust=True))
+
+    assert classical["n_outliers"] < 80
+    assert set(range(300, 380)) <= set(robust["outlier_indices"])
+
+
+def test_threshold_comes_from_config():
+    result = detect_multivariate_outliers(_X, OutlierConfig(threshold=100.0))
+
+    assert result["threshold"] == 100.0
+    assert result["n_outliers"] == 0
+
+    with pytest.raises(ValueError, match="threshold"):
+        OutlierConfig(threshold=0)
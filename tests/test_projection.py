@@ -0,0 +1,29 @@
+"""
+Tests for projection-pursuit outlier detection.
+"""
+
+import numpy as np
+import pytest
+from eda_suite.multivariate import detect_projection_outliers
+from eda_suite.utils import ProjectionConfig
+
+_RNG = np.random.default_rng(0)
+_X = np.vstack([_RNG.normal(size=(500, 4)), _RNG.normal(4, 0.3, size=(20, 4))])
+
+
+@pytest.mark.parametrize("directions", ["random", "spherical", "data"])
+def test_outlier_cluster_is_found(directions):
+    result = detect_projection_outliers(_X, ProjectionConfig(directions=directions))
+
+    assert set(range(500, 520)) <= set(result["outlier_indices"])
+    assert result["n_outliers"] < 40
+
+
+def test_rows_with_nan_are_ignored():
+    data = _X.copy()
+    data[3, 1] = np.nan
+
+    result = detect_projection_outliers(data)
+
+    assert np.isnan(result["projection"][3])
+    assert 3 not in result["outlier_indices"]
@@ -0,0 +1,88 @@
+"""
+Tests for ResultTable conversions of every result dataclass.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from dataclasses import fields
+from eda_suite import (
+    bivariate,
+    hypothesis_testing,
+    missing_data,
+    statistical_tests,
+    timeseries
+)
+from eda_suite.utils import ApproxConfig, ResultTable
+
+_RNG = np.random.default_rng(0)
+_A = _RNG.normal(size=60)
+_B = _A + _RNG.normal(size=60)
+_X = np.column_stack([_B, _RNG.normal(size=60)])
+_FRAME = pd.DataFrame({"a": _A, "b": np.where(_A > 1, np.nan, _B)})
+
+SCALAR_RESULTS = {
+    "ANOVAResult": lambda: hypothesis_testing.one_way_anova([_A, _B]),
+    "CategoricalTestResult": lambda: hypothesis_testing.chi_square_test(
+        np.array([[10, 20], [30, 5]])),
+    "NonparametricResult": lambda: hypothesis_testing.mann_whitney_test(_A, _B),
+    "TTestResult": lambda: hypothesis_testing.two_sample_ttest(_A, _B),
+    "MCARTestResult": lambda: missing_data.test_mcar(_FRAME),
+    "TestResult": lambda: statistical_tests.shapiro_test(_A),
+    "VarianceTestResult": lambda: statistical_tests.levene_test([_A, _B]),
+    "StationarityResult": lambda: timeseries.adf_test(pd.Series(_A)),
+    "CorrelationResult": lambda: statistical_tests.pearson_test(_A, _B),
+    "RegressionResult": lambda: bivariate.simple_linear_regression(_A, _B)
+}
+
+BATCHED_RESULTS = {
+    "CorrelationResult": lambda: statistical_tests.pearson_test(_A, _X),
+    "SpearmanResult": lambda: statistical_tests.spearman_test(_A, _X),
+    "KendallResult": lambda: statistical_tests.kendall_test(_A, _X),
+    "RegressionResult": lambda: bivariate.simple_linear_regression(_A, _X)
+}
+
+
+def _check_conversions(table: ResultTable, n_rows: int) -> None:
+    names = [f.name for f in fields(table.record_type)]
+
+    frame = table.to_pandas()
+    assert list(frame.columns) == names
+    assert len(frame) == n_rows
+
+    arrow = table.to_arrow()
+    assert arrow.column_names == names
+    assert arrow.num_rows == n_rows
+
+    assert len(list(table)) == n_rows
+
+
+@pytest.mark.parametrize("name", sorted(SCALAR_RESULTS))
+def test_records_convert(name):
+    result = SCALAR_RESULTS[name]()
+    _check_conversions(ResultTable.from_records([result, result]), 2)
+
+
+@pytest.mark.parametrize("name", sorted(SCALAR_RESULTS))
+def test_scalar_results_convert(name):
+    _check_conversions(ResultTable.from_result(SCALAR_RESULTS[name]()), 0)
+
+
+@pytest.mark.parametrize("name", sorted(BATCHED_RESULTS))
+def test_batched_results_convert(name):
+    result = BATCHED_RESULTS[name]()
+    table = ResultTable.from_result(result)
+
+    _check_conversions(table, _X.shape[1])
+    assert table.to_pandas()["ci_low"].isna().all()
+
+
+def test_approximate_results_keep_bounds():
+    config = ApproxConfig(sample_size=40, seed=0)
+    result = statistical_tests.approximate_pearson_test((_A, _X), config)
+
+    frame = ResultTable.from_result(result).to_pandas()
+
+    assert frame["ci_low"].notna().all()
+    assert (frame["ci_low"] <= frame["coefficient"]).all()
+    assert (frame["coefficient"] <= frame["ci_high"]).all()
@@ -0,0 +1,39 @@
+"""
+Tests for the FastMCD robust estimator.
+"""
+
+import numpy as np
+import pytest
+from sklearn.covariance import MinCovDet
+from eda_suite.multivariate.robust import fast_mcd
+from eda_suite.utils import RobustConfig
+
+_RNG = np.random.default_rng(0)
+_X = np.vstack([_RNG.normal(size=(400, 3)), _RNG.normal(6, 0.5, size=(80, 3))])
+
+
+@pytest.mark.parametrize("max_subset", [1500, 200])
+def test_workers_do_not_change_the_estimate(max_subset):
+    serial = fast_mcd(_X, RobustConfig(n_starts=100, max_subset=max_subset))
+    pooled = fast_mcd(_X, RobustConfig(n_starts=100, max_subset=max_subset,
+                                       n_jobs=2))
+
+    np.testing.assert_allclose(pooled.location, serial.location)
+    np.testing.assert_array_equal(pooled.support, serial.support)
+
+
+def _mcd_objective(location, scatter):
+    """Log-determinant of the h observations closest to a fit."""
+    centered = _X - location
+    distances = np.einsum("ij,jk,ik->i", centered, np.linalg.inv(scatter), centered)
+    closest = _X[np.argsort(distances)[:(len(_X) + _X.shape[1] + 1) // 2]]
+    return np.linalg.slogdet(np.cov(closest.T, bias=True))[1]
+
+
+def test_objective_is_as_low_as_scikit_learn():
+    result = fast_mcd(_X)
+    reference = MinCovDet(random_state=0).fit(_X)
+
+    assert (_mcd_objective(result.raw_location, result.raw_covariance)
+            <= _mcd_objective(reference.raw_location_, reference.raw_covariance_) + 1e-6)
+    assert not result.support[400:].any()
@@ -0,0 +1,70 @@
+"""
+Tests for the reservoir sampler.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from eda_suite.bivariate import compute_correlation_matrix
+from eda_suite.utils import ApproxConfig, CorrelationConfig, ReservoirSampler
+from eda_suite.utils.sampling import draw_paired_sample, draw_sample
+
+
+def test_stratified_memory_is_bounded_per_stratum():
+    sampler = ReservoirSampler(5, seed=0)
+    labels = np.repeat(["a", "b", "c"], [100, 30, 10])
+
+    sampler.update(np.arange(140.0), labels)
+
+    assert len(sampler._rows) == 5 * 3
+
+
+def test_too_many_strata_are_rejected():
+    sampler = ReservoirSampler(5, seed=0, max_strata=3)
+    sampler.update(np.arange(3.0), ["a", "b", "c"])
+
+    with pytest.raises(ValueError, match="max_strata"):
+        sampler.update(np.arange(2.0), ["c", "d"])
+    assert list(sampler.stratum_counts.index) == ["a", "b", "c"]
+
+    other = ReservoirSampler(5, seed=1).update(np.arange(1.0), ["e"])
+    with pytest.raises(ValueError, match="max_strata"):
+        sampler.merge(other)
+
+
+def test_config_limits_strata():
+    values = np.arange(50.0)
+    chunks = [(values, values % 20)]
+
+    with pytest.raises(ValueError, match="max_strata"):
+        draw_sample(chunks, ApproxConfig(sample_size=10, max_strata=10))
+
+    unbounded = ApproxConfig(sample_size=10, max_strata=None)
+    assert len(draw_sample(chunks, unbounded)) == 20
+
+
+def test_paired_sample_takes_strata_alongside_the_data():
+    x = np.arange(100.0)
+    strata = np.where(x < 90, "common", "rare")
+    config = ApproxConfig(sample_size=10, chunk_size=7, seed=0)
+
+    x_sample, y_sample = draw_paired_sample((x, 2 * x, strata), config)
+
+    assert (x_sample >= 90).sum() == 1
+    np.testing.assert_array_equal(y_sample, 2 * x_sample)
+
+    with pytest.raises(ValueError, match="one label per row"):
+        draw_paired_sample((x, x, strata[:-1]), config)
+
+
+def test_correlation_matrix_strata_column():
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame(rng.normal(size=(200, 2)), columns=["a", "b"])
+    frame["group"] = np.where(np.arange(200) < 150, "x", "y")
+    approx = ApproxConfig(sample_size=20, strata_column="group", seed=0)
+
+    result = compute_correlation_matrix(frame, CorrelationConfig(approx=approx))
+
+    assert result.variables == ["a", "b"]
+    assert result.n_obs[0, 1] == 20
+    assert (result.ci_low <= result.correlation).all()
@@ -0,0 +1,36 @@
+"""
+Tests for the streaming quantile sketch.
+"""
+
+import time
+import numpy as np
+import pandas as pd
+import pytest
+from eda_suite.univariate import build_quantile_sketch
+
+_VALUES = np.random.default_rng(0).normal(size=200_000)
+
+
+@pytest.mark.parametrize("wrap", [
+    lambda values: values,
+    pd.Series,
+    list,
+    lambda values: np.array_split(values, 7),
+    lambda values: iter(np.array_split(values, 7))
+])
+def test_inputs_summarize_all_values(wrap):
+    sketch = build_quantile_sketch(wrap(_VALUES))
+
+    assert sketch.count == _VALUES.size
+    assert sketch.quantiles([0.5])[0] == pytest.approx(np.median(_VALUES), abs=0.05)
+
+
+def test_array_likes_are_read_in_blocks():
+    start = time.perf_counter()
+    build_quantile_sketch(pd.Series(_VALUES))
+
+    assert time.perf_counter() - start < 1.0
+
+
+def test_empty_input_gives_empty_sketch():
+    assert build_quantile_sketch([]).count == 0
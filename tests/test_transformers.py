@@ -0,0 +1,33 @@
+"""
+Tests for standardization and normalization.
+"""
+
+import numpy as np
+import pytest
+from eda_suite.utils import ScalingConfig, normalize, standardize
+
+_X = np.random.default_rng(0).normal(size=(50, 3)).astype(np.float32)
+
+
+def test_standardize_in_place_through_config():
+    data = _X.copy()
+
+    result = standardize(data, ScalingConfig(chunk_size=7, out=data))
+
+    assert result is data
+    np.testing.assert_allclose(data.mean(axis=0), 0, atol=1e-5)
+    np.testing.assert_allclose(data.std(axis=0, ddof=1), 1, rtol=1e-4)
+
+
+def test_normalize_writes_into_out():
+    out = np.empty(_X.shape)
+
+    normalize(_X, ScalingConfig(out=out))
+
+    np.testing.assert_allclose(out.min(axis=0), 0)
+    np.testing.assert_allclose(out.max(axis=0), 1)
+
+
+def test_out_must_match_the_input():
+    with pytest.raises(ValueError, match="out"):
+        standardize(_X, ScalingConfig(out=np.empty(3)))
@@ -0,0 +1,88 @@
+"""
+Tests for input adaptation and the NaN policy.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+from eda_suite import hypothesis_testing
+from eda_suite.statistical_tests import kendall_test, pearson_test, spearman_test
+from eda_suite.univariate import compute_statistics
+from eda_suite.utils import InputConfig, set_input_policy, validate_array
+
+
+@pytest.fixture
+def omit_policy():
+    """Switch the process-wide NaN policy to "omit" for one test."""
+    set_input_policy(InputConfig(nan_policy="omit"))
+    yield
+    set_input_policy(InputConfig())
+
+
+def test_categorical_keeps_category_values():
+    series = pd.Series([1.5, 2.5, 2.5], dtype="category")
+    assert compute_statistics(series).mean == pytest.approx(13 / 6)
+
+    large = pd.Series([1000, 2000, 2000], dtype="category")
+    np.testing.assert_array_equal(validate_array(large), [1000, 2000, 2000])
+
+
+def test_categorical_strings_are_rejected():
+    with pytest.raises(ValueError, match="numeric"):
+        validate_array(pd.Series(["a", "b"], dtype="category"))
+
+
+def test_omit_drops_whole_rows(omit_policy):
+    matrix = np.arange(15.0).reshape(5, 3)
+    matrix[1, 1] = np.nan
+
+    result = validate_array(matrix)
+
+    assert result.shape == (4, 3)
+    np.testing.assert_array_equal(result, np.delete(matrix, 1, axis=0))
+
+
+@pytest.mark.parametrize("test, reference", [
+    (pearson_test, stats.pearsonr),
+    (spearman_test, stats.spearmanr),
+    (kendall_test, stats.kendalltau)
+])
+def test_omit_keeps_pairs_aligned(omit_policy, test, reference):
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=30)
+    y = x + rng.normal(size=30)
+    x[2], y[5] = np.nan, np.nan
+    complete = ~np.isnan(x) & ~np.isnan(y)
+
+    result = test(x, y)
+
+    assert result.coefficient == pytest.approx(reference(x[complete], y[complete])[0])
+
+
+@pytest.mark.parametrize("test, reference", [
+    (hypothesis_testing.paired_ttest, stats.ttest_rel),
+    (hypothesis_testing.wilcoxon_test, stats.wilcoxon)
+])
+def test_omit_keeps_paired_samples_aligned(omit_policy, test, reference):
+    rng = np.random.default_rng(0)
+    before = rng.normal(size=30)
+    after = before + rng.normal(0.5, 1, size=30)
+    before[2], after[5] = np.nan, np.nan
+    complete = ~np.isnan(before) & ~np.isnan(after)
+
+    result = test(before, after)
+
+    expected = reference(before[complete], after[complete])
+    assert result.statistic == pytest.approx(expected[0])
+    assert result.p_value == pytest.approx(expected[1])
+
+
+def test_omit_paired_samples_with_uneven_nans(omit_policy):
+    before = np.array([1.0, 2.0, np.nan, 4.0, 5.0, 7.0])
+    after = np.array([2.0, np.nan, 3.0, 5.0, 6.5, 7.5])
+
+    result = hypothesis_testing.paired_ttest(before, after)
+
+    assert np.isfinite(result.statistic)
+    assert result.degrees_freedom == 3